@@ -0,0 +1 @@
+"""Timing benchmarks for the pyssp_sysml2 generators (``python -m benchmarks``)."""
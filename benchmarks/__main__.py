@@ -0,0 +1,109 @@
+"""Run the generator benchmarks or compare two result files.
+
+    python -m benchmarks run --output build/bench.json
+    python -m benchmarks compare baseline.json build/bench.json --threshold 1.25
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.suite import (
+    CASES,
+    DEFAULT_CONNECTIONS,
+    DEFAULT_INSTANCES,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    format_result,
+    run_suite,
+)
+
+
+def _sizes(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Time the generators and write JSON results")
+    run_parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write results to this JSON file (default: stdout).",
+    )
+    run_parser.add_argument(
+        "--instances",
+        type=_sizes,
+        default=list(DEFAULT_INSTANCES),
+        help="Comma-separated part-instance counts for architecture-based cases.",
+    )
+    run_parser.add_argument(
+        "--connections",
+        type=_sizes,
+        default=list(DEFAULT_CONNECTIONS),
+        help="Comma-separated connection counts for SSD-based cases.",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case."
+    )
+    run_parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(CASES),
+        default=None,
+        help="Only run this case (repeatable).",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare results against a baseline and fail on regressions"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fail when a median time exceeds the baseline by this factor.",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run_suite(
+            instances=args.instances,
+            connections=args.connections,
+            repeat=args.repeat,
+            case_names=args.case,
+            on_result=lambda result: print(format_result(result), file=sys.stderr, flush=True),
+        )
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+            print(f"Wrote {args.output}")
+        else:
+            json.dump(document, sys.stdout, indent=2)
+            print()
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    comparisons = compare_results(baseline, current)
+    for line in format_comparison(comparisons, args.threshold):
+        print(line)
+    return 1 if any(item.ratio > args.threshold for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,33 @@
+"""Scalable SysML architectures and SSDs used as benchmark inputs."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from pyssp_sysml2.synth import ArchitectureSpec, SsdSpec
+from pyssp_sysml2.synth import write_architecture as write_synthetic_architecture
+from pyssp_sysml2.synth import write_ssd as write_synthetic_ssd
+
+COMPOSITION_NAME = "BenchComposition"
+# One part definition per this many instances, so larger architectures also
+# have more definitions (and modelDescription.xml files) to generate.
+INSTANCES_PER_DEF = 10
+SEED = 0
+
+
+def write_architecture(root: Path, instances: int) -> Path:
+    """Write a synthetic architecture with about ``instances`` parts."""
+    definitions = max(1, instances // INSTANCES_PER_DEF)
+    spec = ArchitectureSpec(
+        part_defs=definitions,
+        instances_per_def=max(1, instances // definitions),
+        composition=COMPOSITION_NAME,
+        seed=SEED,
+    )
+    return write_synthetic_architecture(root, spec)
+
+
+def write_ssd(path: Path, connections: int) -> Path:
+    """Write a synthetic SSD with ``connections`` rounded up to whole components."""
+    per_component = SsdSpec().connections_per_component
+    spec = SsdSpec(components=max(2, -(-connections // per_component)), seed=SEED)
+    return write_synthetic_ssd(path, spec)
@@ -0,0 +1,199 @@
+"""Benchmark cases, the timing loop and baseline comparison."""
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from benchmarks.fixtures import COMPOSITION_NAME, write_architecture, write_ssd
+
+DEFAULT_INSTANCES = (10, 100, 1_000, 10_000)
+DEFAULT_CONNECTIONS = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 1.25
+
+Runner = Callable[[], object]
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    scale: str
+    setup: Callable[[Path, int], Runner]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    scale: str
+    size: int
+    times: list[float] = field(default_factory=list)
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.name, self.size
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_json(self) -> dict:
+        data = asdict(self)
+        data.update(min=min(self.times), median=self.median, mean=statistics.fmean(self.times))
+        return data
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def _architecture(workdir: Path, size: int) -> Path:
+    root = workdir / f"arch-{size}"
+    if not root.exists():
+        write_architecture(root, size)
+    return root
+
+
+def _setup_generate_ssd(workdir: Path, size: int) -> Runner:
+    from pyssp_sysml2.ssd import generate_ssd
+
+    architecture = _architecture(workdir, size)
+    return lambda: generate_ssd(architecture, workdir / "SystemStructure.ssd", COMPOSITION_NAME)
+
+
+def _setup_generate_parameter_set(workdir: Path, size: int) -> Runner:
+    from pyssp_sysml2.ssv import generate_parameter_set
+
+    architecture = _architecture(workdir, size)
+    return lambda: generate_parameter_set(
+        architecture, workdir / "parameters.ssv", COMPOSITION_NAME
+    )
+
+
+def _setup_generate_model_descriptions(workdir: Path, size: int) -> Runner:
+    from pyssp_sysml2.fmi import generate_model_descriptions
+
+    architecture = _architecture(workdir, size)
+    return lambda: generate_model_descriptions(
+        architecture, workdir / "model_descriptions", COMPOSITION_NAME
+    )
+
+
+def _setup_generate_sysml_from_ssd(workdir: Path, size: int) -> Runner:
+    from pyssp_sysml2.sysml import generate_sysml_from_ssd
+
+    ssd_path = write_ssd(workdir / f"bench-{size}.ssd", size)
+    return lambda: generate_sysml_from_ssd(ssd_path, workdir / "architecture.sysml")
+
+
+def _setup_sync_sysml_from_ssd(workdir: Path, size: int) -> Runner:
+    from pyssp_sysml2.ssd import generate_ssd
+    from pyssp_sysml2.sync import sync_sysml_from_ssd
+
+    architecture = _architecture(workdir, size)
+    ssd_path = generate_ssd(architecture, workdir / f"sync-{size}.ssd", COMPOSITION_NAME)
+    return lambda: sync_sysml_from_ssd(
+        architecture, ssd_path, COMPOSITION_NAME, output_architecture_dir=workdir / "synced"
+    )
+
+
+CASES = {
+    case.name: case
+    for case in (
+        BenchmarkCase("generate_ssd", "instances", _setup_generate_ssd),
+        BenchmarkCase("generate_parameter_set", "instances", _setup_generate_parameter_set),
+        BenchmarkCase(
+            "generate_model_descriptions", "instances", _setup_generate_model_descriptions
+        ),
+        BenchmarkCase("generate_sysml_from_ssd", "connections", _setup_generate_sysml_from_ssd),
+        BenchmarkCase("sync_sysml_from_ssd", "instances", _setup_sync_sysml_from_ssd),
+    )
+}
+
+
+def run_case(case: BenchmarkCase, size: int, repeat: int, workdir: Path) -> BenchmarkResult:
+    runner = case.setup(workdir, size)
+    result = BenchmarkResult(case.name, case.scale, size)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        runner()
+        result.times.append(time.perf_counter() - started)
+    return result
+
+
+def run_suite(
+    instances: Iterable[int] = DEFAULT_INSTANCES,
+    connections: Iterable[int] = DEFAULT_CONNECTIONS,
+    repeat: int = DEFAULT_REPEAT,
+    case_names: Optional[Iterable[str]] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> dict:
+    """Run every selected case at every size and return the JSON document."""
+    sizes = {"instances": list(instances), "connections": list(connections)}
+    selected = [CASES[name] for name in (case_names or CASES)]
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="pyssp-bench-") as tmp:
+        workdir = Path(tmp)
+        for case in selected:
+            for size in sizes[case.scale]:
+                result = run_case(case, size, repeat, workdir)
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+    return {"metadata": _metadata(repeat), "results": [result.to_json() for result in results]}
+
+
+def _metadata(repeat: int) -> dict:
+    from pyssp_sysml2 import __version__
+
+    return {
+        "pyssp_sysml2": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare_results(baseline: dict, current: dict) -> list[Comparison]:
+    """Pair the median times of results present in both documents."""
+    baseline_medians = {
+        (item["name"], item["size"]): item["median"] for item in baseline["results"]
+    }
+    comparisons = []
+    for item in current["results"]:
+        key = (item["name"], item["size"])
+        if key in baseline_medians:
+            comparisons.append(
+                Comparison(item["name"], item["size"], baseline_medians[key], item["median"])
+            )
+    return comparisons
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return f"{result.name:<30} {result.size:>8} {result.scale:<12} median {result.median:9.4f}s"
+
+
+def format_comparison(comparisons: list[Comparison], threshold: float) -> list[str]:
+    lines = [f"{'benchmark':<30} {'size':>8} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for item in comparisons:
+        flag = "  REGRESSION" if item.ratio > threshold else ""
+        lines.append(
+            f"{item.name:<30} {item.size:>8} {item.baseline:>9.4f}s {item.current:>9.4f}s"
+            f" {item.ratio:>6.2f}x{flag}"
+        )
+    return lines
@@ -1,18 +1,51 @@
 """SysML utilities package for architecture parsing and generation SSP."""
 
+from __future__ import annotations
+
+import importlib
+
 __version__ = "0.1.0"
 
-from pyssp_sysml2.fmi import generate_model_descriptions
-from pyssp_sysml2.ssd import build_ssd, generate_ssd
-from pyssp_sysml2.ssv import generate_parameter_set
-from pyssp_sysml2.sysml import generate_sysml_from_ssd
-from pyssp_sysml2.sync import sync_sysml_from_ssd
-
-__all__ = [
-    "build_ssd",
-    "generate_ssd",
-    "generate_parameter_set",
-    "generate_model_descriptions",
-    "generate_sysml_from_ssd",
-    "sync_sysml_from_ssd",
-]
+# Public names are resolved on first access so that importing the package (or
+# running ``pyssp --help``) does not load every generator and its dependencies.
+_EXPORTS = {
+    "build_ssd": "pyssp_sysml2.ssd",
+    "generate_ssd": "pyssp_sysml2.ssd",
+    "generate_ssd_from_model": "pyssp_sysml2.ssd",
+    "generate_parameter_set": "pyssp_sysml2.ssv",
+    "generate_parameter_set_from_model": "pyssp_sysml2.ssv",
+    "generate_model_descriptions": "pyssp_sysml2.fmi",
+    "generate_model_descriptions_from_model": "pyssp_sysml2.fmi",
+    "generate_model_descriptions_for_compositions": "pyssp_sysml2.fmi",
+    "generate_all": "pyssp_sysml2.pipeline",
+    "generate_all_from_model": "pyssp_sysml2.pipeline",
+    "generate_compositions": "pyssp_sysml2.pipeline",
+    "generate_compositions_from_model": "pyssp_sysml2.pipeline",
+    "generate_sysml_from_ssd": "pyssp_sysml2.sysml",
+    "generate_sysml_from_ssd_system": "pyssp_sysml2.sysml",
+    "sync_sysml_from_ssd": "pyssp_sysml2.sync",
+    "sync_sysml_from_model": "pyssp_sysml2.sync",
+    "verify_fmus": "pyssp_sysml2.verify",
+    "verify_fmus_from_model": "pyssp_sysml2.verify",
+    "tracing": "pyssp_sysml2.trace",
+    "memory_profiling": "pyssp_sysml2.memory",
+    "GenerationCancelled": "pyssp_sysml2.events",
+    "GenerationEvent": "pyssp_sysml2.events",
+    "cancel_after": "pyssp_sysml2.events",
+    "set_generation_timestamp": "pyssp_sysml2.timestamps",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
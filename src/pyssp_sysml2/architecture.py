@@ -0,0 +1,126 @@
+"""Helpers for loading SysML architectures shared by the generators."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+from pycps_sysmlv2 import NodeType, SysMLPartDefinition, SysMLParser
+
+from pyssp_sysml2.cache import (
+    DEFAULT_MAX_ENTRIES,
+    ArchitectureMemoryCache,
+    CacheStats,
+    get_disk_cache,
+    set_disk_cache,
+)
+from pyssp_sysml2.trace import span
+
+__all__ = [
+    "disable_memory_cache",
+    "enable_memory_cache",
+    "find_compositions",
+    "get_disk_cache",
+    "get_memory_cache",
+    "load_architecture",
+    "load_composition",
+    "memory_cache_stats",
+    "resolve_composition",
+    "resolve_compositions",
+    "resolve_model",
+    "set_disk_cache",
+]
+
+_memory_cache: Optional[ArchitectureMemoryCache] = None
+
+
+def enable_memory_cache(max_entries: int = DEFAULT_MAX_ENTRIES) -> ArchitectureMemoryCache:
+    """Memoize parsed architectures in this process, keeping at most ``max_entries``."""
+    global _memory_cache
+    _memory_cache = ArchitectureMemoryCache(max_entries)
+    return _memory_cache
+
+
+def disable_memory_cache() -> None:
+    global _memory_cache
+    _memory_cache = None
+
+
+def get_memory_cache() -> Optional[ArchitectureMemoryCache]:
+    return _memory_cache
+
+
+def memory_cache_stats() -> Optional[CacheStats]:
+    """Return hit/miss/eviction counters of the in-process cache, or ``None`` when disabled."""
+    return None if _memory_cache is None else _memory_cache.stats
+
+
+def _parse_architecture(architecture_path: Path):
+    with span("parse architecture", category="parse", path=architecture_path):
+        return SysMLParser(architecture_path).parse()
+
+
+def _load_uncached_in_memory(architecture_path: Path):
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        return disk_cache.load(architecture_path, _parse_architecture)
+    return _parse_architecture(architecture_path)
+
+
+def load_architecture(architecture_path: Path, mutable: bool = False):
+    """Parse and link every SysML file of the architecture at ``architecture_path``.
+
+    Pass ``mutable=True`` when the caller edits the returned package in place.
+    """
+    with span("load architecture", category="parse", path=architecture_path):
+        if _memory_cache is not None:
+            return _memory_cache.load(
+                architecture_path, _load_uncached_in_memory, mutable=mutable
+            )
+        return _load_uncached_in_memory(architecture_path)
+
+
+def resolve_composition(architecture, composition: str) -> SysMLPartDefinition:
+    """Return the top-level composition part definition from a parsed architecture."""
+    with span("resolve composition", category="parse", composition=composition):
+        return architecture.get_def(NodeType.Part, composition)
+
+
+def find_compositions(architecture) -> list[SysMLPartDefinition]:
+    """Return every part definition that owns part references, in declaration order."""
+    return [
+        part_def
+        for part_def in architecture.defs(NodeType.Part).values()
+        if part_def.refs(NodeType.Part)
+    ]
+
+
+def resolve_compositions(
+    architecture, compositions: Optional[Iterable[str]] = None
+) -> list[SysMLPartDefinition]:
+    """Resolve the named compositions, or every composition when ``compositions`` is ``None``."""
+    if compositions is None:
+        return find_compositions(architecture)
+    names = list(dict.fromkeys(compositions))
+    return [resolve_composition(architecture, name) for name in names]
+
+
+def load_composition(architecture_path: Path, composition: str) -> SysMLPartDefinition:
+    return resolve_composition(load_architecture(architecture_path), composition)
+
+
+def resolve_model(model, composition: str | None = None) -> SysMLPartDefinition:
+    """Return the composition for a pre-parsed ``model``.
+
+    ``model`` is either a parsed architecture package, in which case
+    ``composition`` names the part definition to use, or a
+    ``SysMLPartDefinition`` that already is the composition.
+    """
+    if isinstance(model, SysMLPartDefinition):
+        if composition is not None and composition != model.name:
+            raise ValueError(
+                f"Composition '{composition}' does not match part definition '{model.name}'"
+            )
+        return model
+    if composition is None:
+        raise ValueError("Composition name must be provided when passing an architecture package")
+    return resolve_composition(model, composition)
@@ -0,0 +1,230 @@
+"""Run many generate/sync jobs listed in a TOML batch manifest.
+
+Example ``manifest.toml``::
+
+    [[jobs]]
+    name = "variant-a"
+    kind = "all"
+    architecture = "variants/a"
+    composition = "AircraftComposition"
+    output_dir = "build/variant-a"
+
+    [[jobs]]
+    kind = "sysml"
+    ssd = "external/SystemStructure.ssd"
+    output = "build/recovered/architecture.sysml"
+
+Relative paths are resolved against the manifest's directory.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
+    import tomli as tomllib
+
+from pyssp_sysml2.cache import ArchitectureDiskCache, get_disk_cache, set_disk_cache
+
+JOB_KINDS = {
+    "all": ("architecture", "composition", "output_dir"),
+    "ssd": ("architecture", "composition", "output"),
+    "ssv": ("architecture", "composition", "output"),
+    "fmi": ("architecture", "composition", "output_dir"),
+    "sysml": ("ssd", "output"),
+    "sync": ("architecture", "composition", "ssd"),
+}
+# Keys each kind accepts besides its required ones (and ``name``/``kind``)
+OPTIONAL_KEYS = {
+    "all": ("type_check", "incremental"),
+    "ssd": ("type_check", "incremental"),
+    "ssv": ("incremental",),
+    "fmi": ("incremental",),
+    "sysml": ("composition",),
+    "sync": ("output_architecture_dir",),
+}
+PATH_KEYS = {"architecture", "output", "output_dir", "ssd", "output_architecture_dir"}
+
+
+@dataclass
+class BatchJob:
+    name: str
+    kind: str
+    params: dict = field(default_factory=dict)
+
+
+@dataclass
+class JobResult:
+    name: str
+    kind: str
+    ok: bool
+    outputs: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+def load_batch_manifest(manifest_path: Path) -> list[BatchJob]:
+    with manifest_path.open("rb") as handle:
+        data = tomllib.load(handle)
+
+    base_dir = manifest_path.parent
+    jobs: list[BatchJob] = []
+    for index, entry in enumerate(data.get("jobs", []), start=1):
+        entry = dict(entry)
+        kind = entry.pop("kind", None)
+        if kind not in JOB_KINDS:
+            raise ValueError(
+                f"Batch job #{index} has unknown kind {kind!r}; expected one of {sorted(JOB_KINDS)}"
+            )
+        name = str(entry.pop("name", f"{kind}-{index}"))
+        missing = [key for key in JOB_KINDS[kind] if key not in entry]
+        if missing:
+            raise ValueError(f"Batch job '{name}' is missing {', '.join(missing)}")
+        allowed = {*JOB_KINDS[kind], *OPTIONAL_KEYS[kind]}
+        unknown = sorted(key for key in entry if key not in allowed)
+        if unknown:
+            raise ValueError(
+                f"Batch job '{name}' ({kind}) has unknown keys {', '.join(unknown)}; "
+                f"expected {', '.join(sorted(allowed))}"
+            )
+        params = {
+            key: base_dir / value if key in PATH_KEYS else value for key, value in entry.items()
+        }
+        jobs.append(BatchJob(name=name, kind=kind, params=params))
+
+    if not jobs:
+        raise ValueError(f"No [[jobs]] found in batch manifest: {manifest_path}")
+    return jobs
+
+
+def _execute(job: BatchJob) -> list[Path]:
+    params = job.params
+    if job.kind == "all":
+        from pyssp_sysml2.pipeline import generate_all
+
+        artifacts = generate_all(
+            params["architecture"],
+            params["output_dir"],
+            params["composition"],
+            params.get("type_check", True),
+            incremental=params.get("incremental", False),
+        )
+        return [artifacts.ssd, artifacts.ssv, *artifacts.model_descriptions]
+
+    if job.kind == "ssd":
+        from pyssp_sysml2.ssd import generate_ssd
+
+        return [
+            generate_ssd(
+                params["architecture"],
+                params["output"],
+                params["composition"],
+                params.get("type_check", True),
+                incremental=params.get("incremental", False),
+            )
+        ]
+
+    if job.kind == "ssv":
+        from pyssp_sysml2.ssv import generate_parameter_set
+
+        return [
+            generate_parameter_set(
+                params["architecture"],
+                params["output"],
+                params["composition"],
+                incremental=params.get("incremental", False),
+            )
+        ]
+
+    if job.kind == "fmi":
+        from pyssp_sysml2.fmi import generate_model_descriptions
+
+        return generate_model_descriptions(
+            params["architecture"],
+            params["output_dir"],
+            params["composition"],
+            incremental=params.get("incremental", False),
+        )
+
+    if job.kind == "sysml":
+        from pyssp_sysml2.sysml import generate_sysml_from_ssd
+
+        return [generate_sysml_from_ssd(params["ssd"], params["output"], params.get("composition"))]
+
+    from pyssp_sysml2.sync import sync_sysml_from_ssd
+
+    return sync_sysml_from_ssd(
+        architecture_path=params["architecture"],
+        ssd_path=params["ssd"],
+        composition=params["composition"],
+        output_architecture_dir=params.get("output_architecture_dir"),
+    )
+
+
+def run_job(job: BatchJob) -> JobResult:
+    """Run one job and capture its outcome instead of raising."""
+    started = time.perf_counter()
+    try:
+        outputs = _execute(job)
+    except Exception as exc:  # noqa: BLE001 - report per job, keep the batch going
+        return JobResult(
+            name=job.name,
+            kind=job.kind,
+            ok=False,
+            error=str(exc),
+            duration=time.perf_counter() - started,
+        )
+    return JobResult(
+        name=job.name,
+        kind=job.kind,
+        ok=True,
+        outputs=[str(path) for path in outputs],
+        duration=time.perf_counter() - started,
+    )
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    max_workers: Optional[int] = None,
+    disk_cache: Optional[ArchitectureDiskCache] = None,
+) -> list[JobResult]:
+    """Run ``jobs`` on a process pool and return their results in manifest order.
+
+    ``max_workers=1`` runs the jobs serially in the current process. Like the
+    FMI and verify pools, the workers are spawned rather than forked, so they
+    only share the state passed to them: the disk cache setting.
+    """
+    if max_workers == 1:
+        previous_cache = get_disk_cache()
+        set_disk_cache(disk_cache)
+        try:
+            return [run_job(job) for job in jobs]
+        finally:
+            set_disk_cache(previous_cache)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=set_disk_cache,
+        initargs=(disk_cache,),
+    ) as executor:
+        return list(executor.map(run_job, jobs))
+
+
+def format_summary(results: list[JobResult]) -> list[str]:
+    lines = []
+    for result in results:
+        status = "ok" if result.ok else "FAILED"
+        line = f"{status:<6} {result.duration:8.3f}s  {result.kind:<5} {result.name}"
+        if result.error:
+            line += f": {result.error}"
+        lines.append(line)
+    failed = sum(not result.ok for result in results)
+    lines.append(f"{len(results) - failed}/{len(results)} jobs succeeded")
+    return lines
@@ -0,0 +1,293 @@
+"""In-process and on-disk caches of parsed SysML architectures."""
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from pyssp_sysml2.paths import ensure_directory
+from pyssp_sysml2.trace import span
+
+CACHE_DIR_ENV = "PYSSP_CACHE_DIR"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 8
+CACHE_SUFFIX = ".pickle"
+
+
+_disk_cache: Optional["ArchitectureDiskCache"] = None
+
+
+def set_disk_cache(cache: Optional["ArchitectureDiskCache"]) -> None:
+    """Enable (or with ``None`` disable) the on-disk cache used by ``load_architecture``."""
+    global _disk_cache
+    _disk_cache = cache
+
+
+def get_disk_cache() -> Optional["ArchitectureDiskCache"]:
+    return _disk_cache
+
+
+def default_cache_dir() -> Path:
+    """Return ``$PYSSP_CACHE_DIR``, else ``$XDG_CACHE_HOME/pyssp_sysml2``, else ``~/.cache/pyssp_sysml2``."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "pyssp_sysml2"
+
+
+def architecture_root(architecture_path: Path) -> Path:
+    return architecture_path if architecture_path.is_dir() else architecture_path.parent
+
+
+def architecture_files(architecture_path: Path) -> list[Path]:
+    """Return the ``.sysml`` files that make up the architecture at ``architecture_path``."""
+    root = architecture_root(architecture_path)
+    if not root.is_dir():
+        return []
+    return sorted(root.rglob("*.sysml"))
+
+
+def _distribution_version(name: str) -> str:
+    from importlib import metadata  # slow to import; only needed when keying disk entries
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _tool_versions() -> tuple[str, ...]:
+    from pyssp_sysml2 import __version__
+
+    return (
+        f"python={sys.version_info.major}.{sys.version_info.minor}",
+        f"pickle={pickle.HIGHEST_PROTOCOL}",
+        f"pycps_sysmlv2={_distribution_version('pycps_sysmlv2')}",
+        f"pyssp_sysml2={__version__}",
+    )
+
+
+class ArchitectureDiskCache:
+    """Pickled parsed architectures keyed by input content hashes and tool versions.
+
+    Entries are evicted least-recently-used first once the cache directory
+    grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, architecture_path: Path, files: list[Path]) -> str:
+        root = architecture_root(architecture_path).resolve()
+        digest = hashlib.sha256()
+        for part in _tool_versions():
+            digest.update(part.encode("utf-8") + b"\0")
+        digest.update(str(root).encode("utf-8") + b"\0")
+        for path in files:
+            with span("hash source", category="cache", path=path):
+                digest.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str):
+        entry = self._entry_path(key)
+        try:
+            with entry.open("rb") as handle:
+                value = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001 - a corrupt entry is just a miss
+            entry.unlink(missing_ok=True)
+            return None
+        os.utime(entry)
+        return value
+
+    def put(self, key: str, value) -> bool:
+        """Store ``value``; warn and return ``False`` when it cannot be pickled or is too large."""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError) as exc:
+            warnings.warn(
+                f"Parsed architecture not cached, it cannot be pickled: {exc!r}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return False
+        if len(payload) > self.max_bytes:
+            warnings.warn(
+                f"Parsed architecture not cached, its {len(payload)} bytes exceed the "
+                f"{self.max_bytes} byte cache limit",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return False
+
+        ensure_directory(self.cache_dir)
+        entry = self._entry_path(key)
+        temp = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        temp.write_bytes(payload)
+        os.replace(temp, entry)
+        self.evict()
+        return True
+
+    def evict(self) -> list[Path]:
+        """Remove least-recently-used entries until the cache fits in ``max_bytes``."""
+        if not self.cache_dir.is_dir():
+            return []
+        entries = []
+        for entry in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _mtime, size, _entry in entries)
+        removed: list[Path] = []
+        for _mtime, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed.append(entry)
+        return removed
+
+    def clear(self) -> None:
+        if not self.cache_dir.is_dir():
+            return
+        for entry in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def load(self, architecture_path: Path, parse: Callable[[Path], object]):
+        """Return the cached architecture for ``architecture_path`` or parse and store it."""
+        files = architecture_files(architecture_path)
+        if not files:
+            return parse(architecture_path)
+
+        key = self.key(architecture_path, files)
+        with span("read disk cache", category="cache"):
+            cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        architecture = parse(architecture_path)
+        with span("write disk cache", category="cache"):
+            self.put(key, architecture)
+        return architecture
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    max_entries: int = 0
+
+
+class ArchitectureMemoryCache:
+    """LRU cache of parsed architectures for long-running processes.
+
+    Entries are keyed by the resolved architecture root plus the path, mtime
+    and size of every ``.sysml`` file, so edits on disk are picked up without
+    hashing file contents.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def input_files(architecture_path: Path) -> list[Path]:
+        return architecture_files(architecture_path)
+
+    @staticmethod
+    def key(architecture_path: Path, files: list[Path]) -> tuple:
+        stamps = []
+        for path in files:
+            stat = path.stat()
+            stamps.append((str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+        return (str(architecture_root(architecture_path).resolve()), tuple(stamps))
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: tuple):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: tuple, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def load(
+        self,
+        architecture_path: Path,
+        parse: Callable[[Path], object],
+        mutable: bool = False,
+    ):
+        """Return the memoized architecture for ``architecture_path`` or parse and store it.
+
+        With ``mutable`` the caller gets a deep copy, so in-place edits (as
+        done by sync) never leak into the cached model.
+        """
+        files = self.input_files(architecture_path)
+        if not files:
+            return parse(architecture_path)
+
+        key = self.key(architecture_path, files)
+        architecture = self.get(key)
+        if architecture is None:
+            architecture = parse(architecture_path)
+            self.put(key, architecture)
+        return copy.deepcopy(architecture) if mutable else architecture
+
+
+class SSDMemoryCache(ArchitectureMemoryCache):
+    """LRU cache of loaded SSD systems keyed by the SSD file's path, mtime and size."""
+
+    @staticmethod
+    def input_files(architecture_path: Path) -> list[Path]:
+        return [architecture_path] if architecture_path.is_file() else []
@@ -1,37 +1,464 @@
 """Main CLI entrypoint for pyssp_sysml2."""
 
+# Generator modules pull in pycps_sysmlv2 and pyssp_standard, so they are
+# imported inside the subcommand that needs them to keep startup fast.
+
 from __future__ import annotations
 
 import argparse
+import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    ArchitectureDiskCache,
+    get_disk_cache,
+    set_disk_cache,
+)
+from pyssp_sysml2.events import (
+    COMPONENT_FINISHED,
+    FILE_SKIPPED,
+    FILE_WRITTEN,
+    GenerationEvent,
+)
 from pyssp_sysml2.paths import (
     DEFAULT_ARCH_PATH,
     DEFAULT_COMPOSITION_NAME,
+    DEFAULT_DEBOUNCE,
+    DEFAULT_POLL_INTERVAL,
     GENERATED_DIR,
 )
-from pyssp_sysml2.ssd import generate_ssd
-from pyssp_sysml2.ssv import generate_parameter_set
-from pyssp_sysml2.sysml import generate_sysml_from_ssd
-from pyssp_sysml2.sync import sync_sysml_from_ssd
+from pyssp_sysml2.timestamps import (
+    get_generation_timestamp,
+    parse_timestamp,
+    set_generation_timestamp,
+)
+from pyssp_sysml2.trace import tracing
+
+if TYPE_CHECKING:
+    from pyssp_sysml2.watch import WatchCycle
 
 
-def _add_common_architecture_args(parser: argparse.ArgumentParser) -> None:
+def _add_common_architecture_args(
+    parser: argparse.ArgumentParser, multiple_compositions: bool = False, cache: bool = True
+) -> None:
     parser.add_argument(
         "--architecture",
         type=Path,
         default=DEFAULT_ARCH_PATH,
         help="Path to SysML architecture directory or a file inside it.",
     )
+    if multiple_compositions:
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument(
+            "--composition",
+            action="append",
+            default=None,
+            help=f"Top-level composition part definition name; repeat for several (defaults to {DEFAULT_COMPOSITION_NAME}).",
+        )
+        group.add_argument(
+            "--all-compositions",
+            action="store_true",
+            help="Generate every part definition that owns part references.",
+        )
+    else:
+        parser.add_argument(
+            "--composition",
+            default=DEFAULT_COMPOSITION_NAME,
+            help="Top-level composition part definition name.",
+        )
+    if cache:
+        _add_cache_args(parser)
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Keep parsed architectures in an on-disk cache so unchanged inputs are not re-parsed.",
+    )
     parser.add_argument(
-        "--composition",
-        default=DEFAULT_COMPOSITION_NAME,
-        help="Top-level composition part definition name.",
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the parsed-architecture cache; implies --cache (defaults to $PYSSP_CACHE_DIR or $XDG_CACHE_HOME/pyssp_sysml2).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Maximum size of the parsed-architecture cache in MiB before old entries are evicted.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the SysML architecture, even with --cache or --cache-dir.",
+    )
+
+
+def _add_incremental_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rewrite outputs whose source definitions changed since the last recorded run.",
+    )
+
+
+def _add_timestamp_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--timestamp",
+        type=parse_timestamp,
+        default=None,
+        help=(
+            "generationDateAndTime to write, as epoch seconds or ISO 8601, for reproducible "
+            "outputs (defaults to SOURCE_DATE_EPOCH, then the current time)."
+        ),
+    )
+
+
+def _add_jobs_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes rendering modelDescription.xml files (default 1: in-process).",
+    )
+
+
+def _add_profiling_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write nested timing spans of the run to this file in Chrome trace-event format.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace allocations and print peak/retained memory per stage and the top allocation sites.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print per-component progress and written files to stderr.",
     )
 
 
+def _selected_compositions(args: argparse.Namespace) -> Optional[list[str]]:
+    """Return the requested composition names, or ``None`` for ``--all-compositions``."""
+    if args.all_compositions:
+        return None
+    return list(dict.fromkeys(args.composition or [DEFAULT_COMPOSITION_NAME]))
+
+
+def _composition_outputs(
+    architecture_path: Path, compositions: Optional[list[str]], output: Path
+) -> Iterator[tuple[object, Path]]:
+    """Parse once and pair every selected composition with ``<parent>/<name>/<file>``."""
+    from pyssp_sysml2.architecture import load_architecture, resolve_compositions
+
+    systems = resolve_compositions(load_architecture(architecture_path), compositions)
+    if not systems:
+        raise ValueError(f"No compositions found in {architecture_path}")
+    for system in systems:
+        yield system, output.parent / system.name / output.name
+
+
+def _disk_cache_from_args(args: argparse.Namespace) -> Optional[ArchitectureDiskCache]:
+    if not hasattr(args, "no_cache") or args.no_cache:
+        return None
+    if not args.cache and args.cache_dir is None:
+        return None
+    return ArchitectureDiskCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+
+def _print_progress(event: GenerationEvent) -> None:
+    if event.kind == COMPONENT_FINISHED:
+        print(
+            f"[{event.generator} {event.index}/{event.total}] {event.name} ({event.duration:.3f}s)",
+            file=sys.stderr,
+            flush=True,
+        )
+    elif event.kind in (FILE_WRITTEN, FILE_SKIPPED):
+        status = "wrote" if event.kind == FILE_WRITTEN else "up to date"
+        print(
+            f"[{event.generator}] {status} {event.path} ({event.duration:.3f}s)",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+def _print_watch_cycle(cycle: WatchCycle) -> None:
+    changed = ", ".join(path.name for path in cycle.changed) or "startup"
+    if cycle.error is not None:
+        print(f"[error] {cycle.error} (changed: {changed})", flush=True)
+        return
+    print(f"Regenerated in {cycle.duration:.3f}s (changed: {changed})", flush=True)
+
+
+def _run(args: argparse.Namespace) -> Optional[int]:
+    observer = _print_progress if getattr(args, "progress", False) else None
+
+    if args.command == "generate" and args.artifact == "ssd":
+        from pyssp_sysml2.ssd import generate_ssd, generate_ssd_from_model
+
+        compositions = _selected_compositions(args)
+        if compositions is not None and len(compositions) == 1:
+            output = generate_ssd(
+                args.architecture,
+                args.output,
+                compositions[0],
+                args.skip_type_check,
+                incremental=args.incremental,
+                observer=observer,
+            )
+            print(f"SSD written to {output}")
+            return 0
+        for system, output in _composition_outputs(
+            args.architecture, compositions, args.output
+        ):
+            generate_ssd_from_model(
+                system,
+                output,
+                type_check=args.skip_type_check,
+                incremental=args.incremental,
+                observer=observer,
+            )
+            print(f"SSD written to {output}")
+        return 0
+
+    if args.command == "generate" and args.artifact == "ssv":
+        from pyssp_sysml2.ssv import generate_parameter_set, generate_parameter_set_from_model
+
+        compositions = _selected_compositions(args)
+        if compositions is not None and len(compositions) == 1:
+            output = generate_parameter_set(
+                args.architecture,
+                args.output,
+                compositions[0],
+                incremental=args.incremental,
+                observer=observer,
+            )
+            print(f"Wrote {output}")
+            return 0
+        for system, output in _composition_outputs(
+            args.architecture, compositions, args.output
+        ):
+            generate_parameter_set_from_model(
+                system, output, incremental=args.incremental, observer=observer
+            )
+            print(f"Wrote {output}")
+        return 0
+
+    if args.command == "generate" and args.artifact == "fmi":
+        compositions = _selected_compositions(args)
+        if compositions is not None and len(compositions) == 1:
+            from pyssp_sysml2.fmi import generate_model_descriptions
+
+            written = generate_model_descriptions(
+                args.architecture,
+                args.output_dir,
+                compositions[0],
+                incremental=args.incremental,
+                observer=observer,
+                jobs=args.jobs,
+                compact=args.compact,
+                fmu=args.fmu,
+                resources_dir=args.fmu_resources,
+                compression_level=args.compression_level,
+                fmi_version=args.fmi_version,
+                vr_map_dir=args.vr_map_dir,
+            )
+        else:
+            from pyssp_sysml2.architecture import load_architecture, resolve_compositions
+            from pyssp_sysml2.fmi import generate_model_descriptions_for_compositions
+
+            systems = resolve_compositions(load_architecture(args.architecture), compositions)
+            per_composition = generate_model_descriptions_for_compositions(
+                systems,
+                args.output_dir,
+                incremental=args.incremental,
+                observer=observer,
+                jobs=args.jobs,
+                compact=args.compact,
+                fmu=args.fmu,
+                resources_dir=args.fmu_resources,
+                compression_level=args.compression_level,
+                fmi_version=args.fmi_version,
+                vr_map_dir=args.vr_map_dir,
+            )
+            written = list(
+                dict.fromkeys(path for paths in per_composition.values() for path in paths)
+            )
+        if not written:
+            print("No components matched the provided criteria.")
+            return 1
+        for path in written:
+            print(f"Wrote {path}")
+        return 0
+
+    if args.command == "generate" and args.artifact == "all":
+        compositions = _selected_compositions(args)
+        if compositions is not None and len(compositions) == 1:
+            from pyssp_sysml2.pipeline import generate_all
+
+            artifacts = generate_all(
+                args.architecture,
+                args.output_dir,
+                compositions[0],
+                args.skip_type_check,
+                parallel=args.parallel,
+                incremental=args.incremental,
+                observer=observer,
+                jobs=args.jobs,
+            )
+            print(f"SSD written to {artifacts.ssd}")
+            print(f"Wrote {artifacts.ssv}")
+            for path in artifacts.model_descriptions:
+                print(f"Wrote {path}")
+            return 0
+
+        from pyssp_sysml2.pipeline import generate_compositions
+
+        results = generate_compositions(
+            args.architecture,
+            args.output_dir,
+            compositions,
+            args.skip_type_check,
+            parallel=args.parallel,
+            incremental=args.incremental,
+            observer=observer,
+            jobs=args.jobs,
+        )
+        shared: dict[Path, None] = {}
+        for artifacts in results.values():
+            print(f"SSD written to {artifacts.ssd}")
+            print(f"Wrote {artifacts.ssv}")
+            shared.update(dict.fromkeys(artifacts.model_descriptions))
+        for path in shared:
+            print(f"Wrote {path}")
+        return 0
+
+    if args.command == "generate" and args.artifact == "sysml":
+        from pyssp_sysml2.sysml import generate_sysml_from_ssd
+
+        output = generate_sysml_from_ssd(
+            args.ssd, args.output, args.composition, observer=observer
+        )
+        print(f"Wrote {output}")
+        return 0
+
+    if args.command == "watch":
+        from pyssp_sysml2.watch import watch_architecture
+
+        print(f"Watching {args.architecture} (Ctrl+C to stop)", flush=True)
+        try:
+            watch_architecture(
+                args.architecture,
+                args.output_dir,
+                args.composition,
+                args.skip_type_check,
+                interval=args.interval,
+                debounce=args.debounce,
+                on_cycle=_print_watch_cycle,
+            )
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == "serve":
+        from pyssp_sysml2.server import RpcServer
+
+        server = RpcServer(max_entries=args.max_models)
+        try:
+            if args.socket is None:
+                server.serve_stdio()
+            else:
+                print(f"Listening on {args.socket}", flush=True)
+                server.serve_unix_socket(args.socket)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == "batch":
+        from pyssp_sysml2.batch import format_summary, load_batch_manifest, run_batch
+
+        results = run_batch(
+            load_batch_manifest(args.manifest),
+            max_workers=args.jobs,
+            disk_cache=_disk_cache_from_args(args),
+        )
+        for line in format_summary(results):
+            print(line)
+        return 0 if all(result.ok for result in results) else 1
+
+    if args.command == "sync" and args.artifact == "ssd":
+        from pyssp_sysml2.sync import sync_sysml_from_ssd
+
+        written = sync_sysml_from_ssd(
+            architecture_path=args.architecture,
+            ssd_path=args.ssd,
+            composition=args.composition,
+            output_architecture_dir=args.output_architecture_dir,
+            observer=observer,
+        )
+        for path in written:
+            print(f"Wrote {path}")
+        return 0
+
+    if args.command == "verify" and args.artifact == "fmu":
+        from pyssp_sysml2.verify import format_summary, verify_fmus
+
+        reports = verify_fmus(
+            args.architecture,
+            args.fmu_dir,
+            args.composition,
+            jobs=args.jobs,
+            vr_map_dir=args.vr_map_dir,
+        )
+        for line in format_summary(reports):
+            print(line)
+        return 0 if all(report.ok for report in reports) else 1
+
+    if args.command == "synth":
+        from pyssp_sysml2 import synth
+
+        if args.artifact == "architecture":
+            spec = synth.ArchitectureSpec(
+                part_defs=args.part_defs,
+                instances_per_def=args.instances_per_def,
+                ports_per_part=args.ports_per_part,
+                port_defs=args.port_defs,
+                attributes_per_port=args.attributes_per_port,
+                parameters_per_part=args.parameters_per_part,
+                list_length=args.list_length,
+                connection_density=args.connection_density,
+                seed=args.seed,
+            )
+            output = synth.write_architecture(args.output_dir, spec)
+            print(f"Wrote {spec.instances} parts to {output / 'architecture.sysml'}")
+            return 0
+        spec = synth.SsdSpec(
+            components=args.components,
+            component_types=args.component_types,
+            ports_per_component=args.ports_per_component,
+            attributes_per_port=args.attributes_per_port,
+            list_length=args.list_length,
+            scalar_connectors=args.scalar_connectors,
+            fan_out=args.fan_out,
+            connection_density=args.connection_density,
+            seed=args.seed,
+        )
+        output = synth.write_ssd(args.output, spec)
+        print(f"Wrote {output}")
+        return 0
+
+    return None
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(prog="pyssp", description=__doc__)
     root_subparsers = parser.add_subparsers(dest="command", required=True)
@@ -48,7 +475,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     ssd_parser = generate_subparsers.add_parser(
         "ssd", help="Generate SystemStructure.ssd"
     )
-    _add_common_architecture_args(ssd_parser)
+    _add_common_architecture_args(ssd_parser, multiple_compositions=True)
+    _add_incremental_arg(ssd_parser)
+    _add_timestamp_arg(ssd_parser)
+    _add_profiling_args(ssd_parser)
     ssd_parser.add_argument(
         "--output",
         type=Path,
@@ -62,7 +492,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
 
     ssv_parser = generate_subparsers.add_parser("ssv", help="Generate parameter .ssv")
-    _add_common_architecture_args(ssv_parser)
+    _add_common_architecture_args(ssv_parser, multiple_compositions=True)
+    _add_incremental_arg(ssv_parser)
+    _add_timestamp_arg(ssv_parser)
+    _add_profiling_args(ssv_parser)
     ssv_parser.add_argument(
         "--output",
         type=Path,
@@ -73,17 +506,83 @@ def main(argv: Optional[list[str]] = None) -> int:
     fmi_parser = generate_subparsers.add_parser(
         "fmi", help="Generate FMI model descriptions"
     )
-    _add_common_architecture_args(fmi_parser)
+    _add_common_architecture_args(fmi_parser, multiple_compositions=True)
+    _add_incremental_arg(fmi_parser)
+    _add_timestamp_arg(fmi_parser)
+    _add_jobs_arg(fmi_parser)
+    _add_profiling_args(fmi_parser)
     fmi_parser.add_argument(
         "--output-dir",
         type=Path,
         default=GENERATED_DIR / "model_descriptions",
         help="Output directory for modelDescription.xml files.",
     )
+    fmi_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write modelDescription.xml without indentation.",
+    )
+    fmi_parser.add_argument(
+        "--fmi-version",
+        choices=("2.0", "3.0"),
+        default="2.0",
+        help="FMI version; 3.0 writes list attributes as array variables (default: 2.0).",
+    )
+    fmi_parser.add_argument(
+        "--vr-map-dir",
+        type=Path,
+        default=None,
+        help="Keep value references stable across runs in <dir>/<PartDef>.vr.json files.",
+    )
+    fmi_parser.add_argument(
+        "--fmu",
+        action="store_true",
+        help="Write one <PartDef>.fmu archive per part definition instead of directories.",
+    )
+    fmi_parser.add_argument(
+        "--fmu-resources",
+        type=Path,
+        default=None,
+        help="Directory whose <PartDef>/ subdirectories are packed into resources/ of each FMU.",
+    )
+    fmi_parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="Deflate level of FMU archives (default: zlib default).",
+    )
+
+    all_parser = generate_subparsers.add_parser(
+        "all", help="Generate SSD, SSV and FMI model descriptions from one parse"
+    )
+    _add_common_architecture_args(all_parser, multiple_compositions=True)
+    _add_incremental_arg(all_parser)
+    _add_timestamp_arg(all_parser)
+    _add_jobs_arg(all_parser)
+    _add_profiling_args(all_parser)
+    all_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=GENERATED_DIR,
+        help="Output directory for SystemStructure.ssd, parameters.ssv and model_descriptions/.",
+    )
+    all_parser.add_argument(
+        "--skip_type_check",
+        action="store_false",
+        help="avoid typecheck during connection link",
+    )
+    all_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the SSD, SSV and FMI writers concurrently.",
+    )
 
     sysml_parser = generate_subparsers.add_parser(
         "sysml", help="Generate a SysML file from an SSD"
     )
+    _add_profiling_args(sysml_parser)
     sysml_parser.add_argument(
         "--ssd",
         type=Path,
@@ -106,6 +605,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         "ssd", help="Sync SysML composition connections from an external SSD"
     )
     _add_common_architecture_args(sync_ssd_parser)
+    _add_profiling_args(sync_ssd_parser)
     sync_ssd_parser.add_argument(
         "--ssd",
         type=Path,
@@ -119,56 +619,179 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="Optional output directory for updated .sysml files (defaults to architecture source).",
     )
 
-    args = parser.parse_args(argv)
+    watch_parser = root_subparsers.add_parser(
+        "watch", help="Regenerate SSD/SSV/FMI outputs whenever SysML files change"
+    )
+    # The watcher re-parses after every save, so a disk cache would only add work.
+    _add_common_architecture_args(watch_parser, cache=False)
+    watch_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=GENERATED_DIR,
+        help="Output directory for SystemStructure.ssd, parameters.ssv and model_descriptions/.",
+    )
+    watch_parser.add_argument(
+        "--skip_type_check",
+        action="store_false",
+        help="avoid typecheck during connection link",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help="Polling interval in seconds.",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help="Seconds without further changes before regenerating.",
+    )
 
-    try:
-        if args.command == "generate" and args.artifact == "ssd":
-            output = generate_ssd(
-                args.architecture, args.output, args.composition, args.skip_type_check
-            )
-            print(f"SSD written to {output}")
-            return 0
+    serve_parser = root_subparsers.add_parser(
+        "serve", help="Serve generate/sync requests as JSON-RPC over stdin/stdout or a Unix socket"
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Listen on this Unix domain socket instead of stdin/stdout.",
+    )
+    serve_parser.add_argument(
+        "--max-models",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="Maximum number of parsed architectures and SSD systems kept in memory.",
+    )
 
-        if args.command == "generate" and args.artifact == "ssv":
-            output = generate_parameter_set(
-                args.architecture, args.output, args.composition
-            )
-            print(f"Wrote {output}")
-            return 0
+    batch_parser = root_subparsers.add_parser(
+        "batch", help="Run the generate/sync jobs listed in a TOML manifest"
+    )
+    batch_parser.add_argument(
+        "manifest",
+        type=Path,
+        help="Path to a batch manifest with [[jobs]] tables.",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the CPU count; 1 runs serially).",
+    )
+    _add_cache_args(batch_parser)
 
-        if args.command == "generate" and args.artifact == "fmi":
-            written = generate_model_descriptions(
-                args.architecture, args.output_dir, args.composition
-            )
-            if not written:
-                print("No components matched the provided criteria.")
-                return 1
-            for path in written:
-                print(f"Wrote {path}")
-            return 0
+    verify_parser = root_subparsers.add_parser(
+        "verify", help="Check existing artifacts against the architecture"
+    )
+    verify_subparsers = verify_parser.add_subparsers(dest="artifact", required=True)
+    verify_fmu_parser = verify_subparsers.add_parser(
+        "fmu", help="Check the modelDescription.xml of every FMU in a directory"
+    )
+    _add_common_architecture_args(verify_fmu_parser)
+    verify_fmu_parser.add_argument(
+        "--fmu-dir",
+        type=Path,
+        required=True,
+        help="Directory of <PartDef>.fmu archives to check.",
+    )
+    verify_fmu_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the CPU count; 1 runs serially).",
+    )
+    verify_fmu_parser.add_argument(
+        "--vr-map-dir",
+        type=Path,
+        default=None,
+        help="Expect the value references recorded by generate fmi --vr-map-dir.",
+    )
 
-        if args.command == "generate" and args.artifact == "sysml":
-            output = generate_sysml_from_ssd(args.ssd, args.output, args.composition)
-            print(f"Wrote {output}")
-            return 0
+    synth_parser = root_subparsers.add_parser(
+        "synth", help="Write synthetic architectures or SSDs for load testing"
+    )
+    synth_subparsers = synth_parser.add_subparsers(dest="artifact", required=True)
+    synth_architecture_parser = synth_subparsers.add_parser(
+        "architecture", help="Write a synthetic SysML architecture"
+    )
+    synth_architecture_parser.add_argument(
+        "--output-dir",
+        type=Path,
+        required=True,
+        help="Directory receiving architecture.sysml.",
+    )
+    synth_architecture_parser.add_argument("--part-defs", type=int, default=10)
+    synth_architecture_parser.add_argument("--instances-per-def", type=int, default=10)
+    synth_architecture_parser.add_argument("--ports-per-part", type=int, default=2)
+    synth_architecture_parser.add_argument("--port-defs", type=int, default=2)
+    synth_architecture_parser.add_argument("--attributes-per-port", type=int, default=2)
+    synth_architecture_parser.add_argument("--parameters-per-part", type=int, default=2)
+    synth_architecture_parser.add_argument(
+        "--list-length",
+        type=int,
+        default=3,
+        help="Length of the list attribute of every part definition (0 for none).",
+    )
+    synth_ssd_parser = synth_subparsers.add_parser("ssd", help="Write a synthetic SSD")
+    synth_ssd_parser.add_argument(
+        "--output", type=Path, required=True, help="Path of the SSD to write."
+    )
+    synth_ssd_parser.add_argument("--components", type=int, default=10)
+    synth_ssd_parser.add_argument("--component-types", type=int, default=5)
+    synth_ssd_parser.add_argument("--ports-per-component", type=int, default=2)
+    synth_ssd_parser.add_argument("--attributes-per-port", type=int, default=2)
+    synth_ssd_parser.add_argument(
+        "--list-length",
+        type=int,
+        default=0,
+        help="Number of indexed X[i] attributes added to every dotted port.",
+    )
+    synth_ssd_parser.add_argument("--scalar-connectors", type=int, default=1)
+    synth_ssd_parser.add_argument(
+        "--fan-out", type=int, default=2, help="Number of inputs fed by every output."
+    )
+    for synth_subparser in (synth_architecture_parser, synth_ssd_parser):
+        synth_subparser.add_argument(
+            "--connection-density",
+            type=float,
+            default=1.0,
+            help="Fraction of possible connections to emit.",
+        )
+        synth_subparser.add_argument(
+            "--seed", type=int, default=0, help="Seed; equal seeds give identical files."
+        )
 
-        if args.command == "sync" and args.artifact == "ssd":
-            written = sync_sysml_from_ssd(
-                architecture_path=args.architecture,
-                ssd_path=args.ssd,
-                composition=args.composition,
-                output_architecture_dir=args.output_architecture_dir,
-            )
-            for path in written:
-                print(f"Wrote {path}")
-            return 0
+    args = parser.parse_args(argv)
+    previous_cache = get_disk_cache()
+    previous_timestamp = get_generation_timestamp()
+    set_disk_cache(_disk_cache_from_args(args))
+    if getattr(args, "timestamp", None) is not None:
+        set_generation_timestamp(args.timestamp)
+
+    profiler = None
+    try:
+        with ExitStack() as stack:
+            if getattr(args, "trace", None) is not None:
+                stack.enter_context(tracing(args.trace))
+            if getattr(args, "memory_report", False):
+                from pyssp_sysml2.memory import memory_profiling
 
+                profiler = stack.enter_context(memory_profiling())
+            code = _run(args)
     except Exception as exc:  # noqa: BLE001
         print(f"[error] {exc}")
-        return 1
+        code = 1
+    finally:
+        set_disk_cache(previous_cache)
+        set_generation_timestamp(previous_timestamp)
 
-    parser.print_help()
-    return 1
+    if profiler is not None:
+        for line in profiler.report().format():
+            print(line)
+    if code is None:
+        parser.print_help()
+        return 1
+    return code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""Structured progress events emitted by the generators.
+
+Every generator accepts an optional ``observer`` callable that receives a
+:class:`GenerationEvent` when a component starts and finishes and when an
+output file is written (or skipped by incremental mode). Raising from the
+observer, typically :class:`GenerationCancelled`, stops the generator. With
+``parallel=True`` the observer is called from several threads.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+COMPONENT_STARTED = "component_started"
+COMPONENT_FINISHED = "component_finished"
+FILE_WRITTEN = "file_written"
+FILE_SKIPPED = "file_skipped"
+
+_NULL_COMPONENT = nullcontext()
+
+
+@dataclass(frozen=True)
+class GenerationEvent:
+    """One progress event.
+
+    ``index`` and ``total`` count components of the current generator run,
+    starting at 1. ``duration`` is the component's run time for
+    ``component_finished`` and the time since the generator started for file
+    events.
+    """
+
+    kind: str
+    generator: str
+    name: str = ""
+    index: int = 0
+    total: int = 0
+    duration: float = 0.0
+    path: Optional[Path] = None
+
+
+Observer = Callable[[GenerationEvent], None]
+
+
+class GenerationCancelled(Exception):
+    """Raised from an observer to stop a running generator."""
+
+
+class Progress:
+    """Emits the events of one generator run; every method is a no-op without an observer."""
+
+    def __init__(self, observer: Optional[Observer], generator: str, total: int = 0) -> None:
+        self.observer = observer
+        self.generator = generator
+        self.total = total
+        self.count = 0
+        self.started = time.perf_counter()
+
+    def component(self, name: str):
+        """Context manager emitting ``component_started`` and ``component_finished``."""
+        if self.observer is None:
+            return _NULL_COMPONENT
+        self.count += 1
+        return _ComponentEvents(self, name, self.count)
+
+    def file_written(self, path: Path, skipped: bool = False) -> None:
+        if self.observer is None:
+            return
+        self.observer(
+            GenerationEvent(
+                kind=FILE_SKIPPED if skipped else FILE_WRITTEN,
+                generator=self.generator,
+                name=str(path),
+                index=self.count,
+                total=self.total,
+                duration=time.perf_counter() - self.started,
+                path=path,
+            )
+        )
+
+
+class _ComponentEvents:
+    __slots__ = ("progress", "name", "index", "started")
+
+    def __init__(self, progress: Progress, name: str, index: int) -> None:
+        self.progress = progress
+        self.name = name
+        self.index = index
+
+    def __enter__(self) -> None:
+        progress = self.progress
+        progress.observer(
+            GenerationEvent(
+                kind=COMPONENT_STARTED,
+                generator=progress.generator,
+                name=self.name,
+                index=self.index,
+                total=progress.total,
+            )
+        )
+        self.started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            return
+        progress = self.progress
+        progress.observer(
+            GenerationEvent(
+                kind=COMPONENT_FINISHED,
+                generator=progress.generator,
+                name=self.name,
+                index=self.index,
+                total=progress.total,
+                duration=time.perf_counter() - self.started,
+            )
+        )
+
+
+def cancel_after(seconds: float, observer: Optional[Observer] = None) -> Observer:
+    """Return an observer that forwards to ``observer`` and cancels once ``seconds`` elapsed."""
+    deadline = time.monotonic() + seconds
+
+    def check(event: GenerationEvent) -> None:
+        if observer is not None:
+            observer(event)
+        if time.monotonic() > deadline:
+            raise GenerationCancelled(
+                f"{event.generator} generation cancelled after {seconds:g}s"
+            )
+
+    return check
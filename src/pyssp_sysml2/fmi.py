@@ -1,21 +1,47 @@
 """Generic FMI modelDescription generation helpers."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import io
+import multiprocessing
+import shutil
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 from uuid import NAMESPACE_URL, uuid5
-import xml.etree.ElementTree as ET
 
-from pycps_sysmlv2 import NodeType, SysMLPartDefinition, SysMLParser
-
-from pyssp_sysml2.fmi_helpers import format_value, map_fmi_type
-from pyssp_sysml2.paths import BUILD_DIR, ensure_directory
+from pycps_sysmlv2 import NodeType, SysMLPartDefinition
+
+from pyssp_sysml2.architecture import load_composition, resolve_model
+from pyssp_sysml2.events import Observer, Progress
+from pyssp_sysml2.fmi_helpers import (
+    FMI3_TYPE_MAP,
+    fmu_filename,
+    format_value,
+    format_values,
+    map_fmi_type,
+)
+from pyssp_sysml2.manifest import (
+    GenerationManifest,
+    digest,
+    part_definition_fingerprint,
+    part_definition_sources,
+)
+from pyssp_sysml2.paths import ensure_directory, write_if_changed
+from pyssp_sysml2.timestamps import format_generation_timestamp
+from pyssp_sysml2.trace import span
+from pyssp_sysml2.vr_map import ValueReferenceMap, vr_map_path
 
 CO_SIMULATION_ATTRS = {
     "modelIdentifier": "",
 }
+FMI_VERSIONS = ("2.0", "3.0")
+WRITE_BUFFER_SIZE = 1 << 16
+# Earliest date a zip entry can carry.
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
 
 
 @dataclass
@@ -28,92 +54,214 @@ class VariableSpec:
     variability: Optional[str] = None
     description: Optional[str] = None
     start_value: Optional[str] = None
+    # Set on FMI 3.0 array variables instead of start_value
+    start_values: Optional[list[str]] = None
 
+    @property
+    def dimension(self) -> Optional[int]:
+        return None if self.start_values is None else len(self.start_values)
 
-def _port_attribute_variables(
-    part: SysMLPartDefinition, starting_ref: int, starting_index: int
-) -> tuple[list[VariableSpec], int, int]:
-    variables: list[VariableSpec] = []
-    value_ref = starting_ref
-    value_index = starting_index
 
+def _port_attribute_variables(
+    part: SysMLPartDefinition, numbers: Iterator[int]
+) -> Iterator[VariableSpec]:
     for port in part.refs(NodeType.Port).values():
         port_def = port.ref_node
         if port_def is None:
             raise ValueError(f"Unresolved port definition for {part.name}.{port.name}")
         for attr in port_def.defs(NodeType.Attribute).values():
-            spec = VariableSpec(
+            number = next(numbers)
+            yield VariableSpec(
                 name=f"{port.name}.{attr.name}",
                 causality="input" if port.direction == "in" else "output",
-                value_reference=value_ref,
+                value_reference=number,
                 fmi_type=map_fmi_type(attr.type.as_string()),
                 description=attr.doc or port.doc or port_def.doc,
-                index=value_index,
+                index=number + 1,
             )
-            variables.append(spec)
-            value_ref += 1
-            value_index += 1
-
-    return variables, value_ref, value_index
 
 
 def _parameter_variables(
-    part: SysMLPartDefinition, starting_ref: int, starting_index: int
-) -> tuple[list[VariableSpec], int, int]:
-    variables: list[VariableSpec] = []
-    value_ref = starting_ref
-    value_index = starting_index
+    part: SysMLPartDefinition, numbers: Iterator[int], arrays: bool = False
+) -> Iterator[VariableSpec]:
+    """Yield one variable per parameter.
 
+    List attributes become one variable per element named ``name[idx]``, or
+    with ``arrays`` a single array variable holding every element.
+    """
     for _attr_name, attr in part.defs(NodeType.Attribute).items():
-        if attr.is_list():
+        if attr.is_list() and arrays:
             list_item_type = map_fmi_type(attr.type.as_string())
-            for idx, item in enumerate(attr.value, start=0):
-                variables.append(
-                    VariableSpec(
-                        name=f"{attr.name}[{idx}]",
-                        causality="parameter",
-                        value_reference=value_ref,
-                        fmi_type=list_item_type,
-                        variability="fixed",
-                        description=attr.doc,
-                        start_value=format_value(list_item_type, item),
-                        index=value_index,
-                    )
-                )
-                value_ref += 1
-                value_index += 1
-            continue
-
-        fmi_type = map_fmi_type(attr.type.as_string())
-        variables.append(
-            VariableSpec(
+            number = next(numbers)
+            yield VariableSpec(
                 name=attr.name,
                 causality="parameter",
-                value_reference=value_ref,
-                fmi_type=fmi_type,
+                value_reference=number,
+                fmi_type=list_item_type,
                 variability="fixed",
                 description=attr.doc,
-                start_value=format_value(fmi_type, attr.value),
-                index=value_index,
+                start_values=format_values(list_item_type, attr.value),
+                index=number + 1,
             )
+            continue
+        if attr.is_list():
+            list_item_type = map_fmi_type(attr.type.as_string())
+            starts = format_values(list_item_type, attr.value)
+            for idx, start_value in enumerate(starts, start=0):
+                number = next(numbers)
+                yield VariableSpec(
+                    name=f"{attr.name}[{idx}]",
+                    causality="parameter",
+                    value_reference=number,
+                    fmi_type=list_item_type,
+                    variability="fixed",
+                    description=attr.doc,
+                    start_value=start_value,
+                    index=number + 1,
+                )
+            continue
+
+        fmi_type = map_fmi_type(attr.type.as_string())
+        number = next(numbers)
+        yield VariableSpec(
+            name=attr.name,
+            causality="parameter",
+            value_reference=number,
+            fmi_type=fmi_type,
+            variability="fixed",
+            description=attr.doc,
+            start_value=format_value(fmi_type, attr.value),
+            index=number + 1,
+        )
+
+
+def _iter_variables(part: SysMLPartDefinition, arrays: bool = False) -> Iterator[VariableSpec]:
+    """Yield the parameters, then the port attributes, numbered in that order.
+
+    Value references start at 0 and ModelVariables indices at 1. ``arrays``
+    keeps list attributes as single array variables, as FMI 3.0 writes them.
+    """
+    numbers = count()
+    yield from _parameter_variables(part, numbers, arrays)
+    yield from _port_attribute_variables(part, numbers)
+
+
+def _get_variables(part: SysMLPartDefinition, arrays: bool = False) -> list[VariableSpec]:
+    return list(_iter_variables(part, arrays))
+
+
+def get_model_variables(part: SysMLPartDefinition, fmi_version: str = "2.0") -> list[VariableSpec]:
+    """Return the variables written for ``part``, numbered as without a value-reference map."""
+    return _get_variables(part, arrays=fmi_version == "3.0")
+
+
+def _mapped_variables(
+    part: SysMLPartDefinition, arrays: bool, vr_map_dir: Path
+) -> list[VariableSpec]:
+    """Collect the variables with value references from the part's saved map.
+
+    ModelVariables indices keep following the variable order.
+    """
+    variables = _get_variables(part, arrays)
+    vr_map = ValueReferenceMap.for_part(vr_map_dir, part.name)
+    references = vr_map.allocate(variable.name for variable in variables)
+    for variable in variables:
+        variable.value_reference = references[variable.name]
+    vr_map.save()
+    return variables
+
+
+@dataclass
+class ModelDescriptionSpec:
+    """Everything needed to render one modelDescription.xml.
+
+    ``variables`` is a list when the spec goes to a worker process, and a lazy
+    iterator otherwise, so the writer can stream variables as they are produced.
+    """
+
+    package_name: str
+    part_name: str
+    description: str = ""
+    generated_at: str = ""
+    variables: Iterable[VariableSpec] = field(default_factory=list)
+    fmi_version: str = "2.0"
+
+
+def _model_description_spec(
+    part: SysMLPartDefinition,
+    package_name: str,
+    lazy: bool = False,
+    fmi_version: str = "2.0",
+    vr_map_dir: Optional[Path] = None,
+) -> ModelDescriptionSpec:
+    """Build the spec of ``part``; with ``lazy`` its variables are produced while it is written."""
+    arrays = fmi_version == "3.0"
+    with span("build model description", part=part.name):
+        if vr_map_dir is not None:
+            with span("collect variables", part=part.name):
+                variables: Iterable[VariableSpec] = _mapped_variables(part, arrays, vr_map_dir)
+        elif lazy:
+            variables = _iter_variables(part, arrays)
+        else:
+            with span("collect variables", part=part.name):
+                variables = _get_variables(part, arrays)
+        return ModelDescriptionSpec(
+            package_name=package_name,
+            part_name=part.name,
+            description=part.doc or "",
+            generated_at=format_generation_timestamp(),
+            variables=variables,
+            fmi_version=fmi_version,
         )
-        value_ref += 1
-        value_index += 1
 
-    return variables, value_ref, value_index
 
+# Same escaping as ElementTree, so the streamed output matches ET.tostring byte for byte.
+_ATTRIBUTE_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\r": "&#13;",
+        "\n": "&#10;",
+        "\t": "&#09;",
+    }
+)
 
-def _get_variables(part: SysMLPartDefinition) -> list[VariableSpec]:
-    value_ref = 0
-    index = 1
 
-    parameter_vars, value_ref, index = _parameter_variables(part, value_ref, index)
-    port_vars, value_ref, index = _port_attribute_variables(part, value_ref, index)
+def _attributes(attrib: dict[str, str]) -> str:
+    return "".join(
+        f' {name}="{value.translate(_ATTRIBUTE_ESCAPES)}"' for name, value in attrib.items()
+    )
 
-    return parameter_vars + port_vars
+
+def _root_attributes(spec: ModelDescriptionSpec) -> dict[str, str]:
+    guid = str(uuid5(NAMESPACE_URL, f"pyssp_sysml2/{spec.package_name}/{spec.part_name}"))
+    if spec.fmi_version == "3.0":
+        return {
+            "fmiVersion": "3.0",
+            "modelName": f"{spec.package_name}.{spec.part_name}",
+            "instantiationToken": f"{{{guid}}}",
+            "description": spec.description,
+            "version": "1.0",
+            "generationTool": "pyssp_sysml2 tooling",
+            "generationDateAndTime": spec.generated_at,
+            "variableNamingConvention": "structured",
+        }
+    return {
+        "fmiVersion": "2.0",
+        "modelName": f"{spec.package_name}.{spec.part_name}",
+        "guid": f"{{{guid}}}",
+        "description": spec.description,
+        "version": "1.0",
+        "generationTool": "pyssp_sysml2 tooling",
+        "generationDateAndTime": spec.generated_at,
+        "variableNamingConvention": "structured",
+        "numberOfEventIndicators": "0",
+    }
 
 
-def _write_scalar_variable(parent: ET.Element, spec: VariableSpec) -> None:
+def _scalar_variable_attributes(spec: VariableSpec) -> dict[str, str]:
     attrib = {
         "name": spec.name,
         "valueReference": str(spec.value_reference),
@@ -124,80 +272,545 @@ def _write_scalar_variable(parent: ET.Element, spec: VariableSpec) -> None:
         attrib["variability"] = spec.variability
     if spec.description:
         attrib["description"] = spec.description
-
-    scalar = ET.SubElement(parent, "ScalarVariable", attrib=attrib)
-    data_type = ET.SubElement(scalar, spec.fmi_type)
-    if spec.start_value is not None:
-        data_type.set("start", spec.start_value)
+    return attrib
+
+
+def _indentation(compact: bool) -> Callable[[int], str]:
+    """Return the whitespace that precedes an element at each depth; none when ``compact``."""
+    # The documents are at most four elements deep.
+    prefixes = ["" if compact else "\n" + "  " * level for level in range(4)]
+    return prefixes.__getitem__
+
+
+def _stream_model_description(
+    spec: ModelDescriptionSpec, write: Callable[[str], object], compact: bool = False
+) -> None:
+    """Write the document one element at a time, keeping only output indices in memory.
+
+    The indented layout is the one of ``ET.indent(space="  ")`` followed by
+    ``ET.tostring(xml_declaration=True)``; ``compact`` drops the whitespace
+    between elements. Indenting happens as elements are rendered, and lazy
+    variables are produced as they are written, so both are part of the
+    "serialize xml" span.
+    """
+    newline = _indentation(compact)
+    with span("serialize xml", part=spec.part_name):
+        if spec.fmi_version == "3.0":
+            _serialize_fmi3_model_description(spec, write, newline)
+        else:
+            _serialize_model_description(spec, write, newline)
+
+
+def _serialize_model_description(
+    spec: ModelDescriptionSpec, write: Callable[[str], object], newline: Callable[[int], str]
+) -> None:
+    co_sim_attrs = dict(CO_SIMULATION_ATTRS)
+    co_sim_attrs["modelIdentifier"] = spec.part_name
+
+    write("<?xml version='1.0' encoding='utf-8'?>\n")
+    write(f"<fmiModelDescription{_attributes(_root_attributes(spec))}>")
+    write(f"{newline(1)}<CoSimulation{_attributes(co_sim_attrs)} />")
+
+    outputs: list[int] = []
+    opened = False
+    for variable in spec.variables:
+        if not opened:
+            write(f"{newline(1)}<ModelVariables>")
+            opened = True
+        data_type = {} if variable.start_value is None else {"start": variable.start_value}
+        write(
+            f"{newline(2)}<ScalarVariable{_attributes(_scalar_variable_attributes(variable))}>"
+            f"{newline(3)}<{variable.fmi_type}{_attributes(data_type)} />"
+            f"{newline(2)}</ScalarVariable>"
+        )
+        if variable.causality == "output":
+            outputs.append(variable.index)
+    write(f"{newline(1)}</ModelVariables>" if opened else f"{newline(1)}<ModelVariables />")
+
+    write(f"{newline(1)}<ModelStructure>")
+    for tag in ("Outputs", "InitialUnknowns"):
+        if not outputs:
+            write(f"{newline(2)}<{tag} />")
+            continue
+        write(f"{newline(2)}<{tag}>")
+        for index in outputs:
+            write(f'{newline(3)}<Unknown index="{index}" />')
+        write(f"{newline(2)}</{tag}>")
+    write(f"{newline(1)}</ModelStructure>")
+    write(f"{newline(0)}</fmiModelDescription>")
+
+
+def _fmi3_variable(variable: VariableSpec, newline: Callable[[int], str]) -> str:
+    """Render one FMI 3.0 variable element, e.g. ``<Float64 ... start="1 2">``.
+
+    Numeric and Boolean start values are attributes, space-separated for
+    arrays; String start values are ``<Start>`` children, one per element.
+    """
+    tag = FMI3_TYPE_MAP[variable.fmi_type]
+    attrib = _scalar_variable_attributes(variable)
+    if variable.start_values is not None:
+        starts = variable.start_values
+    elif variable.start_value is not None:
+        starts = [variable.start_value]
+    else:
+        starts = []
+    # The schema puts <Dimension> before <Start>.
+    children = []
+    if variable.dimension is not None:
+        children.append(f'<Dimension start="{variable.dimension}" />')
+    if tag == "String":
+        children += [f'<Start{_attributes({"value": value})} />' for value in starts]
+    elif starts:
+        attrib["start"] = " ".join(starts)
+    if not children:
+        return f"{newline(2)}<{tag}{_attributes(attrib)} />"
+    inner = "".join(f"{newline(3)}{child}" for child in children)
+    return f"{newline(2)}<{tag}{_attributes(attrib)}>{inner}{newline(2)}</{tag}>"
+
+
+def _serialize_fmi3_model_description(
+    spec: ModelDescriptionSpec, write: Callable[[str], object], newline: Callable[[int], str]
+) -> None:
+    """FMI 3.0 counterpart of :func:`_serialize_model_description`, in the same layout.
+
+    Variables are typed elements (``Float64``, ``Int32``, ...) and list
+    parameters are arrays with a ``<Dimension>``. ModelStructure lists the
+    outputs by value reference.
+    """
+    co_sim_attrs = dict(CO_SIMULATION_ATTRS)
+    co_sim_attrs["modelIdentifier"] = spec.part_name
+
+    write("<?xml version='1.0' encoding='utf-8'?>\n")
+    write(f"<fmiModelDescription{_attributes(_root_attributes(spec))}>")
+    write(f"{newline(1)}<CoSimulation{_attributes(co_sim_attrs)} />")
+
+    outputs: list[int] = []
+    opened = False
+    for variable in spec.variables:
+        if not opened:
+            write(f"{newline(1)}<ModelVariables>")
+            opened = True
+        write(_fmi3_variable(variable, newline))
+        if variable.causality == "output":
+            outputs.append(variable.value_reference)
+    write(f"{newline(1)}</ModelVariables>" if opened else f"{newline(1)}<ModelVariables />")
+
+    if not outputs:
+        write(f"{newline(1)}<ModelStructure />")
+    else:
+        write(f"{newline(1)}<ModelStructure>")
+        for tag in ("Output", "InitialUnknown"):
+            for value_reference in outputs:
+                write(f'{newline(2)}<{tag} valueReference="{value_reference}" />')
+        write(f"{newline(1)}</ModelStructure>")
+    write(f"{newline(0)}</fmiModelDescription>")
+
+
+def _write_model_description_file(
+    spec: ModelDescriptionSpec, output_path: Path, compact: bool = False
+) -> bool:
+    """Stream one modelDescription.xml to disk.
+
+    Returns ``False`` when the file already had exactly this content and was left untouched.
+    """
+    with span("write file", category="write", path=output_path):
+        with write_if_changed(output_path) as pending:
+            with pending.temp_path.open(
+                "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+            ) as handle:
+                _stream_model_description(spec, handle.write, compact)
+    return pending.changed
+
+
+@dataclass(frozen=True)
+class _OutputOptions:
+    compact: bool = False
+    fmu: bool = False
+    compression_level: Optional[int] = None
+    resources_dir: Optional[Path] = None
+    fmi_version: str = "2.0"
+    vr_map_dir: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        if self.fmi_version not in FMI_VERSIONS:
+            raise ValueError(
+                f"Unsupported FMI version {self.fmi_version!r}; expected one of {FMI_VERSIONS}"
+            )
 
 
-def _build_model_description_tree(
-    part: SysMLPartDefinition, package_name: str
-) -> ET.ElementTree:
-    timestamp = (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
-    guid = str(uuid5(NAMESPACE_URL, f"pyssp_sysml2/{package_name}/{part.name}"))
-
-    root = ET.Element(
-        "fmiModelDescription",
-        attrib={
-            "fmiVersion": "2.0",
-            "modelName": f"{package_name}.{part.name}",
-            "guid": f"{{{guid}}}",
-            "description": part.doc or "",
-            "version": "1.0",
-            "generationTool": "pyssp_sysml2 tooling",
-            "generationDateAndTime": timestamp,
-            "variableNamingConvention": "structured",
-            "numberOfEventIndicators": "0",
-        },
+def _output_path(output_dir: Path, part_type: str, options: _OutputOptions) -> Path:
+    if options.fmu:
+        return output_dir / fmu_filename(part_type)
+    return output_dir / part_type / "modelDescription.xml"
+
+
+def _fmu_resources(part_name: str, options: _OutputOptions) -> list[tuple[str, str]]:
+    """Return ``(archive name, file)`` pairs for ``<resources_dir>/<part_name>/**``."""
+    if options.resources_dir is None:
+        return []
+    root = options.resources_dir / part_name
+    if not root.is_dir():
+        return []
+    return [
+        (f"resources/{path.relative_to(root).as_posix()}", str(path))
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    ]
+
+
+def _zip_entry(name: str, generated_at: str, compression_level: Optional[int]) -> zipfile.ZipInfo:
+    # Fixed date, permissions and host system keep archives byte-identical
+    # across runs and platforms.
+    stamp = datetime.strptime(generated_at, "%Y-%m-%dT%H:%M:%SZ")
+    info = zipfile.ZipInfo(name, date_time=max(stamp.timetuple()[:6], ZIP_EPOCH))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3
+    info.external_attr = 0o644 << 16
+    # ZipFile.open() takes the deflate level from the entry, and ZipInfo has
+    # no public attribute for it before Python 3.13.
+    info._compresslevel = compression_level
+    return info
+
+
+def _write_fmu_archive(
+    spec: ModelDescriptionSpec,
+    output_path: Path,
+    options: _OutputOptions,
+    resources: list[tuple[str, str]],
+) -> bool:
+    """Stream modelDescription.xml and ``resources`` into an FMU zip archive."""
+    level = options.compression_level
+    with span("write FMU", category="write", path=output_path):
+        with write_if_changed(output_path) as pending:
+            with zipfile.ZipFile(pending.temp_path, "w") as archive:
+                entry = _zip_entry("modelDescription.xml", spec.generated_at, level)
+                with io.TextIOWrapper(
+                    archive.open(entry, "w"), encoding="utf-8", newline=""
+                ) as handle:
+                    _stream_model_description(spec, handle.write, options.compact)
+                for name, source in resources:
+                    entry = _zip_entry(name, spec.generated_at, level)
+                    with open(source, "rb") as src, archive.open(entry, "w") as dst:
+                        shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
+    return pending.changed
+
+
+def _write_output(
+    spec: ModelDescriptionSpec,
+    output_path: Path,
+    options: _OutputOptions,
+    resources: list[tuple[str, str]],
+) -> bool:
+    """Write one target as configured; also the entry point of worker processes."""
+    if options.fmu:
+        return _write_fmu_archive(spec, output_path, options, resources)
+    return _write_model_description_file(spec, output_path, options.compact)
+
+
+def _source_digest(
+    part_def: SysMLPartDefinition,
+    package_name: str,
+    options: _OutputOptions,
+    resources: list[tuple[str, str]],
+) -> str:
+    layout = []
+    if options.fmi_version != "2.0":
+        layout.append(f"fmi{options.fmi_version}")
+    if options.compact:
+        layout.append("compact")
+    if options.fmu:
+        stats = [(name, Path(source).stat()) for name, source in resources]
+        layout.append(
+            [
+                "fmu",
+                options.compression_level,
+                [[name, stat.st_size, stat.st_mtime_ns] for name, stat in stats],
+            ]
+        )
+    if options.vr_map_dir is not None:
+        # Covers hand edits to the map, and a map that was deleted.
+        map_path = vr_map_path(options.vr_map_dir, part_def.name)
+        map_text = map_path.read_text(encoding="utf-8") if map_path.is_file() else None
+        layout.append(["vr-map", map_text])
+    return digest("fmi", package_name, part_definition_fingerprint(part_def), *layout)
+
+
+def _record(
+    manifest: GenerationManifest,
+    output_path: Path,
+    source_digest: str,
+    part_def: SysMLPartDefinition,
+    instances: list[str],
+) -> None:
+    manifest.record(
+        output_path, source_digest, part_definition_sources(part_def), instances=instances
     )
 
-    co_sim_attrs = dict(CO_SIMULATION_ATTRS)
-    co_sim_attrs["modelIdentifier"] = part.name
-    ET.SubElement(root, "CoSimulation", attrib=co_sim_attrs)
 
-    model_vars = ET.SubElement(root, "ModelVariables")
-    variables = _get_variables(part)
-    for spec in variables:
-        _write_scalar_variable(model_vars, spec)
+def _write_model_description(
+    part_def: SysMLPartDefinition,
+    package_name: str,
+    output_path: Path,
+    manifest: Optional[GenerationManifest],
+    instances: list[str],
+    options: _OutputOptions,
+) -> bool:
+    """Write one modelDescription.xml or FMU; return ``False`` when it was left untouched.
+
+    That is the case when the manifest says it is current, or when the new
+    content equals the file on disk. The manifest entry is refreshed either
+    way, so it always lists the part instances currently sharing the file.
+    """
+    resources = _fmu_resources(part_def.name, options) if options.fmu else []
+    if manifest is not None:
+        source_digest = _source_digest(part_def, package_name, options, resources)
+        if manifest.is_current(output_path, source_digest):
+            _record(manifest, output_path, source_digest, part_def, instances)
+            return False
+
+    spec = _model_description_spec(
+        part_def,
+        package_name,
+        lazy=True,
+        fmi_version=options.fmi_version,
+        vr_map_dir=options.vr_map_dir,
+    )
+    changed = _write_output(spec, output_path, options, resources)
 
-    model_structure = ET.SubElement(root, "ModelStructure")
-    outputs_elem = ET.SubElement(model_structure, "Outputs")
-    initial_elem = ET.SubElement(model_structure, "InitialUnknowns")
+    if manifest is not None:
+        if options.vr_map_dir is not None:
+            # Allocation may have just updated the map the digest covers.
+            source_digest = _source_digest(part_def, package_name, options, resources)
+        _record(manifest, output_path, source_digest, part_def, instances)
+    return changed
 
-    for var in [x for x in variables if x.causality == "output"]:
-        ET.SubElement(outputs_elem, "Unknown", attrib={"index": str(var.index)})
-        ET.SubElement(initial_elem, "Unknown", attrib={"index": str(var.index)})
 
-    tree = ET.ElementTree(root)
-    ET.indent(tree, space="  ", level=0)
-    return tree
+# Output path -> (part definition, package name, part instances using it)
+_Targets = dict[Path, tuple[SysMLPartDefinition, str, list[str]]]
 
 
-def generate_model_descriptions(
-    architecture_path: Path,
+def _add_target(
+    targets: _Targets,
     output_dir: Path,
-    composition: str,
+    part_ref,
+    package_name: str,
+    instance: str,
+    options: _OutputOptions,
+) -> Path:
+    """Register ``instance`` with the output of its part definition and return that path."""
+    output_path = _output_path(output_dir, part_ref.type, options)
+    target = targets.get(output_path)
+    if target is None:
+        target = targets[output_path] = (part_ref.ref_node, package_name, [])
+    target[2].append(instance)
+    return output_path
+
+
+def _write_targets(
+    targets: _Targets,
+    manifest: Optional[GenerationManifest],
+    progress: Progress,
+    jobs: int,
+    options: _OutputOptions,
+) -> None:
+    if jobs > 1 and len(targets) > 1:
+        _write_targets_in_processes(targets, manifest, progress, jobs, options)
+        return
+    for output_path, (part_def, package_name, instances) in targets.items():
+        with progress.component(part_def.name):
+            changed = _write_model_description(
+                part_def, package_name, output_path, manifest, instances, options
+            )
+        progress.file_written(output_path, skipped=not changed)
+
+
+def _write_targets_in_processes(
+    targets: _Targets,
+    manifest: Optional[GenerationManifest],
+    progress: Progress,
+    jobs: int,
+    options: _OutputOptions,
+) -> None:
+    """Render and write on ``jobs`` worker processes.
+
+    The variables are collected here and the workers get plain
+    :class:`ModelDescriptionSpec` data rather than part definitions, which
+    would pickle together with the whole package they reference. Events and
+    manifest entries follow target order, whichever worker finishes first.
+
+    Workers are spawned, not forked: ``generate all --parallel`` calls this
+    from a thread, and forking a process that runs other threads can leave
+    the child holding locks no thread will release.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        submitted: list[tuple[Path, Optional[str], Optional[Future]]] = []
+        for output_path, (part_def, package_name, _instances) in targets.items():
+            resources = _fmu_resources(part_def.name, options) if options.fmu else []
+            source_digest = None
+            if manifest is not None:
+                source_digest = _source_digest(part_def, package_name, options, resources)
+                if manifest.is_current(output_path, source_digest):
+                    submitted.append((output_path, source_digest, None))
+                    continue
+            spec = _model_description_spec(
+                part_def,
+                package_name,
+                fmi_version=options.fmi_version,
+                vr_map_dir=options.vr_map_dir,
+            )
+            if source_digest is not None and options.vr_map_dir is not None:
+                source_digest = _source_digest(part_def, package_name, options, resources)
+            future = executor.submit(_write_output, spec, output_path, options, resources)
+            submitted.append((output_path, source_digest, future))
+
+        try:
+            for output_path, source_digest, future in submitted:
+                part_def, _package_name, instances = targets[output_path]
+                changed = False
+                with progress.component(part_def.name):
+                    if future is not None:
+                        changed = future.result()
+                if manifest is not None:
+                    _record(manifest, output_path, source_digest, part_def, instances)
+                progress.file_written(output_path, skipped=not changed)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
+def generate_model_descriptions_from_model(
+    model,
+    output_dir: Path,
+    composition: str | None = None,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+    compact: bool = False,
+    fmu: bool = False,
+    resources_dir: Optional[Path] = None,
+    compression_level: Optional[int] = None,
+    fmi_version: str = "2.0",
+    vr_map_dir: Optional[Path] = None,
 ) -> list[Path]:
+    """Write modelDescription.xml files from a parsed architecture package or composition.
+
+    With ``incremental`` a file is only rewritten when its part definition or
+    one of its port definitions changed since the last recorded run.
+    Each part definition is rendered once, however many parts instantiate it;
+    the incremental manifest lists those instances. ``observer`` receives an
+    event per part definition and per file. ``jobs`` greater than one renders
+    and writes the files on that many worker processes. ``compact`` writes the
+    XML without indentation.
+
+    With ``fmu`` each part definition gets ``<output_dir>/<fmu_filename>``, a
+    zip archive with ``modelDescription.xml`` streamed straight into it and the
+    files under ``<resources_dir>/<part definition>/`` stored below
+    ``resources/``. ``compression_level`` (0-9) sets the deflate level.
+
+    ``fmi_version`` "3.0" writes FMI 3.0 model descriptions, where a list
+    attribute is one array variable with a ``<Dimension>`` and space-separated
+    start values instead of one variable per element.
+
+    With ``vr_map_dir`` value references come from ``<vr_map_dir>/<part
+    definition>.vr.json``, so they survive added and removed attributes; see
+    :mod:`pyssp_sysml2.vr_map`.
+
+    Returns one path per part definition, in order of first use in the composition.
+    """
+    options = _OutputOptions(
+        compact, fmu, compression_level, resources_dir, fmi_version, vr_map_dir
+    )
+    system = resolve_model(model, composition)
+    ensure_directory(output_dir)
+    manifest = GenerationManifest.for_output_dir(output_dir) if incremental else None
+
+    targets: _Targets = {}
+    for part_inst_name, part_ref in system.refs(NodeType.Part).items():
+        _add_target(targets, output_dir, part_ref, system.name, part_inst_name, options)
+
+    _write_targets(targets, manifest, Progress(observer, "fmi", total=len(targets)), jobs, options)
+
+    if manifest is not None:
+        manifest.save()
+    return list(targets)
+
+
+def generate_model_descriptions_for_compositions(
+    systems: list[SysMLPartDefinition],
+    output_dir: Path,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+    compact: bool = False,
+    fmu: bool = False,
+    resources_dir: Optional[Path] = None,
+    compression_level: Optional[int] = None,
+    fmi_version: str = "2.0",
+    vr_map_dir: Optional[Path] = None,
+) -> dict[str, list[Path]]:
+    """Write the modelDescription.xml files of several compositions into one directory.
+
+    A component type used by more than one composition is written once, by the
+    first composition that references it. Options are those of
+    :func:`generate_model_descriptions_from_model`. Returns the paths used by
+    each composition, keyed by composition name.
+    """
+    options = _OutputOptions(
+        compact, fmu, compression_level, resources_dir, fmi_version, vr_map_dir
+    )
     ensure_directory(output_dir)
-    ensure_directory(BUILD_DIR / "fmu_pre")
+    manifest = GenerationManifest.for_output_dir(output_dir) if incremental else None
+
+    targets: _Targets = {}
+    per_composition: dict[str, list[Path]] = {}
+    for system in systems:
+        paths = per_composition.setdefault(system.name, [])
+        for part_inst_name, part_ref in system.refs(NodeType.Part).items():
+            output_path = _add_target(
+                targets,
+                output_dir,
+                part_ref,
+                system.name,
+                f"{system.name}.{part_inst_name}",
+                options,
+            )
+            if output_path not in paths:
+                paths.append(output_path)
 
-    system = SysMLParser(architecture_path).parse().get_def(NodeType.Part, composition)
+    _write_targets(targets, manifest, Progress(observer, "fmi", total=len(targets)), jobs, options)
 
-    written: list[Path] = []
-    for _part_inst_name, part_ref in system.refs(NodeType.Part).items():
-        part_def = part_ref.ref_node
-        component_dir = output_dir / part_ref.type
-        output_path = component_dir / "modelDescription.xml"
-        ensure_directory(component_dir)
+    if manifest is not None:
+        manifest.save()
+    return per_composition
 
-        tree = _build_model_description_tree(part_def, system.name)
-        tree.write(output_path, encoding="utf-8", xml_declaration=True)
-        written.append(output_path)
 
-    return written
+def generate_model_descriptions(
+    architecture_path: Path,
+    output_dir: Path,
+    composition: str,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+    compact: bool = False,
+    fmu: bool = False,
+    resources_dir: Optional[Path] = None,
+    compression_level: Optional[int] = None,
+    fmi_version: str = "2.0",
+    vr_map_dir: Optional[Path] = None,
+) -> list[Path]:
+    system = load_composition(architecture_path, composition)
+    return generate_model_descriptions_from_model(
+        system,
+        output_dir,
+        incremental=incremental,
+        observer=observer,
+        jobs=jobs,
+        compact=compact,
+        fmu=fmu,
+        resources_dir=resources_dir,
+        compression_level=compression_level,
+        fmi_version=fmi_version,
+        vr_map_dir=vr_map_dir,
+    )
@@ -1,7 +1,9 @@
 """Utility helpers for working with FMI artifacts derived from Modelica classes."""
 from __future__ import annotations
 
-from typing import Dict, Optional
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Optional
 
 
 def fmu_filename(modelica_class: str) -> str:
@@ -31,6 +33,14 @@ FMI_TYPE_MAP = {
     "string": "String",
 }
 
+# FMI 3.0 element for each FMI 2.0 primitive
+FMI3_TYPE_MAP = {
+    "Real": "Float64",
+    "Integer": "Int32",
+    "Boolean": "Boolean",
+    "String": "String",
+}
+
 def map_fmi_type(type_name: Optional[str], default: str = "Real") -> str:
     """Return a canonical primitive name (Real/Integer/Boolean/String) for SysML types."""
     if not type_name:
@@ -55,6 +65,32 @@ def format_value(tag: str, literal):
         return str(literal)
     raise Exception("[format_value] Unknown tag")
 
+# array typecodes that convert a whole Real/Integer list in C
+_ARRAY_TYPECODES = {"Real": "d", "Integer": "q"}
+
+def format_values(tag: str, literals: Iterable) -> list[str]:
+    """Return ``[format_value(tag, item) for item in literals]``, formatted in one pass.
+
+    Real and Integer lists are packed into an ``array`` so the numeric
+    conversion runs in C; lists ``array`` rejects (strings, ``None``, floats
+    in an Integer list, out-of-range values) fall back to ``format_value``
+    per element.
+    """
+    literals = list(literals)
+    typecode = _ARRAY_TYPECODES.get(tag)
+    if typecode is not None:
+        try:
+            packed = array(typecode, literals)
+        except (TypeError, OverflowError):
+            pass
+        else:
+            if tag == "Real":
+                return list(map(format, packed, repeat("g")))
+            return list(map(str, packed))
+    if tag == "Boolean" and None not in literals:
+        return ["true" if literal else "false" for literal in literals]
+    return [format_value(tag, literal) for literal in literals]
+
 def to_fmi_direction_definition(dir: str):
     if dir == "in":
         return "input"
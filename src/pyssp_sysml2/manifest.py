@@ -0,0 +1,164 @@
+"""Dependency manifest for incremental artifact regeneration.
+
+The manifest maps every generated output to the SysML definitions it was
+built from and a digest of their content. An incremental run rebuilds an
+output only when that digest changed or the output file is missing.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from pycps_sysmlv2 import NodeType, SysMLPartDefinition
+
+MANIFEST_FILE_NAME = ".pyssp-manifest.json"
+MANIFEST_VERSION = 1
+
+_save_lock = threading.Lock()
+
+
+def _attribute_fingerprint(attr) -> list:
+    return [attr.name, attr.type.as_string(), repr(attr.value), attr.doc]
+
+
+def port_definition_fingerprint(port_def) -> list:
+    return [
+        port_def.name,
+        port_def.doc,
+        [_attribute_fingerprint(attr) for attr in port_def.defs(NodeType.Attribute).values()],
+    ]
+
+
+def part_definition_fingerprint(part: SysMLPartDefinition) -> list:
+    ports = []
+    for port in part.refs(NodeType.Port).values():
+        port_def = port.ref_node
+        ports.append(
+            [
+                port.name,
+                port.direction,
+                port.type,
+                port.doc,
+                None if port_def is None else port_definition_fingerprint(port_def),
+            ]
+        )
+    return [
+        part.name,
+        part.doc,
+        [_attribute_fingerprint(attr) for attr in part.defs(NodeType.Attribute).values()],
+        ports,
+    ]
+
+
+def composition_fingerprint(system: SysMLPartDefinition) -> list:
+    parts = [
+        [name, part_ref.type, part_definition_fingerprint(part_ref.ref_node)]
+        for name, part_ref in system.refs(NodeType.Part).items()
+    ]
+    connections = [
+        [conn.src_part, conn.src_port, conn.dst_part, conn.dst_port]
+        for conn in system.defs(NodeType.Connection).values()
+    ]
+    return [system.name, parts, connections]
+
+
+def parameter_set_fingerprint(system: SysMLPartDefinition) -> list:
+    parts = [
+        [
+            name,
+            [_attribute_fingerprint(attr) for attr in part_ref.ref_node.defs(NodeType.Attribute).values()],
+        ]
+        for name, part_ref in system.refs(NodeType.Part).items()
+    ]
+    return [system.name, parts]
+
+
+def part_definition_sources(part: SysMLPartDefinition) -> list[str]:
+    """Return the definitions a part's modelDescription.xml is generated from."""
+    port_defs = sorted(
+        {port.type for port in part.refs(NodeType.Port).values() if port.type is not None}
+    )
+    return [f"part def {part.name}", *(f"port def {name}" for name in port_defs)]
+
+
+def digest(*fingerprint) -> str:
+    from pyssp_sysml2 import __version__
+
+    payload = json.dumps([__version__, *fingerprint], default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationManifest:
+    """Outputs of previous runs and the source digests they were generated from."""
+
+    def __init__(self, path: Path, entries: Optional[dict[str, dict]] = None):
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self._updates: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "GenerationManifest":
+        return cls(path, cls._read_entries(path))
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> "GenerationManifest":
+        return cls.load(output_dir / MANIFEST_FILE_NAME)
+
+    @staticmethod
+    def _read_entries(path: Path) -> dict[str, dict]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return dict(data.get("outputs", {}))
+
+    def _key(self, output_path: Path) -> str:
+        try:
+            return output_path.resolve().relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return str(output_path.resolve())
+
+    def is_current(self, output_path: Path, source_digest: str) -> bool:
+        entry = self.entries.get(self._key(output_path))
+        return entry is not None and entry["digest"] == source_digest and output_path.exists()
+
+    def record(
+        self,
+        output_path: Path,
+        source_digest: str,
+        sources: list[str],
+        instances: Optional[list[str]] = None,
+    ) -> None:
+        """Remember an output's digest, its source definitions and the part instances using it."""
+        entry: dict = {"digest": source_digest, "sources": sources}
+        if instances is not None:
+            entry["instances"] = instances
+        key = self._key(output_path)
+        self.entries[key] = entry
+        self._updates[key] = entry
+
+    def save(self) -> None:
+        """Merge recorded entries into the manifest file on disk."""
+        if not self._updates:
+            return
+        with _save_lock:
+            entries = self._read_entries(self.path)
+            entries.update(self._updates)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            temp.write_text(
+                json.dumps(
+                    {"version": MANIFEST_VERSION, "outputs": dict(sorted(entries.items()))},
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(temp, self.path)
+            self.entries = entries
+            self._updates = {}
@@ -0,0 +1,189 @@
+"""Per-stage peak and retained memory of the generators, measured with tracemalloc.
+
+Usage::
+
+    from pyssp_sysml2.memory import memory_profiling
+
+    with memory_profiling() as profiler:
+        generate_all(architecture, output_dir, composition)
+    print("\\n".join(profiler.report().format()))
+
+Stages are the spans of :mod:`pyssp_sysml2.trace`. Per stage, the report
+gives the peak above the memory in use when the stage started, and the memory
+the stage still held when it ended. It also lists the allocation sites that
+hold the most memory at the highest point seen when a stage ended.
+tracemalloc makes the profiled run several times slower.
+"""
+from __future__ import annotations
+
+import fnmatch
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from pyssp_sysml2 import trace
+from pyssp_sysml2.trace import add_collector, remove_collector
+
+DEFAULT_TOP_SITES = 10
+# Take a new high-water snapshot only after memory grew by this factor, so
+# steadily growing stages do not snapshot on every exit.
+HIGH_WATER_STEP = 1.1
+_IGNORED_FILES = (
+    __file__,
+    trace.__file__,
+    tracemalloc.__file__,
+    threading.__file__,
+    fnmatch.__file__,
+    "<frozen importlib._bootstrap>",
+)
+
+
+@dataclass
+class StageMemory:
+    name: str
+    calls: int = 0
+    peak: int = 0
+    retained: int = 0
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak: int
+    stages: list[StageMemory] = field(default_factory=list)
+    top_sites: list[AllocationSite] = field(default_factory=list)
+    high_water_stage: Optional[str] = None
+
+    def format(self) -> list[str]:
+        lines = [f"Peak traced memory: {_mib(self.peak)}", ""]
+        lines.append(f"{'stage':<32} {'calls':>6} {'peak':>12} {'retained':>12}")
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name:<32} {stage.calls:>6} {_mib(stage.peak):>12} {_mib(stage.retained):>12}"
+            )
+        if self.top_sites:
+            lines.append("")
+            lines.append(f"Top allocation sites at high-water mark ({self.high_water_stage}):")
+            for site in self.top_sites:
+                lines.append(f"{_mib(site.size):>12} {site.count:>9} blocks  {site.location}")
+        return lines
+
+
+def _mib(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MiB"
+
+
+class _Frame:
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.peak = start
+
+
+class MemoryProfiler:
+    """Span collector that measures tracemalloc usage of every stage."""
+
+    def __init__(self, top: int = DEFAULT_TOP_SITES) -> None:
+        self.top = top
+        self.stages: dict[str, StageMemory] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._high_water: Optional[tracemalloc.Snapshot] = None
+        self._high_water_size = 0
+        self._high_water_stage: Optional[str] = None
+        self._peak = 0
+
+    def _stack(self) -> list[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start(self) -> None:
+        self._baseline = _snapshot()
+
+    def enter(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self._stack()
+        # tracemalloc only keeps one peak, so fold it into the open stages
+        # before resetting it for the new one.
+        for frame in stack:
+            frame.peak = max(frame.peak, peak)
+        self._peak = max(self._peak, peak)
+        tracemalloc.reset_peak()
+        stack.append(_Frame(current))
+
+    def exit(self, state: None, name: str, category: str, args: dict[str, Any]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self._stack()
+        frame = stack.pop()
+        frame.peak = max(frame.peak, peak)
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, frame.peak)
+
+        with self._lock:
+            self._peak = max(self._peak, frame.peak)
+            stage = self.stages.setdefault(name, StageMemory(name))
+            stage.calls += 1
+            stage.peak = max(stage.peak, frame.peak - frame.start)
+            stage.retained += max(current - frame.start, 0)
+            if current > self._high_water_size * HIGH_WATER_STEP:
+                self._high_water = _snapshot()
+                self._high_water_size = current
+                self._high_water_stage = name
+
+    def report(self) -> MemoryReport:
+        stages = sorted(self.stages.values(), key=lambda stage: stage.peak, reverse=True)
+        report = MemoryReport(
+            peak=self._peak, stages=stages, high_water_stage=self._high_water_stage
+        )
+        if self._high_water is not None and self._baseline is not None:
+            differences = self._high_water.compare_to(self._baseline, "lineno")
+            report.top_sites = [
+                AllocationSite(
+                    location=f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+                    size=diff.size_diff,
+                    count=diff.count_diff,
+                )
+                for diff in differences[: self.top]
+                if diff.size_diff > 0
+            ]
+        return report
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+    )
+
+
+@contextmanager
+def memory_profiling(top: int = DEFAULT_TOP_SITES) -> Iterator[MemoryProfiler]:
+    """Measure every span of the block; read the results with ``profiler.report()``.
+
+    Starts tracemalloc for the block unless it is already tracing. Stages run on
+    several threads share one tracemalloc peak, so ``parallel=True`` runs give
+    approximate per-stage numbers.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    profiler = MemoryProfiler(top)
+    profiler.start()
+    add_collector(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_collector(profiler)
+        if started:
+            tracemalloc.stop()
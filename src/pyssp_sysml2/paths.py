@@ -1,7 +1,13 @@
 """Shared path defaults and helpers for generator CLIs."""
 from __future__ import annotations
 
+import filecmp
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 PACKAGE_DIR = Path(__file__).resolve().parent
 SRC_DIR = PACKAGE_DIR.parent
@@ -14,6 +20,8 @@ DEFAULT_ARCH_PATH = BUILD_DIR / "arch"
 DEFAULT_PACKAGE_NAME = "RecoveredFromSSD"
 DEFAULT_COMPOSITION_NAME = "CompositePart"
 
+DEFAULT_POLL_INTERVAL = 0.2
+DEFAULT_DEBOUNCE = 0.3
 
 
 def ensure_directory(path: Path) -> Path:
@@ -24,3 +32,51 @@ def ensure_directory(path: Path) -> Path:
 def ensure_parent_dir(path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
+
+
+@dataclass
+class PendingOutput:
+    """A temporary file standing in for ``path`` until :func:`write_if_changed` finishes."""
+
+    path: Path
+    temp_path: Path
+    changed: bool = False
+
+
+def _temp_path(output_path: Path) -> Path:
+    return output_path.with_name(
+        f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+
+
+@contextmanager
+def write_if_changed(output_path: Path) -> Iterator[PendingOutput]:
+    """Yield a temporary path to write instead of ``output_path``.
+
+    When the block succeeds the temporary file atomically replaces
+    ``output_path``, unless both have the same content: then the existing file
+    and its mtime are kept and ``changed`` stays ``False``, so make/ninja and
+    other mtime-based caches do not rebuild.
+    """
+    ensure_parent_dir(output_path)
+    pending = PendingOutput(output_path, _temp_path(output_path))
+    try:
+        yield pending
+        if output_path.is_file() and filecmp.cmp(pending.temp_path, output_path, shallow=False):
+            pending.temp_path.unlink()
+        else:
+            os.replace(pending.temp_path, output_path)
+            pending.changed = True
+    finally:
+        pending.temp_path.unlink(missing_ok=True)
+
+
+def write_text_if_changed(output_path: Path, content: str) -> bool:
+    """Write ``content`` as UTF-8 unless the file already holds it; return whether it was written."""
+    data = content.encode("utf-8")
+    if output_path.is_file() and output_path.stat().st_size == len(data):
+        if output_path.read_bytes() == data:
+            return False
+    with write_if_changed(output_path) as pending:
+        pending.temp_path.write_bytes(data)
+    return pending.changed
@@ -0,0 +1,213 @@
+"""Generate SSD, SSV and FMI artifacts from a single parse of the architecture."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from pyssp_sysml2.architecture import (
+    load_architecture,
+    load_composition,
+    resolve_compositions,
+    resolve_model,
+)
+from pyssp_sysml2.events import Observer
+from pyssp_sysml2.fmi import (
+    generate_model_descriptions_for_compositions,
+    generate_model_descriptions_from_model,
+)
+from pyssp_sysml2.paths import ensure_directory
+from pyssp_sysml2.ssd import generate_ssd_from_model
+from pyssp_sysml2.ssv import generate_parameter_set_from_model
+
+SSD_FILE_NAME = "SystemStructure.ssd"
+SSV_FILE_NAME = "parameters.ssv"
+MODEL_DESCRIPTIONS_DIR_NAME = "model_descriptions"
+
+
+@dataclass
+class GeneratedArtifacts:
+    ssd: Path
+    ssv: Path
+    model_descriptions: list[Path]
+
+
+def generate_all_from_model(
+    model,
+    output_dir: Path,
+    composition: str | None = None,
+    type_check=True,
+    parallel: bool = False,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+) -> GeneratedArtifacts:
+    """Write the SSD, SSV and modelDescription.xml files from one parsed model.
+
+    The writers only read the parsed model, so with ``parallel`` they run
+    concurrently on a thread pool. ``incremental`` and ``observer`` are passed
+    on to every writer; ``jobs`` sets the worker processes of the FMI writer.
+    """
+    system = resolve_model(model, composition)
+    ensure_directory(output_dir)
+
+    ssd_path = output_dir / SSD_FILE_NAME
+    ssv_path = output_dir / SSV_FILE_NAME
+    fmi_dir = output_dir / MODEL_DESCRIPTIONS_DIR_NAME
+
+    if not parallel:
+        return GeneratedArtifacts(
+            ssd=generate_ssd_from_model(
+                system,
+                ssd_path,
+                type_check=type_check,
+                incremental=incremental,
+                observer=observer,
+            ),
+            ssv=generate_parameter_set_from_model(
+                system, ssv_path, incremental=incremental, observer=observer
+            ),
+            model_descriptions=generate_model_descriptions_from_model(
+                system, fmi_dir, incremental=incremental, observer=observer, jobs=jobs
+            ),
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        ssd_future = executor.submit(
+            generate_ssd_from_model,
+            system,
+            ssd_path,
+            type_check=type_check,
+            incremental=incremental,
+            observer=observer,
+        )
+        ssv_future = executor.submit(
+            generate_parameter_set_from_model,
+            system,
+            ssv_path,
+            incremental=incremental,
+            observer=observer,
+        )
+        fmi_future = executor.submit(
+            generate_model_descriptions_from_model,
+            system,
+            fmi_dir,
+            incremental=incremental,
+            observer=observer,
+            jobs=jobs,
+        )
+        return GeneratedArtifacts(
+            ssd=ssd_future.result(),
+            ssv=ssv_future.result(),
+            model_descriptions=fmi_future.result(),
+        )
+
+
+def generate_all(
+    architecture_path: Path,
+    output_dir: Path,
+    composition: str,
+    type_check=True,
+    parallel: bool = False,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+) -> GeneratedArtifacts:
+    """Parse the architecture once and write the SSD, SSV and modelDescription.xml files."""
+    system = load_composition(architecture_path, composition)
+    return generate_all_from_model(
+        system,
+        output_dir,
+        type_check=type_check,
+        parallel=parallel,
+        incremental=incremental,
+        observer=observer,
+        jobs=jobs,
+    )
+
+
+def generate_compositions_from_model(
+    architecture,
+    output_dir: Path,
+    compositions: Optional[Iterable[str]] = None,
+    type_check=True,
+    parallel: bool = False,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+) -> dict[str, GeneratedArtifacts]:
+    """Write artifacts for several compositions of one parsed architecture package.
+
+    ``compositions=None`` selects every part definition that owns part
+    references. Each composition gets ``<output_dir>/<name>/SystemStructure.ssd``
+    and ``parameters.ssv``; the modelDescription.xml files go to a shared
+    ``<output_dir>/model_descriptions`` and are written once per component type.
+    """
+    systems = resolve_compositions(architecture, compositions)
+    if not systems:
+        raise ValueError("No compositions found in the architecture")
+    ensure_directory(output_dir)
+    fmi_dir = output_dir / MODEL_DESCRIPTIONS_DIR_NAME
+
+    def write_composition(system) -> tuple[Path, Path]:
+        composition_dir = ensure_directory(output_dir / system.name)
+        ssd = generate_ssd_from_model(
+            system,
+            composition_dir / SSD_FILE_NAME,
+            type_check=type_check,
+            incremental=incremental,
+            observer=observer,
+        )
+        ssv = generate_parameter_set_from_model(
+            system, composition_dir / SSV_FILE_NAME, incremental=incremental, observer=observer
+        )
+        return ssd, ssv
+
+    if parallel:
+        with ThreadPoolExecutor() as executor:
+            fmi_future = executor.submit(
+                generate_model_descriptions_for_compositions,
+                systems,
+                fmi_dir,
+                incremental=incremental,
+                observer=observer,
+                jobs=jobs,
+            )
+            outputs = list(executor.map(write_composition, systems))
+            model_descriptions = fmi_future.result()
+    else:
+        outputs = [write_composition(system) for system in systems]
+        model_descriptions = generate_model_descriptions_for_compositions(
+            systems, fmi_dir, incremental=incremental, observer=observer, jobs=jobs
+        )
+
+    return {
+        system.name: GeneratedArtifacts(
+            ssd=ssd, ssv=ssv, model_descriptions=model_descriptions[system.name]
+        )
+        for system, (ssd, ssv) in zip(systems, outputs)
+    }
+
+
+def generate_compositions(
+    architecture_path: Path,
+    output_dir: Path,
+    compositions: Optional[Iterable[str]] = None,
+    type_check=True,
+    parallel: bool = False,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+    jobs: int = 1,
+) -> dict[str, GeneratedArtifacts]:
+    """Parse the architecture once and write artifacts for several compositions."""
+    return generate_compositions_from_model(
+        load_architecture(architecture_path),
+        output_dir,
+        compositions,
+        type_check=type_check,
+        parallel=parallel,
+        incremental=incremental,
+        observer=observer,
+        jobs=jobs,
+    )
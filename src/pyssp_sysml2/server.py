@@ -0,0 +1,241 @@
+"""Long-running JSON-RPC 2.0 server exposing the generate and sync operations.
+
+Requests and responses are single-line JSON documents, exchanged either over
+stdin/stdout or over a Unix domain socket. Parsed architectures and loaded SSD
+systems stay in memory between requests, so repeated calls skip interpreter
+startup, imports and re-parsing of unchanged inputs.
+"""
+from __future__ import annotations
+
+import json
+import socketserver
+import stat
+import sys
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Optional, TextIO
+
+from pyssp_sysml2.architecture import enable_memory_cache, memory_cache_stats
+from pyssp_sysml2.cache import DEFAULT_MAX_ENTRIES, SSDMemoryCache
+from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.pipeline import generate_all
+from pyssp_sysml2.ssd import generate_ssd
+from pyssp_sysml2.ssv import generate_parameter_set
+from pyssp_sysml2.sync import sync_sysml_from_ssd
+from pyssp_sysml2.sysml import generate_sysml_from_ssd, set_ssd_cache
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _path(params: dict, name: str, required: bool = True) -> Optional[Path]:
+    value = params.get(name)
+    if value is None:
+        if required:
+            raise RpcError(INVALID_PARAMS, f"Missing parameter '{name}'")
+        return None
+    return Path(value)
+
+
+def _composition(params: dict, required: bool = True) -> Optional[str]:
+    composition = params.get("composition")
+    if composition is None and required:
+        raise RpcError(INVALID_PARAMS, "Missing parameter 'composition'")
+    return composition
+
+
+def _generate_ssd(params: dict):
+    return str(
+        generate_ssd(
+            _path(params, "architecture"),
+            _path(params, "output"),
+            _composition(params),
+            params.get("type_check", True),
+            incremental=params.get("incremental", False),
+        )
+    )
+
+
+def _generate_ssv(params: dict):
+    return str(
+        generate_parameter_set(
+            _path(params, "architecture"),
+            _path(params, "output"),
+            _composition(params),
+            incremental=params.get("incremental", False),
+        )
+    )
+
+
+def _generate_fmi(params: dict):
+    written = generate_model_descriptions(
+        _path(params, "architecture"),
+        _path(params, "output_dir"),
+        _composition(params),
+        incremental=params.get("incremental", False),
+    )
+    return [str(path) for path in written]
+
+
+def _generate_all(params: dict):
+    artifacts = generate_all(
+        _path(params, "architecture"),
+        _path(params, "output_dir"),
+        _composition(params),
+        params.get("type_check", True),
+        parallel=params.get("parallel", False),
+        incremental=params.get("incremental", False),
+    )
+    return {
+        "ssd": str(artifacts.ssd),
+        "ssv": str(artifacts.ssv),
+        "model_descriptions": [str(path) for path in artifacts.model_descriptions],
+    }
+
+
+def _generate_sysml(params: dict):
+    return str(
+        generate_sysml_from_ssd(
+            _path(params, "ssd"), _path(params, "output"), _composition(params, required=False)
+        )
+    )
+
+
+def _sync_ssd(params: dict):
+    written = sync_sysml_from_ssd(
+        architecture_path=_path(params, "architecture"),
+        ssd_path=_path(params, "ssd"),
+        composition=_composition(params),
+        output_architecture_dir=_path(params, "output_architecture_dir", required=False),
+    )
+    return [str(path) for path in written]
+
+
+def _cache_stats(_params: dict):
+    stats = memory_cache_stats()
+    return None if stats is None else asdict(stats)
+
+
+METHODS: dict[str, Callable[[dict], object]] = {
+    "generate.ssd": _generate_ssd,
+    "generate.ssv": _generate_ssv,
+    "generate.fmi": _generate_fmi,
+    "generate.all": _generate_all,
+    "generate.sysml": _generate_sysml,
+    "sync.ssd": _sync_ssd,
+    "cache.stats": _cache_stats,
+}
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a socket left behind by an earlier server, but never any other kind of file."""
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket; refusing to replace it")
+    socket_path.unlink()
+
+
+class RpcServer:
+    """Dispatches JSON-RPC requests to the generators while keeping models warm."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        enable_memory_cache(max_entries)
+        set_ssd_cache(SSDMemoryCache(max_entries))
+        self.shutdown_requested = threading.Event()
+
+    def handle_request(self, request) -> Optional[dict]:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "Invalid JSON-RPC request")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+
+            method = request["method"]
+            if method == "shutdown":
+                self.shutdown_requested.set()
+                result = None
+            elif method in METHODS:
+                result = METHODS[method](params)
+            else:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method '{method}'")
+        except RpcError as exc:
+            return self._error(request_id, exc.code, exc.message)
+        except Exception as exc:  # noqa: BLE001 - report generator failures to the client
+            return self._error(request_id, SERVER_ERROR, str(exc))
+
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def handle_line(self, line: str) -> Optional[str]:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            return json.dumps(self._error(None, PARSE_ERROR, str(exc)))
+        response = self.handle_request(request)
+        return None if response is None else json.dumps(response)
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    def serve_stream(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        """Serve one request per line until EOF or a ``shutdown`` request."""
+        for line in input_stream:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                output_stream.write(response + "\n")
+                output_stream.flush()
+            if self.shutdown_requested.is_set():
+                break
+
+    def serve_stdio(self) -> None:
+        self.serve_stream(sys.stdin, sys.stdout)
+
+    def serve_unix_socket(self, socket_path: Path) -> None:
+        """Serve each connection on its own thread until a ``shutdown`` request."""
+        rpc = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw_line in self.rfile:
+                    line = raw_line.decode("utf-8")
+                    if not line.strip():
+                        continue
+                    response = rpc.handle_line(line)
+                    if response is not None:
+                        self.wfile.write(response.encode("utf-8") + b"\n")
+                        self.wfile.flush()
+                    if rpc.shutdown_requested.is_set():
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        return
+
+        _remove_stale_socket(socket_path)
+        with socketserver.ThreadingUnixStreamServer(str(socket_path), _Handler) as server:
+            server.daemon_threads = True
+            try:
+                server.serve_forever()
+            finally:
+                socket_path.unlink(missing_ok=True)
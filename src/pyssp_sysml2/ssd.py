@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
-from pycps_sysmlv2 import NodeType, SysMLPartDefinition, SysMLParser
+from pycps_sysmlv2 import NodeType, SysMLPartDefinition
 from pyssp_standard.common_content_ssc import (
     TypeBoolean,
     TypeInteger,
@@ -20,8 +21,13 @@ from pyssp_standard.ssd import (
     System,
 )
 
+from pyssp_sysml2.architecture import load_composition, resolve_model
+from pyssp_sysml2.events import Observer, Progress
 from pyssp_sysml2.fmi_helpers import fmu_resource_path, to_fmi_direction_definition
-from pyssp_sysml2.paths import ensure_parent_dir
+from pyssp_sysml2.manifest import GenerationManifest, composition_fingerprint, digest
+from pyssp_sysml2.paths import write_if_changed
+from pyssp_sysml2.timestamps import format_generation_timestamp
+from pyssp_sysml2.trace import span
 
 
 def _type_from_primitive(type_name: str):
@@ -36,46 +42,66 @@ def _type_from_primitive(type_name: str):
     return TypeReal(unit=None)
 
 
-def build_ssd(ssd: SSD, system: SysMLPartDefinition, type_check=True) -> None:
+def _build_component(part_name: str, part: SysMLPartDefinition) -> Component:
+    component = Component()
+    component.name = part_name
+    component.component_type = "application/x-fmu-sharedlibrary"
+    component.source = fmu_resource_path(part.name)
+
+    for port_ref in part.refs(NodeType.Port).values():
+        port_def = port_ref.ref_node
+        if port_def is None:
+            raise ValueError(
+                f"Unresolved port definition for {part.name}.{port_ref.name}"
+            )
+        for attribute in port_def.defs(NodeType.Attribute).values():
+            component.connectors.append(
+                Connector(
+                    name=f"{port_ref.name}.{attribute.name}",
+                    kind=to_fmi_direction_definition(port_ref.direction),
+                    type_=_type_from_primitive(attribute.type.as_string()),
+                )
+            )
+
+    for attrib_name, attribute in part.defs(NodeType.Attribute).items():
+        for idx, _ in attribute.enumerator():
+            name = f"{attrib_name}[{idx}]" if attribute.is_list() else attrib_name
+            component.connectors.append(
+                Connector(
+                    name=name,
+                    kind="parameter",
+                    type_=_type_from_primitive(attribute.type.as_string()),
+                )
+            )
+    return component
+
+
+def build_ssd(
+    ssd: SSD,
+    system: SysMLPartDefinition,
+    type_check=True,
+    observer: Optional[Observer] = None,
+) -> None:
     ssd.name = system.name
     ssd.version = "1.0"
     ssd.system = System(name=system.name)
 
-    for part_name, part_ref in system.refs(NodeType.Part).items():
-        part = part_ref.ref_node
-        component = Component()
-        component.name = part_name
-        component.component_type = "application/x-fmu-sharedlibrary"
-        component.source = fmu_resource_path(part.name)
-
-        for port_ref in part.refs(NodeType.Port).values():
-            port_def = port_ref.ref_node
-            if port_def is None:
-                raise ValueError(
-                    f"Unresolved port definition for {part.name}.{port_ref.name}"
-                )
-            for attribute in port_def.defs(NodeType.Attribute).values():
-                component.connectors.append(
-                    Connector(
-                        name=f"{port_ref.name}.{attribute.name}",
-                        kind=to_fmi_direction_definition(port_ref.direction),
-                        type_=_type_from_primitive(attribute.type.as_string()),
-                    )
-                )
+    parts = system.refs(NodeType.Part)
+    progress = Progress(observer, "ssd", total=len(parts))
+    for part_name, part_ref in parts.items():
+        with span("build_ssd component", component=part_name), progress.component(part_name):
+            ssd.system.elements.append(_build_component(part_name, part_ref.ref_node))
 
-        for attrib_name, attribute in part.defs(NodeType.Attribute).items():
-            for idx, _ in attribute.enumerator():
-                name = f"{attrib_name}[{idx}]" if attribute.is_list() else attrib_name
-                component.connectors.append(
-                    Connector(
-                        name=name,
-                        kind="parameter",
-                        type_=_type_from_primitive(attribute.type.as_string()),
-                    )
-                )
+    with span("build_ssd connections", count=len(system.defs(NodeType.Connection))):
+        _add_connections(ssd, system, type_check)
+
+    default_experiment = DefaultExperiment()
+    default_experiment.start_time = 0
+    default_experiment.stop_time = 3600
+    ssd.default_experiment = default_experiment
 
-        ssd.system.elements.append(component)
 
+def _add_connections(ssd: SSD, system: SysMLPartDefinition, type_check=True) -> None:
     for conn in system.defs(NodeType.Connection).values():
         src_port_def = (
             None if conn.src_port_node is None else conn.src_port_node.ref_node
@@ -102,19 +128,55 @@ def build_ssd(ssd: SSD, system: SysMLPartDefinition, type_check=True) -> None:
                 )
             )
 
-    default_experiment = DefaultExperiment()
-    default_experiment.start_time = 0
-    default_experiment.stop_time = 3600
-    ssd.default_experiment = default_experiment
+
+def generate_ssd_from_model(
+    model,
+    output_path: Path,
+    composition: str | None = None,
+    type_check=True,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+) -> Path:
+    """Write an SSD from a parsed architecture package or composition part definition.
+
+    With ``incremental`` the SSD is only rewritten when the composition changed
+    since the run recorded in the output directory's manifest. ``observer``
+    receives a :class:`~pyssp_sysml2.events.GenerationEvent` per component and
+    for the written file.
+    """
+    system = resolve_model(model, composition)
+    progress = Progress(observer, "ssd")
+    manifest = None
+    if incremental:
+        manifest = GenerationManifest.for_output_dir(output_path.parent)
+        source_digest = digest("ssd", composition_fingerprint(system), type_check)
+        if manifest.is_current(output_path, source_digest):
+            progress.file_written(output_path, skipped=True)
+            return output_path
+
+    with span("write SSD", category="write", path=output_path):
+        with write_if_changed(output_path) as pending:
+            with SSD(pending.temp_path, mode="w") as ssd:
+                ssd.top_level_metadata.generationDateAndTime = format_generation_timestamp()
+                with span("build_ssd", composition=system.name):
+                    build_ssd(ssd, system, type_check, observer=observer)
+    progress.file_written(output_path, skipped=not pending.changed)
+
+    if manifest is not None:
+        manifest.record(output_path, source_digest, [f"part def {system.name}"])
+        manifest.save()
+    return output_path
 
 
 def generate_ssd(
-    architecture_path: Path, output_path: Path, composition: str, type_check=True
+    architecture_path: Path,
+    output_path: Path,
+    composition: str,
+    type_check=True,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
 ) -> Path:
-
-    arch = SysMLParser(architecture_path).parse()
-    system = arch.get_def(NodeType.Part, composition)
-    ensure_parent_dir(output_path)
-    with SSD(output_path, mode="w") as ssd:
-        build_ssd(ssd, system, type_check)
-    return output_path
+    system = load_composition(architecture_path, composition)
+    return generate_ssd_from_model(
+        system, output_path, type_check=type_check, incremental=incremental, observer=observer
+    )
@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
-from pycps_sysmlv2 import NodeType, SysMLAttribute, SysMLParser
+from pycps_sysmlv2 import NodeType, SysMLAttribute
 from pyssp_standard.ssv import SSV
 
-from pyssp_sysml2.fmi_helpers import format_value
-from pyssp_sysml2.paths import ensure_parent_dir
+from pyssp_sysml2.architecture import load_composition, resolve_model
+from pyssp_sysml2.events import Observer, Progress
+from pyssp_sysml2.fmi_helpers import format_value, format_values
+from pyssp_sysml2.manifest import GenerationManifest, digest, parameter_set_fingerprint
+from pyssp_sysml2.paths import write_if_changed
+from pyssp_sysml2.trace import span
 
 
 def populate_parameter_set(ssv: SSV, parameter_pairs: Iterable[tuple[str, SysMLAttribute]]) -> None:
@@ -18,9 +22,8 @@ def populate_parameter_set(ssv: SSV, parameter_pairs: Iterable[tuple[str, SysMLA
             continue
 
         if isinstance(attr.value, (list, tuple)):
-            for idx, item in enumerate(attr.value, start=0):
+            for idx, formatted in enumerate(format_values(data_type, attr.value), start=0):
                 indexed_name = f"{name}[{idx}]"
-                formatted = format_value(data_type, item)
                 ssv.add_parameter(indexed_name, ptype=data_type, value=formatted)
             continue
 
@@ -38,16 +41,60 @@ def _strip_none_parameter_attrs(ssv: SSV) -> None:
         }
 
 
-def generate_parameter_set(architecture_path: Path, output_path: Path, composition: str) -> Path:
-    system = SysMLParser(architecture_path).parse().get_def(NodeType.Part, composition)
+def _part_parameters(part_name: str, part_def) -> Iterable[tuple[str, SysMLAttribute]]:
+    for attr_name, attr in part_def.defs(NodeType.Attribute).items():
+        yield f"{part_name}.{attr_name}", attr
 
-    pairs = []
-    for part_name, part in system.refs(NodeType.Part).items():
-        for attr_name, attr in part.ref_node.defs(NodeType.Attribute).items():
-            pairs.append((f"{part_name}.{attr_name}", attr))
 
-    ensure_parent_dir(output_path)
-    with SSV(output_path, mode="w", name="ArchitecturalDefaults") as ssv:
-        populate_parameter_set(ssv, pairs)
-        _strip_none_parameter_attrs(ssv)
+def generate_parameter_set_from_model(
+    model,
+    output_path: Path,
+    composition: str | None = None,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+) -> Path:
+    """Write an SSV from a parsed architecture package or composition part definition.
+
+    With ``incremental`` the SSV is only rewritten when a part attribute changed.
+    ``observer`` receives an event per component and for the written file.
+    """
+    system = resolve_model(model, composition)
+    parts = system.refs(NodeType.Part)
+    progress = Progress(observer, "ssv", total=len(parts))
+    manifest = None
+    if incremental:
+        manifest = GenerationManifest.for_output_dir(output_path.parent)
+        source_digest = digest("ssv", parameter_set_fingerprint(system))
+        if manifest.is_current(output_path, source_digest):
+            progress.file_written(output_path, skipped=True)
+            return output_path
+
+    with span("write SSV", category="write", path=output_path):
+        with write_if_changed(output_path) as pending:
+            with SSV(pending.temp_path, mode="w", name="ArchitecturalDefaults") as ssv:
+                with span("populate parameters", count=len(parts)):
+                    for part_name, part in parts.items():
+                        with progress.component(part_name):
+                            populate_parameter_set(
+                                ssv, _part_parameters(part_name, part.ref_node)
+                            )
+                    _strip_none_parameter_attrs(ssv)
+    progress.file_written(output_path, skipped=not pending.changed)
+
+    if manifest is not None:
+        manifest.record(output_path, source_digest, [f"part def {system.name}"])
+        manifest.save()
     return output_path
+
+
+def generate_parameter_set(
+    architecture_path: Path,
+    output_path: Path,
+    composition: str,
+    incremental: bool = False,
+    observer: Optional[Observer] = None,
+) -> Path:
+    system = load_composition(architecture_path, composition)
+    return generate_parameter_set_from_model(
+        system, output_path, incremental=incremental, observer=observer
+    )
@@ -2,30 +2,34 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Tuple
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
 from pycps_sysmlv2 import NodeType
 from pyssp_standard.ssd import Component
 
+from pyssp_sysml2.architecture import load_architecture, resolve_composition
+from pyssp_sysml2.events import Observer, Progress
 from pyssp_sysml2.fmi_helpers import fmu_resource_path
-from pyssp_sysml2.paths import ensure_parent_dir
+from pyssp_sysml2.paths import write_text_if_changed
 from pyssp_sysml2.sysml import (
     build_architecture_from_ssd,
     index_components,
     load_ssd_system,
     split_connector,
 )
+from pyssp_sysml2.trace import span
 
 
-def _load_architecture(architecture_path: Path):
-    try:
-        from pycps_sysmlv2 import SysMLParser
-    except ImportError as exc:  # pragma: no cover - dependency contract
-        raise RuntimeError("pycps_sysmlv2 must provide SysMLParser for sync support") from exc
-    return SysMLParser(architecture_path).parse()
+def _index_part_definitions_by_source(architecture) -> dict[str, list]:
+    index: dict[str, list] = {}
+    for part_def in architecture.defs(NodeType.Part).values():
+        index.setdefault(fmu_resource_path(part_def.name), []).append(part_def)
+    return index
 
 
-def _resolve_component_part_definition(architecture, system, component: Component):
+def _resolve_component_part_definition(
+    system, component: Component, part_defs_by_source: Mapping[str, list]
+):
     existing = system.refs(NodeType.Part).get(component.name)
     existing_part_def = None if existing is None else existing.ref_node
     if existing is not None and existing_part_def is not None:
@@ -37,11 +41,7 @@ def _resolve_component_part_definition(architecture, system, component: Componen
             f"SSD component '{component.name}' is missing a source, so its SysML part definition cannot be resolved"
         )
 
-    matches = [
-        part_def
-        for part_def in architecture.defs(NodeType.Part).values()
-        if fmu_resource_path(part_def.name) == component.source
-    ]
+    matches = part_defs_by_source.get(component.source, ())
     if not matches:
         raise ValueError(
             f"SSD component '{component.name}' references unknown part source '{component.source}'"
@@ -54,29 +54,34 @@ def _resolve_component_part_definition(architecture, system, component: Componen
     return part_def.name, part_def
 
 
-def _derive_target_parts(architecture, system, ssd_system) -> dict[str, object]:
+def _derive_target_parts(architecture, system, ssd_system, progress: Progress) -> dict[str, object]:
     from pycps_sysmlv2 import SysMLPartReference
 
     components = index_components(ssd_system)
+    progress.total = len(components)
+    part_defs_by_source = _index_part_definitions_by_source(architecture)
     target_parts = {}
     for component_name in sorted(components):
-        component = components[component_name]
-        part_name, part_def = _resolve_component_part_definition(architecture, system, component)
-        existing = system.refs(NodeType.Part).get(component_name)
-        if (
-            existing is not None
-            and existing.type == part_name
-            and existing.ref_node is part_def
-        ):
-            target_parts[component_name] = existing
-            continue
-
-        target_parts[component_name] = SysMLPartReference(
-            name=component_name,
-            type=part_name,
-            ref_node=part_def,
-            doc=getattr(existing, "doc", None),
-        )
+        with progress.component(component_name):
+            component = components[component_name]
+            part_name, part_def = _resolve_component_part_definition(
+                system, component, part_defs_by_source
+            )
+            existing = system.refs(NodeType.Part).get(component_name)
+            if (
+                existing is not None
+                and existing.type == part_name
+                and existing.ref_node is part_def
+            ):
+                target_parts[component_name] = existing
+                continue
+
+            target_parts[component_name] = SysMLPartReference(
+                name=component_name,
+                type=part_name,
+                ref_node=part_def,
+                doc=getattr(existing, "doc", None),
+            )
     return target_parts
 
 
@@ -183,34 +188,71 @@ def _replace_system_connections(
         system.add_def(NodeType.Connection, key, connection, overwrite_warning=False)
 
 
+def _apply_ssd_system(architecture, system, ssd_system, progress: Progress) -> None:
+    with span("derive parts from SSD", category="sync"):
+        target_parts = _derive_target_parts(architecture, system, ssd_system, progress)
+    with span("derive connections from SSD", category="sync"):
+        target_connections = _derive_port_connections_from_ssd(target_parts, ssd_system)
+    with span("apply to composition", category="sync", composition=system.name):
+        _replace_system_parts(system, target_parts)
+        _replace_system_connections(system, target_parts, target_connections)
+
+
+def _write_architecture(architecture, output_root: Path, progress: Progress) -> list[Path]:
+    written: list[Path] = []
+    with span("export sysml"):
+        file_texts = architecture.export_declared()
+    for file_name, content in file_texts.items():
+        output_path = output_root / file_name
+        with span("write file", category="write", path=output_path):
+            changed = write_text_if_changed(output_path, content)
+        progress.file_written(output_path, skipped=not changed)
+        written.append(output_path)
+
+    return sorted(written)
+
+
+def sync_sysml_from_model(
+    architecture,
+    ssd_path: Path,
+    composition: str,
+    output_architecture_dir: Path,
+    observer: Optional[Observer] = None,
+) -> list[Path]:
+    """Apply SSD composition edits to a parsed architecture and write its .sysml files.
+
+    The architecture package is updated in place, so callers holding it in
+    memory keep working on the synced model.
+    """
+    progress = Progress(observer, "sync")
+    ssd_system = load_ssd_system(ssd_path)
+    system = resolve_composition(architecture, composition)
+    _apply_ssd_system(architecture, system, ssd_system, progress)
+    return _write_architecture(architecture, output_architecture_dir, progress)
+
+
 def sync_sysml_from_ssd(
     architecture_path: Path,
     ssd_path: Path,
     composition: str,
     output_architecture_dir: Path | None = None,
+    observer: Optional[Observer] = None,
 ) -> list[Path]:
-    """Apply SSD composition edits to a SysML architecture and write updated .sysml files."""
+    """Apply SSD composition edits to a SysML architecture and write updated .sysml files.
+
+    ``observer`` receives an event per SSD component and per written file.
+    """
+    progress = Progress(observer, "sync")
     ssd_system = load_ssd_system(ssd_path)
     try:
-        architecture = _load_architecture(architecture_path)
-        system = architecture.get_def(NodeType.Part, composition)
+        architecture = load_architecture(architecture_path, mutable=True)
+        system = resolve_composition(architecture, composition)
     except FileNotFoundError:
         architecture, system = build_architecture_from_ssd(ssd_system, composition)
 
-    target_parts = _derive_target_parts(architecture, system, ssd_system)
-    target_connections = _derive_port_connections_from_ssd(target_parts, ssd_system)
-    _replace_system_parts(system, target_parts)
-    _replace_system_connections(system, target_parts, target_connections)
+    _apply_ssd_system(architecture, system, ssd_system, progress)
 
-    written: list[Path] = []
     output_root = output_architecture_dir or (
         architecture_path if architecture_path.is_dir() else architecture_path.parent
     )
-    file_texts = architecture.export_declared()
-    for file_name, content in file_texts.items():
-        output_path = output_root / file_name
-        ensure_parent_dir(output_path)
-        output_path.write_text(content, encoding="utf-8")
-        written.append(output_path)
-
-    return sorted(written)
+    return _write_architecture(architecture, output_root, progress)
@@ -0,0 +1,234 @@
+"""Generate synthetic SysML architectures and SSDs for load testing.
+
+Both generators are driven by a spec dataclass and a seed, so the same spec
+always produces byte-identical files.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+from pyssp_sysml2.paths import ensure_directory, ensure_parent_dir
+
+PRIMITIVE_TYPES = ("Real", "Integer", "Boolean")
+SSC_TYPES = {"Real": "ssc:Real", "Integer": "ssc:Integer", "Boolean": "ssc:Boolean"}
+
+SSD_HEADER = (
+    '<?xml version="1.0"?>\n'
+    '<ssd:SystemStructureDescription'
+    ' xmlns:ssc="http://ssp-standard.org/SSP1/SystemStructureCommon"'
+    ' xmlns:ssd="http://ssp-standard.org/SSP1/SystemStructureDescription"'
+    ' name="{name}" version="1.0">\n'
+)
+
+
+@dataclass
+class ArchitectureSpec:
+    """Shape of a synthetic architecture.
+
+    Every part definition gets ``ports_per_part`` ports, alternating between
+    ``in`` and ``out``, typed by one of ``port_defs`` port definitions with
+    ``attributes_per_port`` attributes each. ``connection_density`` is the
+    fraction of input ports connected to a random compatible output. Outputs
+    may feed several inputs.
+    """
+
+    part_defs: int = 10
+    instances_per_def: int = 10
+    ports_per_part: int = 2
+    port_defs: int = 2
+    attributes_per_port: int = 2
+    parameters_per_part: int = 2
+    list_length: int = 3
+    connection_density: float = 1.0
+    seed: int = 0
+    package: str = "Synth"
+    composition: str = "SynthComposition"
+
+    @property
+    def instances(self) -> int:
+        return self.part_defs * self.instances_per_def
+
+
+@dataclass
+class SsdSpec:
+    """Shape of a synthetic SSD modelled on ``tests/resources/embrace.ssd``.
+
+    Components have dotted port connectors (``outK.aJ``, ``inK_F.aJ``, with
+    ``list_length`` indexed ``X[i]`` attributes) and scalar connectors
+    (``yS``, ``uS_F``). Every output feeds ``fan_out`` inputs of other
+    components, and every input has at most one source.
+    ``connection_density`` is the fraction of those connections emitted.
+    """
+
+    components: int = 10
+    component_types: int = 5
+    ports_per_component: int = 2
+    attributes_per_port: int = 2
+    list_length: int = 0
+    scalar_connectors: int = 1
+    fan_out: int = 2
+    connection_density: float = 1.0
+    seed: int = 0
+    name: str = "SynthSystem"
+
+    @property
+    def connections_per_component(self) -> int:
+        per_port = self.attributes_per_port + self.list_length
+        return (self.ports_per_component * per_port + self.scalar_connectors) * self.fan_out
+
+
+def _literal(type_name: str, rng: random.Random) -> str:
+    if type_name == "Integer":
+        return str(rng.randint(0, 100))
+    if type_name == "Boolean":
+        return rng.choice(("true", "false"))
+    return f"{rng.uniform(0, 100):.3f}"
+
+
+def render_architecture(spec: ArchitectureSpec) -> str:
+    """Return the SysML text of a synthetic architecture."""
+    rng = random.Random(spec.seed)
+    lines = [f"package {spec.package} {{"]
+
+    for port_index in range(spec.port_defs):
+        types = [rng.choice(PRIMITIVE_TYPES) for _ in range(spec.attributes_per_port)]
+        lines.append(f"  port def Signal{port_index} {{")
+        for attribute_index, type_name in enumerate(types):
+            lines.append(f"    attribute s{attribute_index}: {type_name};")
+        lines.append("  }")
+
+    # (direction, port def index) per port, per part definition
+    part_ports: list[list[tuple[str, int]]] = []
+    for def_index in range(spec.part_defs):
+        lines.append(f"  part def Block{def_index} {{")
+        for parameter_index in range(spec.parameters_per_part):
+            type_name = rng.choice(PRIMITIVE_TYPES)
+            lines.append(f"    attribute p{parameter_index} = {_literal(type_name, rng)};")
+        if spec.list_length > 0:
+            values = ", ".join(_literal("Real", rng) for _ in range(spec.list_length))
+            lines.append(f"    attribute table = [{values}];")
+        ports = []
+        for port_index in range(spec.ports_per_part):
+            direction = "in" if port_index % 2 == 0 else "out"
+            port_def = rng.randrange(spec.port_defs)
+            ports.append((direction, port_def))
+            lines.append(f"    {direction} port {direction}{port_index} : Signal{port_def};")
+        part_ports.append(ports)
+        lines.append("  }")
+
+    instances = [
+        (f"b{def_index}_{copy}", def_index)
+        for def_index in range(spec.part_defs)
+        for copy in range(spec.instances_per_def)
+    ]
+    outputs_by_port_def: dict[int, list[str]] = {}
+    for instance, def_index in instances:
+        for port_index, (direction, port_def) in enumerate(part_ports[def_index]):
+            if direction == "out":
+                outputs_by_port_def.setdefault(port_def, []).append(
+                    f"{instance}.out{port_index}"
+                )
+
+    lines.append(f"  part def {spec.composition} {{")
+    for instance, def_index in instances:
+        lines.append(f"    part {instance} : Block{def_index};")
+    for instance, def_index in instances:
+        for port_index, (direction, port_def) in enumerate(part_ports[def_index]):
+            if direction != "in" or rng.random() >= spec.connection_density:
+                continue
+            candidates = outputs_by_port_def.get(port_def)
+            if not candidates:
+                continue
+            source = rng.choice(candidates)
+            if source.split(".", 1)[0] == instance:
+                continue
+            lines.append(f"    connect {source} to {instance}.in{port_index};")
+    lines += ["  }", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def write_architecture(output_dir: Path, spec: ArchitectureSpec) -> Path:
+    """Write ``<output_dir>/architecture.sysml`` and return the directory."""
+    ensure_directory(output_dir)
+    (output_dir / "architecture.sysml").write_text(render_architecture(spec), encoding="utf-8")
+    return output_dir
+
+
+def _connector(name: str, kind: str, type_name: str) -> str:
+    return (
+        f"          <ssd:Connector name={quoteattr(name)} kind=\"{kind}\">"
+        f"<{SSC_TYPES[type_name]} /></ssd:Connector>\n"
+    )
+
+
+def render_ssd(spec: SsdSpec) -> str:
+    """Return the XML text of a synthetic SSD."""
+    if spec.components < 2:
+        raise ValueError("A synthetic SSD needs at least two components")
+    rng = random.Random(spec.seed)
+    attribute_names = [f"a{index}" for index in range(spec.attributes_per_port)] + [
+        f"X[{index}]" for index in range(1, spec.list_length + 1)
+    ]
+    port_types = [
+        [rng.choice(PRIMITIVE_TYPES) for _ in attribute_names]
+        for _ in range(spec.ports_per_component)
+    ]
+    scalar_types = [rng.choice(PRIMITIVE_TYPES) for _ in range(spec.scalar_connectors)]
+
+    out = [SSD_HEADER.format(name=spec.name)]
+    out.append(f"  <ssd:System name={quoteattr(spec.name)}>\n    <ssd:Elements>\n")
+    for component in range(spec.components):
+        out.append(
+            f'      <ssd:Component name="c{component}" type="application/x-fmu-sharedlibrary"'
+            f' source="resources/Block{component % spec.component_types}.fmu">\n'
+            "        <ssd:Connectors>\n"
+        )
+        for port, types in enumerate(port_types):
+            for branch in range(spec.fan_out):
+                for attribute, type_name in zip(attribute_names, types):
+                    out.append(_connector(f"in{port}_{branch}.{attribute}", "input", type_name))
+            for attribute, type_name in zip(attribute_names, types):
+                out.append(_connector(f"out{port}.{attribute}", "output", type_name))
+        for scalar, type_name in enumerate(scalar_types):
+            for branch in range(spec.fan_out):
+                out.append(_connector(f"u{scalar}_{branch}", "input", type_name))
+            out.append(_connector(f"y{scalar}", "output", type_name))
+        out.append("        </ssd:Connectors>\n      </ssd:Component>\n")
+    out.append("    </ssd:Elements>\n    <ssd:Connections>\n")
+
+    endpoints = [
+        (f"out{port}.{attribute}", f"in{port}_{{branch}}.{attribute}")
+        for port in range(spec.ports_per_component)
+        for attribute in attribute_names
+    ] + [(f"y{scalar}", f"u{scalar}_{{branch}}") for scalar in range(spec.scalar_connectors)]
+    for branch in range(spec.fan_out):
+        # Each branch is a derangement-like permutation, so every input gets
+        # exactly one source and no component feeds itself.
+        targets = list(range(spec.components))
+        rng.shuffle(targets)
+        for source, target in enumerate(targets):
+            if target == source:
+                targets[source] = targets[(source + 1) % spec.components]
+                targets[(source + 1) % spec.components] = target
+        for source, target in enumerate(targets):
+            for start_connector, end_template in endpoints:
+                if rng.random() >= spec.connection_density:
+                    continue
+                out.append(
+                    "      <ssd:Connection"
+                    f' startElement="c{source}" startConnector={quoteattr(start_connector)}'
+                    f' endElement="c{target}"'
+                    f" endConnector={quoteattr(end_template.format(branch=branch))} />\n"
+                )
+    out.append("    </ssd:Connections>\n  </ssd:System>\n</ssd:SystemStructureDescription>\n")
+    return "".join(out)
+
+
+def write_ssd(output_path: Path, spec: SsdSpec) -> Path:
+    """Write the synthetic SSD to ``output_path`` and return it."""
+    ensure_parent_dir(output_path)
+    output_path.write_text(render_ssd(spec), encoding="utf-8")
+    return output_path
@@ -2,21 +2,39 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 
 from pycps_sysmlv2 import NodeType
 from pyssp_standard.ssd import Component, SSD
 
-from pyssp_sysml2.paths import ensure_parent_dir, DEFAULT_PACKAGE_NAME
+from pyssp_sysml2.cache import SSDMemoryCache
+from pyssp_sysml2.events import Observer, Progress
+from pyssp_sysml2.paths import DEFAULT_PACKAGE_NAME, write_text_if_changed
+from pyssp_sysml2.trace import span
 
 SCALAR_ATTRIBUTE_NAME = "value"
 
+_ssd_cache: Optional[SSDMemoryCache] = None
+
+
+def set_ssd_cache(cache: Optional[SSDMemoryCache]) -> None:
+    """Memoize loaded SSD systems in this process (``None`` disables it)."""
+    global _ssd_cache
+    _ssd_cache = cache
+
+
+def _read_ssd_system(ssd_path: Path):
+    with span("read SSD", category="parse", path=ssd_path):
+        with SSD(ssd_path, mode="r") as ssd:
+            if ssd.system is None:
+                raise ValueError(f"No system element found in SSD: {ssd_path}")
+            return ssd.system
+
 
 def load_ssd_system(ssd_path: Path):
-    with SSD(ssd_path, mode="r") as ssd:
-        if ssd.system is None:
-            raise ValueError(f"No system element found in SSD: {ssd_path}")
-        return ssd.system
+    if _ssd_cache is not None:
+        return _ssd_cache.load(ssd_path, _read_ssd_system)
+    return _read_ssd_system(ssd_path)
 
 
 def split_connector(name: str) -> tuple[str, str]:
@@ -72,9 +90,13 @@ def _merge_type_names(type_names: Iterable[str]) -> str:
 
 def _find(parent: dict[tuple[str, str], tuple[str, str]], item: tuple[str, str]) -> tuple[str, str]:
     root = parent.setdefault(item, item)
-    if root != item:
-        parent[item] = _find(parent, root)
-    return parent[item]
+    while parent[root] != root:
+        root = parent[root]
+    # Path compression without recursion, so long connector chains cannot
+    # exceed the interpreter's recursion limit.
+    while item != root:
+        parent[item], item = root, parent[item]
+    return root
 
 
 def _union(
@@ -136,7 +158,9 @@ def _part_name_from_component(component: Component) -> str:
     raise ValueError("SSD component without a name cannot be synced")
 
 
-def build_architecture_from_ssd(ssd_system, composition: str):
+def build_architecture_from_ssd(
+    ssd_system, composition: str, observer: Optional[Observer] = None
+):
     from pycps_sysmlv2 import (
         SysMLAttribute,
         SysMLConnection,
@@ -180,53 +204,58 @@ def build_architecture_from_ssd(ssd_system, composition: str):
 
     endpoint_groups = _group_endpoints(endpoint_attributes, ssd_system)
     group_signatures = _canonicalize_group_signatures(endpoint_attributes, endpoint_groups)
+    endpoints_by_component: dict[str, list[tuple[str, str]]] = {}
+    for endpoint in endpoint_attributes:
+        endpoints_by_component.setdefault(endpoint[0], []).append(endpoint)
 
     architecture = SysMLPackage(name=DEFAULT_PACKAGE_NAME, package=DEFAULT_PACKAGE_NAME)
     part_defs_by_name: dict[str, object] = {}
     component_part_defs: dict[str, object] = {}
     port_defs_by_signature: dict[tuple[tuple[str, str], ...], object] = {}
+    progress = Progress(observer, "sysml", total=len(components))
 
     for component_name in sorted(components):
-        component = components[component_name]
-        part_name = _part_name_from_component(component)
-        part_def = part_defs_by_name.get(part_name)
-        if part_def is None:
-            part_def = SysMLPartDefinition(name=part_name, source_file="architecture.sysml")
-            part_def.parent = architecture
-            architecture.add_def(NodeType.Part, part_def.name, part_def)
-            part_defs_by_name[part_name] = part_def
-        component_part_defs[component_name] = part_def
-
-        for endpoint in sorted(key for key in endpoint_attributes if key[0] == component_name):
-            _, port_name = endpoint
-            signature = group_signatures[endpoint_groups[endpoint]]
-            port_def = port_defs_by_signature.get(signature)
-            if port_def is None:
-                port_def_name = f"Port_{len(port_defs_by_signature) + 1}"
-                port_def = SysMLPortDefinition(name=port_def_name, source_file="architecture.sysml")
-                for attr_name, attr_type in signature:
-                    port_def.add_def(
-                        NodeType.Attribute,
-                        attr_name,
-                        SysMLAttribute(
-                            name=attr_name,
-                            type=SysMLType.from_string(attr_type),
-                            value=None,
-                        ),
+        with progress.component(component_name):
+            component = components[component_name]
+            part_name = _part_name_from_component(component)
+            part_def = part_defs_by_name.get(part_name)
+            if part_def is None:
+                part_def = SysMLPartDefinition(name=part_name, source_file="architecture.sysml")
+                part_def.parent = architecture
+                architecture.add_def(NodeType.Part, part_def.name, part_def)
+                part_defs_by_name[part_name] = part_def
+            component_part_defs[component_name] = part_def
+
+            for endpoint in sorted(endpoints_by_component.get(component_name, ())):
+                _, port_name = endpoint
+                signature = group_signatures[endpoint_groups[endpoint]]
+                port_def = port_defs_by_signature.get(signature)
+                if port_def is None:
+                    port_def_name = f"Port_{len(port_defs_by_signature) + 1}"
+                    port_def = SysMLPortDefinition(name=port_def_name, source_file="architecture.sysml")
+                    for attr_name, attr_type in signature:
+                        port_def.add_def(
+                            NodeType.Attribute,
+                            attr_name,
+                            SysMLAttribute(
+                                name=attr_name,
+                                type=SysMLType.from_string(attr_type),
+                                value=None,
+                            ),
+                        )
+                    port_def.parent = architecture
+                    architecture.add_def(NodeType.Port, port_def.name, port_def)
+                    port_defs_by_signature[signature] = port_def
+
+                if port_name not in part_def.refs(NodeType.Port):
+                    port_ref = SysMLPortReference(
+                        name=port_name,
+                        direction=endpoint_directions.get(endpoint, "in"),
+                        type=port_def.name,
+                        ref_node=port_def,
                     )
-                port_def.parent = architecture
-                architecture.add_def(NodeType.Port, port_def.name, port_def)
-                port_defs_by_signature[signature] = port_def
-
-            if port_name not in part_def.refs(NodeType.Port):
-                port_ref = SysMLPortReference(
-                    name=port_name,
-                    direction=endpoint_directions.get(endpoint, "in"),
-                    type=port_def.name,
-                    ref_node=port_def,
-                )
-                port_ref.parent = part_def
-                part_def.add_ref(NodeType.Port, port_name, port_ref)
+                    port_ref.parent = part_def
+                    part_def.add_ref(NodeType.Port, port_name, port_ref)
 
     system = SysMLPartDefinition(name=composition, source_file="architecture.sysml")
     system.parent = architecture
@@ -269,22 +298,37 @@ def build_architecture_from_ssd(ssd_system, composition: str):
     return architecture, system
 
 
-def generate_sysml_from_ssd(
-    ssd_path: Path,
+def generate_sysml_from_ssd_system(
+    ssd_system,
     output_path: Path,
     composition: str | None = None,
+    observer: Optional[Observer] = None,
 ) -> Path:
-    ssd_system = load_ssd_system(ssd_path)
+    """Write a minimal SysML file from an already loaded SSD system."""
     composition_name = composition or getattr(ssd_system, "name", None)
     if not composition_name:
         raise ValueError("Composition name must be provided or present on the SSD system")
 
-    architecture, _ = build_architecture_from_ssd(ssd_system, composition_name)
-    file_texts = architecture.export_declared()
+    with span("build architecture from SSD", composition=composition_name):
+        architecture, _ = build_architecture_from_ssd(ssd_system, composition_name, observer)
+    with span("export sysml"):
+        file_texts = architecture.export_declared()
     if len(file_texts) != 1:
         raise ValueError("SSD-to-SysML generation expected a single exported architecture file")
 
     content = next(iter(file_texts.values()))
-    ensure_parent_dir(output_path)
-    output_path.write_text(content, encoding="utf-8")
+    with span("write file", category="write", path=output_path):
+        changed = write_text_if_changed(output_path, content)
+    Progress(observer, "sysml").file_written(output_path, skipped=not changed)
     return output_path
+
+
+def generate_sysml_from_ssd(
+    ssd_path: Path,
+    output_path: Path,
+    composition: str | None = None,
+    observer: Optional[Observer] = None,
+) -> Path:
+    return generate_sysml_from_ssd_system(
+        load_ssd_system(ssd_path), output_path, composition, observer=observer
+    )
@@ -0,0 +1,55 @@
+"""Generation timestamps written into SSD, SSV and modelDescription.xml files.
+
+By default every run stamps the current time. For reproducible builds, set
+``SOURCE_DATE_EPOCH`` (seconds since the epoch, see
+https://reproducible-builds.org/specs/source-date-epoch/) or fix the timestamp
+with :func:`set_generation_timestamp` / ``--timestamp``; identical inputs then
+give byte-identical outputs.
+"""
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from typing import Optional
+
+SOURCE_DATE_EPOCH = "SOURCE_DATE_EPOCH"
+
+_fixed_timestamp: Optional[datetime] = None
+
+
+def set_generation_timestamp(timestamp: Optional[datetime]) -> None:
+    """Use ``timestamp`` for every generated file; ``None`` restores the default."""
+    global _fixed_timestamp
+    _fixed_timestamp = timestamp
+
+
+def get_generation_timestamp() -> Optional[datetime]:
+    return _fixed_timestamp
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse seconds since the epoch or an ISO 8601 date/time (UTC unless an offset is given)."""
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def generation_timestamp() -> datetime:
+    """Return the fixed timestamp, else ``SOURCE_DATE_EPOCH``, else the current time."""
+    if _fixed_timestamp is not None:
+        timestamp = _fixed_timestamp
+    elif os.environ.get(SOURCE_DATE_EPOCH):
+        timestamp = datetime.fromtimestamp(int(os.environ[SOURCE_DATE_EPOCH]), tz=timezone.utc)
+    else:
+        timestamp = datetime.now(timezone.utc)
+    return timestamp.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def format_generation_timestamp() -> str:
+    """Return :func:`generation_timestamp` as ``YYYY-MM-DDTHH:MM:SSZ``."""
+    return generation_timestamp().isoformat().replace("+00:00", "Z")
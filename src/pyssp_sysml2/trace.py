@@ -0,0 +1,161 @@
+"""Record nested timing spans of the generators in Chrome trace-event format.
+
+Usage::
+
+    from pyssp_sysml2.trace import tracing
+
+    with tracing(Path("trace.json")):
+        generate_all(architecture, output_dir, composition)
+
+Open the written file in ``chrome://tracing`` or https://ui.perfetto.dev.
+Spans cost a single global lookup while no collector is active. Besides the
+tracer, other collectors such as the memory profiler in
+:mod:`pyssp_sysml2.memory` can observe the same spans.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterator, Optional, Protocol
+
+_NULL_SPAN = nullcontext()
+_collectors: tuple["SpanCollector", ...] = ()
+
+
+class SpanCollector(Protocol):
+    def enter(self, name: str) -> Any:
+        """Called when a span starts; the return value is passed to :meth:`exit`."""
+
+    def exit(self, state: Any, name: str, category: str, args: dict[str, Any]) -> None:
+        """Called when the span ends."""
+
+
+class Tracer:
+    """Collects complete (``"ph": "X"``) events for every finished span."""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def enter(self, name: str) -> int:
+        return time.perf_counter_ns()
+
+    def exit(self, start_ns: int, name: str, category: str, args: dict[str, Any]) -> None:
+        self.record(name, category, start_ns, time.perf_counter_ns(), args)
+
+    def record(
+        self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any]
+    ) -> None:
+        tid = threading.get_ident()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {key: _json_safe(value) for key, value in args.items()}
+        with self._lock:
+            self._thread_names.setdefault(tid, threading.current_thread().name)
+            self.events.append(event)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        with self._lock:
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._thread_names.items()
+            ]
+            events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, output_path: Path) -> Path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.to_chrome_trace(), indent=1), encoding="utf-8")
+        return output_path
+
+
+class _Span:
+    __slots__ = ("collectors", "name", "category", "args", "states")
+
+    def __init__(
+        self,
+        collectors: tuple[SpanCollector, ...],
+        name: str,
+        category: str,
+        args: dict[str, Any],
+    ) -> None:
+        self.collectors = collectors
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.states = [collector.enter(self.name) for collector in self.collectors]
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for collector, state in zip(reversed(self.collectors), reversed(self.states)):
+            collector.exit(state, self.name, self.category, self.args)
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def add_collector(collector: SpanCollector) -> None:
+    global _collectors
+    _collectors = (*_collectors, collector)
+
+
+def remove_collector(collector: SpanCollector) -> None:
+    global _collectors
+    _collectors = tuple(active for active in _collectors if active is not collector)
+
+
+def get_tracer() -> Optional[Tracer]:
+    for collector in reversed(_collectors):
+        if isinstance(collector, Tracer):
+            return collector
+    return None
+
+
+def span(name: str, category: str = "generate", **args: Any):
+    """Mark the enclosed block as one span for every active collector."""
+    collectors = _collectors
+    if not collectors:
+        return _NULL_SPAN
+    return _Span(collectors, name, category, args)
+
+
+@contextmanager
+def tracing(output_path: Optional[Path] = None) -> Iterator[Tracer]:
+    """Activate a tracer for the block and write it to ``output_path`` on exit.
+
+    The trace is written even when the block raises, so failed runs can be
+    inspected too. Spans recorded in worker processes are not collected.
+    """
+    tracer = Tracer()
+    add_collector(tracer)
+    try:
+        yield tracer
+    finally:
+        remove_collector(tracer)
+        if output_path is not None:
+            tracer.write(output_path)
@@ -0,0 +1,246 @@
+"""Check existing FMUs against the architecture they implement.
+
+Every ``*.fmu`` in a directory is matched to a part definition of the
+composition by file name (see :func:`~pyssp_sysml2.fmi_helpers.fmu_filename`).
+Its modelDescription.xml is stream-parsed straight out of the zip archive and
+its variables are compared with :func:`~pyssp_sysml2.fmi.get_model_variables`,
+the ones ``pyssp generate fmi`` writes: names, causalities, types and value
+references.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from pycps_sysmlv2 import NodeType, SysMLPartDefinition
+
+from pyssp_sysml2.architecture import load_composition, resolve_model
+from pyssp_sysml2.fmi import FMI_VERSIONS, get_model_variables
+from pyssp_sysml2.fmi_helpers import FMI3_TYPE_MAP, fmu_filename
+from pyssp_sysml2.trace import span
+from pyssp_sysml2.vr_map import ValueReferenceMap
+
+FMI2_TYPES = {"Real", "Integer", "Boolean", "String", "Enumeration"}
+
+
+@dataclass(frozen=True)
+class ExpectedVariable:
+    causality: str
+    fmi_type: str
+    # None when a value-reference map is used and does not list the variable
+    value_reference: Optional[int]
+
+
+@dataclass
+class FmuCheck:
+    """One FMU and the variables it should have, per FMI version, as plain data."""
+
+    path: Path
+    part_name: str
+    expected: dict[str, dict[str, ExpectedVariable]]
+
+
+@dataclass
+class FmuReport:
+    path: Path
+    part_name: Optional[str]
+    problems: list[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def read_model_variables(fmu_path: Path) -> tuple[str, list[tuple[str, str, str, str]]]:
+    """Return the FMI version and ``(name, causality, type, valueReference)`` per variable.
+
+    modelDescription.xml is parsed incrementally from the archive. Every
+    element below the root is cleared and detached once read, so large
+    descriptions are never held as a whole tree.
+    """
+    version = ""
+    variables = []
+    # The open elements, from the root down
+    open_elements: list[ET.Element] = []
+    with zipfile.ZipFile(fmu_path) as archive, archive.open("modelDescription.xml") as handle:
+        for event, elem in ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                if not open_elements:
+                    version = elem.get("fmiVersion", "")
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if len(open_elements) == 2 and open_elements[1].tag == "ModelVariables":
+                if elem.tag == "ScalarVariable":
+                    fmi_type = next((child.tag for child in elem if child.tag in FMI2_TYPES), "")
+                else:
+                    fmi_type = elem.tag
+                variables.append(
+                    (
+                        elem.get("name", ""),
+                        elem.get("causality", "local"),
+                        fmi_type,
+                        elem.get("valueReference", ""),
+                    )
+                )
+            if len(open_elements) in (1, 2):
+                # Drop variables from ModelVariables and finished sections from
+                # the root; the parent's only child is the element just read.
+                elem.clear()
+                del open_elements[-1][:]
+    return version, variables
+
+
+def _compare(
+    expected: dict[str, ExpectedVariable], actual: list[tuple[str, str, str, str]]
+) -> list[str]:
+    problems = []
+    seen: set[str] = set()
+    for name, causality, fmi_type, value_reference in actual:
+        if name in seen:
+            problems.append(f"{name}: duplicate variable")
+            continue
+        seen.add(name)
+        want = expected.get(name)
+        if want is None:
+            problems.append(f"{name}: not in the architecture")
+            continue
+        if causality != want.causality:
+            problems.append(f"{name}: causality {causality!r}, expected {want.causality!r}")
+        if fmi_type != want.fmi_type:
+            problems.append(f"{name}: type {fmi_type!r}, expected {want.fmi_type!r}")
+        if want.value_reference is None:
+            problems.append(f"{name}: not in the value reference map")
+        elif value_reference != str(want.value_reference):
+            problems.append(
+                f"{name}: valueReference {value_reference!r}, expected {want.value_reference}"
+            )
+    problems.extend(f"{name}: missing" for name in expected if name not in seen)
+    return problems
+
+
+def check_fmu(check: FmuCheck) -> FmuReport:
+    """Verify one FMU; unreadable archives are reported instead of raised."""
+    started = time.perf_counter()
+    try:
+        version, actual = read_model_variables(check.path)
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as exc:
+        problems = [f"cannot read modelDescription.xml: {exc}"]
+    else:
+        expected = check.expected.get(version)
+        if expected is None:
+            problems = [f"unsupported fmiVersion {version!r}"]
+        else:
+            problems = _compare(expected, actual)
+    return FmuReport(check.path, check.part_name, problems, time.perf_counter() - started)
+
+
+def _expected_variables(
+    part_def: SysMLPartDefinition, vr_map_dir: Optional[Path]
+) -> dict[str, dict[str, ExpectedVariable]]:
+    references = None
+    if vr_map_dir is not None:
+        # Read only: verifying must not allocate numbers or retire any.
+        references = ValueReferenceMap.for_part(vr_map_dir, part_def.name).assigned
+    expected = {}
+    for version in FMI_VERSIONS:
+        expected[version] = {
+            variable.name: ExpectedVariable(
+                causality=variable.causality,
+                fmi_type=(
+                    FMI3_TYPE_MAP[variable.fmi_type] if version == "3.0" else variable.fmi_type
+                ),
+                value_reference=(
+                    variable.value_reference
+                    if references is None
+                    else references.get(variable.name)
+                ),
+            )
+            for variable in get_model_variables(part_def, version)
+        }
+    return expected
+
+
+def verify_fmus_from_model(
+    model,
+    fmu_dir: Path,
+    composition: str | None = None,
+    jobs: Optional[int] = None,
+    vr_map_dir: Optional[Path] = None,
+) -> list[FmuReport]:
+    """Verify every FMU in ``fmu_dir`` against a parsed architecture package or composition.
+
+    The FMUs are checked on ``jobs`` worker processes (defaults to the CPU
+    count; 1 checks them in-process). The expected variables are collected
+    here and sent to the workers as plain :class:`FmuCheck` data, because a
+    part definition pickles together with the whole package it references.
+    The workers are spawned rather than forked, as in :mod:`pyssp_sysml2.fmi`,
+    so this is safe to call from a thread. With ``vr_map_dir`` the expected
+    value references come from the maps written by ``generate fmi --vr-map-dir``.
+    Returns one report per FMU in file name order, followed by a report for
+    every component type without an FMU.
+    """
+    if not fmu_dir.is_dir():
+        raise FileNotFoundError(f"FMU directory not found: {fmu_dir}")
+    system = resolve_model(model, composition)
+    part_defs: dict[str, SysMLPartDefinition] = {}
+    for part_ref in system.refs(NodeType.Part).values():
+        part_defs.setdefault(fmu_filename(part_ref.type), part_ref.ref_node)
+
+    reports: dict[str, FmuReport] = {}
+    checks = []
+    with span("collect variables", composition=system.name):
+        for path in sorted(fmu_dir.glob("*.fmu")):
+            part_def = part_defs.get(path.name)
+            if part_def is None:
+                reports[path.name] = FmuReport(
+                    path, None, [f"no component type of {system.name} is built as {path.name}"]
+                )
+                continue
+            checks.append(FmuCheck(path, part_def.name, _expected_variables(part_def, vr_map_dir)))
+
+    with span("verify FMUs", count=len(checks)):
+        if jobs == 1 or len(checks) <= 1:
+            results = [check_fmu(check) for check in checks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = list(executor.map(check_fmu, checks))
+    for result in results:
+        reports[result.path.name] = result
+
+    ordered = [reports[name] for name in sorted(reports)]
+    for filename, part_def in part_defs.items():
+        if filename not in reports:
+            ordered.append(FmuReport(fmu_dir / filename, part_def.name, ["FMU missing"]))
+    return ordered
+
+
+def verify_fmus(
+    architecture_path: Path,
+    fmu_dir: Path,
+    composition: str,
+    jobs: Optional[int] = None,
+    vr_map_dir: Optional[Path] = None,
+) -> list[FmuReport]:
+    system = load_composition(architecture_path, composition)
+    return verify_fmus_from_model(system, fmu_dir, jobs=jobs, vr_map_dir=vr_map_dir)
+
+
+def format_summary(reports: list[FmuReport]) -> list[str]:
+    lines = []
+    for report in reports:
+        status = "ok" if report.ok else "FAILED"
+        lines.append(f"{status:<6} {report.duration:8.3f}s  {report.path.name}")
+        lines.extend(f"         {problem}" for problem in report.problems)
+    failed = sum(not report.ok for report in reports)
+    lines.append(f"{len(reports) - failed}/{len(reports)} FMUs match the architecture")
+    return lines
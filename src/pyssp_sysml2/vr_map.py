@@ -0,0 +1,93 @@
+"""Value references that stay put across regenerations.
+
+Without a map, value references are numbered in variable order on every run,
+so adding one attribute renumbers every later variable. A value-reference map
+is a JSON sidecar per part definition. It keeps the numbers already handed
+out, gives new variables numbers no variable had before, and retires the
+numbers of removed variables so nothing else ever gets them.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from pyssp_sysml2.paths import write_text_if_changed
+
+VR_MAP_SUFFIX = ".vr.json"
+VR_MAP_VERSION = 1
+
+
+def vr_map_path(vr_map_dir: Path, part_name: str) -> Path:
+    return vr_map_dir / f"{part_name}{VR_MAP_SUFFIX}"
+
+
+@dataclass
+class ValueReferenceMap:
+    """Value reference of every variable of one part definition.
+
+    ``retired`` keeps the numbers of removed variables. A variable that comes
+    back gets its old number again; any other new variable gets
+    ``next_reference``.
+    """
+
+    path: Path
+    assigned: dict[str, int] = field(default_factory=dict)
+    retired: dict[str, int] = field(default_factory=dict)
+    next_reference: int = 0
+
+    @classmethod
+    def for_part(cls, vr_map_dir: Path, part_name: str) -> "ValueReferenceMap":
+        return cls.load(vr_map_path(vr_map_dir, part_name))
+
+    @classmethod
+    def load(cls, path: Path) -> "ValueReferenceMap":
+        """Read ``path``, or start an empty map when it does not exist.
+
+        Unlike the incremental manifest, a map that cannot be read is an error:
+        starting over would silently renumber every variable.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid value reference map {path}: {exc}") from exc
+        if not isinstance(data, dict) or data.get("version") != VR_MAP_VERSION:
+            raise ValueError(f"Unsupported value reference map {path}")
+        assigned = {str(name): int(ref) for name, ref in data.get("variables", {}).items()}
+        retired = {str(name): int(ref) for name, ref in data.get("retired", {}).items()}
+        highest = max([*assigned.values(), *retired.values()], default=-1)
+        return cls(path, assigned, retired, max(int(data.get("next", 0)), highest + 1))
+
+    def allocate(self, names: Iterable[str]) -> dict[str, int]:
+        """Return the value reference of each of ``names``, in order.
+
+        Names missing from the map get a number, and mapped names missing
+        from ``names`` are retired.
+        """
+        assigned: dict[str, int] = {}
+        for name in names:
+            reference = self.assigned.get(name)
+            if reference is None:
+                reference = self.retired.pop(name, None)
+            if reference is None:
+                reference = self.next_reference
+                self.next_reference += 1
+            assigned[name] = reference
+        for name, reference in self.assigned.items():
+            if name not in assigned:
+                self.retired[name] = reference
+        self.assigned = assigned
+        return assigned
+
+    def save(self) -> bool:
+        """Write the map unless the file already holds it; return whether it was written."""
+        data = {
+            "version": VR_MAP_VERSION,
+            "next": self.next_reference,
+            "variables": self.assigned,
+            "retired": dict(sorted(self.retired.items(), key=lambda item: item[1])),
+        }
+        return write_text_if_changed(self.path, json.dumps(data, indent=2) + "\n")
@@ -0,0 +1,125 @@
+"""Regenerate SSD/SSV/FMI artifacts whenever the SysML architecture changes."""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from pyssp_sysml2.architecture import load_architecture
+from pyssp_sysml2.cache import architecture_files, get_disk_cache, set_disk_cache
+from pyssp_sysml2.paths import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL
+from pyssp_sysml2.pipeline import GeneratedArtifacts, generate_all_from_model
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+@dataclass
+class WatchCycle:
+    changed: list[Path] = field(default_factory=list)
+    artifacts: Optional[GeneratedArtifacts] = None
+    error: Optional[Exception] = None
+    duration: float = 0.0
+
+
+def snapshot_architecture(architecture_path: Path) -> Snapshot:
+    """Return the mtime and size of every ``.sysml`` file under the architecture."""
+    stamps: Snapshot = {}
+    for path in architecture_files(architecture_path):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _changed_files(before: Snapshot, after: Snapshot) -> list[Path]:
+    return sorted(
+        path for path in before.keys() | after.keys() if before.get(path) != after.get(path)
+    )
+
+
+def _wait_until_stable(
+    architecture_path: Path,
+    current: Snapshot,
+    interval: float,
+    debounce: float,
+    stop: threading.Event,
+) -> Snapshot:
+    """Wait for a burst of saves to settle so one regeneration covers all of them."""
+    quiet_since = time.monotonic()
+    while not stop.is_set():
+        if time.monotonic() - quiet_since >= debounce:
+            return current
+        stop.wait(interval)
+        latest = snapshot_architecture(architecture_path)
+        if latest != current:
+            current = latest
+            quiet_since = time.monotonic()
+    return current
+
+
+def _regenerate(
+    architecture_path: Path,
+    output_dir: Path,
+    composition: str,
+    type_check: bool,
+    changed: list[Path],
+) -> WatchCycle:
+    started = time.perf_counter()
+    cycle = WatchCycle(changed=changed)
+    try:
+        architecture = load_architecture(architecture_path)
+        cycle.artifacts = generate_all_from_model(
+            architecture, output_dir, composition, type_check=type_check, incremental=True
+        )
+    except Exception as exc:  # noqa: BLE001 - keep watching after an invalid save
+        cycle.error = exc
+    cycle.duration = time.perf_counter() - started
+    return cycle
+
+
+def watch_architecture(
+    architecture_path: Path,
+    output_dir: Path,
+    composition: str,
+    type_check=True,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    on_cycle: Optional[Callable[[WatchCycle], None]] = None,
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """Poll the architecture and regenerate outputs after every settled change.
+
+    Generation runs in incremental mode, so only outputs whose source
+    definitions changed are rewritten. The first cycle reports no changed
+    files. The disk cache is switched off while watching: every cycle follows
+    an edit, so hashing and pickling the model would never pay off. Runs until
+    ``stop`` is set.
+    """
+    stop = stop or threading.Event()
+    previous_cache = get_disk_cache()
+    set_disk_cache(None)
+    try:
+        current = snapshot_architecture(architecture_path)
+        cycle = _regenerate(architecture_path, output_dir, composition, type_check, [])
+        if on_cycle is not None:
+            on_cycle(cycle)
+
+        while not stop.is_set():
+            stop.wait(interval)
+            latest = snapshot_architecture(architecture_path)
+            if latest == current:
+                continue
+            latest = _wait_until_stable(architecture_path, latest, interval, debounce, stop)
+            if stop.is_set():
+                break
+            changed = _changed_files(current, latest)
+            current = latest
+            cycle = _regenerate(architecture_path, output_dir, composition, type_check, changed)
+            if on_cycle is not None:
+                on_cycle(cycle)
+    finally:
+        set_disk_cache(previous_cache)
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch) -> None:
+    """Keep the CLI's parsed-architecture cache inside the test's temporary directory."""
+    monkeypatch.setenv("PYSSP_CACHE_DIR", str(tmp_path / ".pyssp-cache"))
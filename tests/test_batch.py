@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pyssp_sysml2.batch import load_batch_manifest, run_batch
+from pyssp_sysml2.cli import main
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _write_variant(root: Path, gain: str) -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          part def Comp {{
+            attribute gain = {gain};
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def _write_manifest(path: Path, content: str) -> Path:
+    write_model(path, content)
+    return path
+
+
+def test_load_batch_manifest_resolves_paths_relative_to_manifest(tmp_path: Path) -> None:
+    """Relative job paths are resolved against the manifest directory."""
+    manifest = _write_manifest(
+        tmp_path / "batch" / "manifest.toml",
+        f"""
+        [[jobs]]
+        name = "a"
+        kind = "ssv"
+        architecture = "variants/a"
+        composition = "{COMPOSITION_NAME}"
+        output = "out/a.ssv"
+        """,
+    )
+
+    [job] = load_batch_manifest(manifest)
+
+    assert job.name == "a"
+    assert job.params["architecture"] == tmp_path / "batch" / "variants" / "a"
+    assert job.params["output"] == tmp_path / "batch" / "out" / "a.ssv"
+    assert job.params["composition"] == COMPOSITION_NAME
+
+
+def test_load_batch_manifest_rejects_incomplete_jobs(tmp_path: Path) -> None:
+    """Jobs missing required keys fail before anything runs."""
+    manifest = _write_manifest(
+        tmp_path / "manifest.toml",
+        """
+        [[jobs]]
+        kind = "all"
+        architecture = "variants/a"
+        """,
+    )
+
+    with pytest.raises(ValueError, match="missing composition, output_dir"):
+        load_batch_manifest(manifest)
+
+
+def test_load_batch_manifest_rejects_unknown_keys(tmp_path: Path) -> None:
+    """A misspelt option names the job instead of being ignored."""
+    manifest = _write_manifest(
+        tmp_path / "manifest.toml",
+        """
+        [[jobs]]
+        name = "variant-a"
+        kind = "ssv"
+        architecture = "variants/a"
+        composition = "Comp"
+        output = "out/parameters.ssv"
+        incremetal = true
+        """,
+    )
+
+    with pytest.raises(ValueError, match=r"'variant-a' \(ssv\) has unknown keys incremetal"):
+        load_batch_manifest(manifest)
+
+
+def test_run_batch_reports_per_job_status(tmp_path: Path) -> None:
+    """Jobs run in a process pool and a failing job does not stop the others."""
+    _write_variant(tmp_path / "variants" / "a", "1.0")
+    _write_variant(tmp_path / "variants" / "b", "2.0")
+    manifest = _write_manifest(
+        tmp_path / "manifest.toml",
+        f"""
+        [[jobs]]
+        name = "a"
+        kind = "all"
+        architecture = "variants/a"
+        composition = "{COMPOSITION_NAME}"
+        output_dir = "build/a"
+
+        [[jobs]]
+        name = "b"
+        kind = "all"
+        architecture = "variants/b"
+        composition = "{COMPOSITION_NAME}"
+        output_dir = "build/b"
+
+        [[jobs]]
+        name = "broken"
+        kind = "ssd"
+        architecture = "variants/a"
+        composition = "MissingComposition"
+        output = "build/broken.ssd"
+        """,
+    )
+
+    results = run_batch(load_batch_manifest(manifest), max_workers=2)
+
+    assert [(result.name, result.ok) for result in results] == [
+        ("a", True),
+        ("b", True),
+        ("broken", False),
+    ]
+    assert (tmp_path / "build" / "a" / "parameters.ssv").exists()
+    assert (tmp_path / "build" / "b" / "parameters.ssv").exists()
+
+
+def test_pyssp_batch_cli_returns_error_when_a_job_fails(tmp_path: Path, capsys) -> None:
+    """CLI batch prints a summary and fails when any job failed."""
+    _write_variant(tmp_path / "variants" / "a", "1.0")
+    manifest = _write_manifest(
+        tmp_path / "manifest.toml",
+        """
+        [[jobs]]
+        name = "broken"
+        kind = "ssv"
+        architecture = "variants/a"
+        composition = "MissingComposition"
+        output = "build/broken.ssv"
+        """,
+    )
+
+    code = main(["batch", str(manifest), "--jobs", "1", "--no-cache"])
+
+    assert code == 1
+    assert "0/1 jobs succeeded" in capsys.readouterr().out
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pyssp_standard.ssd import SSD
+
+from benchmarks.__main__ import main as benchmarks_main
+from benchmarks.fixtures import write_ssd
+from benchmarks.suite import compare_results, run_suite
+
+
+def _document(median: float) -> dict:
+    return {"results": [{"name": "generate_ssd", "size": 10, "median": median}]}
+
+
+def test_write_ssd_emits_requested_connection_count(tmp_path: Path) -> None:
+    """The SSD fixture rounds the connection count up to whole components."""
+    ssd_path = write_ssd(tmp_path / "bench.ssd", 95)
+
+    with SSD(ssd_path, mode="r") as ssd:
+        assert len(ssd.system.connections) == 100
+        assert len(ssd.system.elements) == 10
+
+
+def test_compare_results_pairs_matching_cases() -> None:
+    """Comparisons use the median of cases present in both documents."""
+    [comparison] = compare_results(_document(0.5), _document(1.0))
+
+    assert (comparison.name, comparison.size) == ("generate_ssd", 10)
+    assert comparison.ratio == 2.0
+
+
+def test_benchmarks_compare_fails_on_regression(tmp_path: Path, capsys) -> None:
+    """compare exits non-zero when a case is slower than the threshold allows."""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_document(1.0)), encoding="utf-8")
+    current.write_text(json.dumps(_document(1.1)), encoding="utf-8")
+
+    assert benchmarks_main(["compare", str(baseline), str(current), "--threshold", "1.25"]) == 0
+    assert benchmarks_main(["compare", str(baseline), str(current), "--threshold", "1.05"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_run_suite_times_every_case_at_each_size() -> None:
+    """A tiny run produces one result per case and size."""
+    document = run_suite(instances=[2, 4], connections=[20], repeat=1)
+
+    results = {(item["name"], item["size"]) for item in document["results"]}
+    assert results == {
+        ("generate_ssd", 2),
+        ("generate_ssd", 4),
+        ("generate_parameter_set", 2),
+        ("generate_parameter_set", 4),
+        ("generate_model_descriptions", 2),
+        ("generate_model_descriptions", 4),
+        ("sync_sysml_from_ssd", 2),
+        ("sync_sysml_from_ssd", 4),
+        ("generate_sysml_from_ssd", 20),
+    }
+    assert all(item["median"] >= 0 for item in document["results"])
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import os
+import warnings
+from pathlib import Path
+
+import pytest
+from pycps_sysmlv2 import NodeType
+
+from pyssp_sysml2.architecture import _parse_architecture
+from pyssp_sysml2.cache import (
+    ArchitectureDiskCache,
+    ArchitectureMemoryCache,
+    CacheStats,
+    architecture_files,
+    default_cache_dir,
+)
+from pyssp_sysml2.pipeline import generate_all_from_model
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _counting_parser(calls: list[Path]):
+    def parse(architecture_path: Path):
+        calls.append(architecture_path)
+        return {"parsed": [path.name for path in architecture_files(architecture_path)]}
+
+    return parse
+
+
+def _write_linked_architecture(root: Path) -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          port def Signal {{
+            attribute x: Real;
+            attribute ok: Boolean;
+          }}
+
+          part def Source {{
+            attribute gain = 2.0;
+            attribute table = [1.0, 2.0, 3.0];
+            out port outSig : Signal;
+          }}
+
+          part def Sink {{
+            in port inSig : Signal;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part src : Source;
+            part dst : Sink;
+            connect src.outSig to dst.inSig;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def _fail_parse(_architecture_path: Path):
+    raise AssertionError("architecture was re-parsed")
+
+
+def _generated_files(model, output_dir: Path) -> dict[str, bytes]:
+    generate_all_from_model(model, output_dir, COMPOSITION_NAME)
+    return {
+        path.relative_to(output_dir).as_posix(): path.read_bytes()
+        for path in sorted(output_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_disk_cache_round_trips_a_parsed_architecture(tmp_path: Path, monkeypatch) -> None:
+    """A real parsed, linked model pickles, and the warm load generates the same artifacts."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    arch = _write_linked_architecture(tmp_path / "arch")
+    cache = ArchitectureDiskCache(tmp_path / "cache")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cold = cache.load(arch, _parse_architecture)
+    warm = cache.load(arch, _fail_parse)
+
+    assert warm is not cold
+    assert _generated_files(warm, tmp_path / "warm") == _generated_files(cold, tmp_path / "cold")
+
+
+def test_disk_cache_warns_when_a_value_cannot_be_pickled(tmp_path: Path) -> None:
+    """An unpicklable model is reported instead of silently not being cached."""
+    cache = ArchitectureDiskCache(tmp_path / "cache")
+
+    with pytest.warns(RuntimeWarning, match="cannot be pickled"):
+        assert cache.put("key", lambda: None) is False
+    assert cache.get("key") is None
+
+
+def test_disk_cache_skips_parse_on_warm_load(tmp_path: Path) -> None:
+    """A second load of unchanged files is served from the cache without parsing."""
+    write_model(tmp_path / "arch" / "model.sysml", "package Example { }")
+    cache = ArchitectureDiskCache(tmp_path / "cache")
+    calls: list[Path] = []
+
+    first = cache.load(tmp_path / "arch", _counting_parser(calls))
+    second = cache.load(tmp_path / "arch", _counting_parser(calls))
+
+    assert first == second == {"parsed": ["model.sysml"]}
+    assert len(calls) == 1
+
+
+def test_disk_cache_reparses_when_file_content_changes(tmp_path: Path) -> None:
+    """Editing any input file changes the cache key."""
+    model_path = tmp_path / "arch" / "model.sysml"
+    write_model(model_path, "package Example { }")
+    cache = ArchitectureDiskCache(tmp_path / "cache")
+    calls: list[Path] = []
+
+    cache.load(tmp_path / "arch", _counting_parser(calls))
+    write_model(model_path, "package Example { part def A { } }")
+    cache.load(tmp_path / "arch", _counting_parser(calls))
+
+    assert len(calls) == 2
+
+
+def test_disk_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Entries beyond the size bound are evicted oldest-access first."""
+    cache = ArchitectureDiskCache(tmp_path / "cache", max_bytes=10_000)
+    payload = "x" * 4_000
+
+    cache.put("a", payload)
+    cache.put("b", payload)
+    os.utime(tmp_path / "cache" / "a.pickle", (1, 1))
+    os.utime(tmp_path / "cache" / "b.pickle", (2, 2))
+    cache.put("c", payload)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == payload
+    assert cache.get("c") == payload
+
+
+def test_default_cache_dir_honours_xdg_cache_home(tmp_path: Path, monkeypatch) -> None:
+    """Without an explicit override the cache lives under $XDG_CACHE_HOME."""
+    monkeypatch.delenv("PYSSP_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    assert default_cache_dir() == tmp_path / "xdg" / "pyssp_sysml2"
+
+
+def test_memory_cache_reports_hits_misses_and_evictions(tmp_path: Path) -> None:
+    """The LRU keeps at most max_entries architectures and counts its lookups."""
+    for name in ("a", "b"):
+        write_model(tmp_path / name / "model.sysml", "package Example { }")
+    cache = ArchitectureMemoryCache(max_entries=1)
+    calls: list[Path] = []
+
+    cache.load(tmp_path / "a", _counting_parser(calls))
+    cache.load(tmp_path / "a", _counting_parser(calls))
+    cache.load(tmp_path / "b", _counting_parser(calls))
+    cache.load(tmp_path / "a", _counting_parser(calls))
+
+    assert len(calls) == 3
+    assert cache.stats == CacheStats(hits=1, misses=3, evictions=2, entries=1, max_entries=1)
+
+
+def test_memory_cache_invalidates_on_file_change(tmp_path: Path) -> None:
+    """A changed mtime or size of an input file forces a new parse."""
+    model_path = tmp_path / "arch" / "model.sysml"
+    write_model(model_path, "package Example { }")
+    cache = ArchitectureMemoryCache()
+    calls: list[Path] = []
+
+    cache.load(tmp_path / "arch", _counting_parser(calls))
+    write_model(model_path, "package Example { part def A { } }")
+    cache.load(tmp_path / "arch", _counting_parser(calls))
+
+    assert len(calls) == 2
+
+
+def test_memory_cache_returns_copy_for_mutable_loads(tmp_path: Path) -> None:
+    """Callers that edit the model in place never modify the cached entry."""
+    write_model(tmp_path / "arch" / "model.sysml", "package Example { }")
+    cache = ArchitectureMemoryCache()
+    calls: list[Path] = []
+
+    editable = cache.load(tmp_path / "arch", _counting_parser(calls), mutable=True)
+    editable["parsed"].append("edited.sysml")
+
+    assert cache.load(tmp_path / "arch", _counting_parser(calls)) == {"parsed": ["model.sysml"]}
+    assert len(calls) == 1
+
+
+def _composition_summary(architecture) -> tuple[list[str], list[str], list[str]]:
+    system = architecture.get_def(NodeType.Part, COMPOSITION_NAME)
+    source = architecture.get_def(NodeType.Part, "Source")
+    return (
+        sorted(system.refs(NodeType.Part)),
+        sorted(system.defs(NodeType.Connection)),
+        sorted(source.defs(NodeType.Attribute)),
+    )
+
+
+def test_memory_cache_mutable_load_deep_copies_a_parsed_architecture(tmp_path: Path) -> None:
+    """Editing the copy of a real parsed model, as sync does, leaves the cached model intact."""
+    arch = _write_linked_architecture(tmp_path / "arch")
+    cache = ArchitectureMemoryCache()
+    cached = cache.load(arch, _parse_architecture)
+    before = _composition_summary(cached)
+
+    editable = cache.load(arch, _fail_parse, mutable=True)
+    system = editable.get_def(NodeType.Part, COMPOSITION_NAME)
+    for key in list(system.defs(NodeType.Connection)):
+        system.remove_def(NodeType.Connection, key)
+    system.remove_ref(NodeType.Part, "dst")
+    editable.get_def(NodeType.Part, "Source").remove_def(NodeType.Attribute, "gain")
+
+    assert editable is not cached
+    assert _composition_summary(editable) == (["src"], [], ["table"])
+    assert _composition_summary(cache.load(arch, _fail_parse)) == before
+    assert before[1] and "dst" in before[0] and "gain" in before[2]
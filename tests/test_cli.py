@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pyssp_sysml2.architecture as architecture_module
 from pyssp_sysml2.cli import main
 from pyssp_sysml2.ssd import generate_ssd
 from tests.test_generate_ssd import _ssd_summary
@@ -152,3 +153,47 @@ def test_pyssp_sync_ssd_cli_fails_for_missing_ssd(tmp_path: Path) -> None:
     assert code == 1
     after = composition_path.read_text(encoding="utf-8")
     assert after == before
+
+
+def test_pyssp_generate_cli_warm_cache_skips_parsing(tmp_path: Path, monkeypatch) -> None:
+    """A warm CLI invocation loads the parsed architecture from the cache."""
+    architecture_dir = write_cli_architecture(tmp_path / "arch")
+    args = [
+        "generate",
+        "ssd",
+        "--architecture",
+        str(architecture_dir),
+        "--composition",
+        COMPOSITION_NAME,
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--output",
+    ]
+    assert main([*args, str(tmp_path / "cold.ssd")]) == 0
+
+    def fail_parse(_architecture_path):
+        raise AssertionError("architecture was re-parsed")
+
+    monkeypatch.setattr(architecture_module, "_parse_architecture", fail_parse)
+    assert main([*args, str(tmp_path / "warm.ssd")]) == 0
+    assert _ssd_summary(tmp_path / "warm.ssd") == _ssd_summary(tmp_path / "cold.ssd")
+
+
+def test_pyssp_generate_cli_does_not_cache_by_default(tmp_path: Path) -> None:
+    """Without --cache or --cache-dir nothing is pickled into the cache directory."""
+    architecture_dir = write_cli_architecture(tmp_path / "arch")
+    code = main(
+        [
+            "generate",
+            "ssd",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output",
+            str(tmp_path / "out.ssd"),
+        ]
+    )
+
+    assert code == 0
+    assert not (tmp_path / ".pyssp-cache").exists()
@@ -0,0 +1,92 @@
+"""Guards against super-linear growth in the SSD and sync hot paths.
+
+Each test times one function on a synthetic input and on one eight times
+larger. Linear and n log n code grows about 8-10x; a quadratic scan grows
+about 64x, so the bound below catches it without depending on machine speed.
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Callable
+
+from pycps_sysmlv2 import SysMLPartDefinition
+from pyssp_standard.ssd import SSD
+
+from pyssp_sysml2.events import Progress
+from pyssp_sysml2.ssd import build_ssd
+from pyssp_sysml2.sync import _derive_port_connections_from_ssd, _derive_target_parts
+from pyssp_sysml2.synth import SsdSpec, write_ssd
+from pyssp_sysml2.sysml import _read_ssd_system, build_architecture_from_ssd
+
+SMALL = 100
+GROWTH = 8
+MAX_RATIO = 24.0
+REPEAT = 3
+
+
+def _ssd_system(tmp_path: Path, components: int):
+    spec = SsdSpec(
+        components=components,
+        component_types=max(1, components // 4),
+        scalar_connectors=0,
+    )
+    return _read_ssd_system(write_ssd(tmp_path / f"synth-{components}.ssd", spec))
+
+
+def _best_time(run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _assert_scales(tmp_path: Path, make_run: Callable[[object], Callable[[], object]]) -> None:
+    small = _best_time(make_run(_ssd_system(tmp_path, SMALL)))
+    large = _best_time(make_run(_ssd_system(tmp_path, SMALL * GROWTH)))
+
+    ratio = large / small
+    assert ratio < MAX_RATIO, f"{GROWTH}x larger input took {ratio:.1f}x longer"
+
+
+def test_build_architecture_from_ssd_scales_linearly(tmp_path: Path) -> None:
+    _assert_scales(
+        tmp_path,
+        lambda ssd_system: lambda: build_architecture_from_ssd(ssd_system, "Synth"),
+    )
+
+
+def test_derive_target_parts_scales_linearly(tmp_path: Path) -> None:
+    """Every component is resolved by source, since the composition starts empty."""
+
+    def make_run(ssd_system):
+        architecture, _ = build_architecture_from_ssd(ssd_system, "Synth")
+        empty = SysMLPartDefinition(name="Empty", source_file="architecture.sysml")
+        return lambda: _derive_target_parts(
+            architecture, empty, ssd_system, Progress(None, "sync")
+        )
+
+    _assert_scales(tmp_path, make_run)
+
+
+def test_derive_port_connections_from_ssd_scales_linearly(tmp_path: Path) -> None:
+    def make_run(ssd_system):
+        architecture, system = build_architecture_from_ssd(ssd_system, "Synth")
+        target_parts = _derive_target_parts(
+            architecture, system, ssd_system, Progress(None, "sync")
+        )
+        return lambda: _derive_port_connections_from_ssd(target_parts, ssd_system)
+
+    _assert_scales(tmp_path, make_run)
+
+
+def test_build_ssd_scales_linearly(tmp_path: Path) -> None:
+    def make_run(ssd_system):
+        _, system = build_architecture_from_ssd(ssd_system, "Synth")
+        # Not entered as a context manager, so nothing is serialized or written.
+        ssd = SSD(tmp_path / "unused.ssd", mode="w")
+        return lambda: build_ssd(ssd, system)
+
+    _assert_scales(tmp_path, make_run)
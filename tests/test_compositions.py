@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pycps_sysmlv2 import SysMLParser
+
+import pyssp_sysml2.architecture as architecture_module
+from pyssp_sysml2.architecture import find_compositions
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.pipeline import generate_compositions
+from tests.test_utils import write_model
+
+
+def _write_architecture(root: Path) -> Path:
+    write_model(
+        root / "model.sysml",
+        """
+        package Example {
+          port def Signal {
+            attribute x: Real;
+          }
+
+          part def Source {
+            attribute gain = 2.0;
+            out port outSig : Signal;
+          }
+
+          part def Sink {
+            in port inSig : Signal;
+          }
+
+          part def Filter {
+            in port inSig : Signal;
+            out port outSig : Signal;
+          }
+
+          part def Direct {
+            part src : Source;
+            part dst : Sink;
+            connect src.outSig to dst.inSig;
+          }
+
+          part def Filtered {
+            part src : Source;
+            part filter : Filter;
+            part dst : Sink;
+            connect src.outSig to filter.inSig;
+            connect filter.outSig to dst.inSig;
+          }
+        }
+        """,
+    )
+    return root
+
+
+def _relative_files(root: Path) -> list[str]:
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file())
+
+
+def test_find_compositions_returns_part_definitions_with_parts(tmp_path: Path) -> None:
+    """Only part definitions owning part references count as compositions."""
+    architecture = SysMLParser(_write_architecture(tmp_path / "arch")).parse()
+
+    assert [part_def.name for part_def in find_compositions(architecture)] == [
+        "Direct",
+        "Filtered",
+    ]
+
+
+def test_generate_compositions_parses_once_and_shares_model_descriptions(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Every composition is written from one parse and shared types are written once."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    parse_calls = []
+
+    class CountingParser(SysMLParser):
+        def parse(self):
+            parse_calls.append(self)
+            return super().parse()
+
+    monkeypatch.setattr(architecture_module, "SysMLParser", CountingParser)
+
+    output_dir = tmp_path / "generated"
+    results = generate_compositions(architecture_dir, output_dir)
+
+    assert len(parse_calls) == 1
+    assert list(results) == ["Direct", "Filtered"]
+    assert _relative_files(output_dir) == [
+        "Direct/SystemStructure.ssd",
+        "Direct/parameters.ssv",
+        "Filtered/SystemStructure.ssd",
+        "Filtered/parameters.ssv",
+        "model_descriptions/Filter/modelDescription.xml",
+        "model_descriptions/Sink/modelDescription.xml",
+        "model_descriptions/Source/modelDescription.xml",
+    ]
+    assert len(results["Direct"].model_descriptions) == 2
+    assert len(results["Filtered"].model_descriptions) == 3
+
+
+def test_generate_compositions_parallel_matches_serial(tmp_path: Path) -> None:
+    """Concurrent writers produce the same files as the serial run."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+
+    generate_compositions(architecture_dir, tmp_path / "serial", ["Direct", "Filtered"])
+    generate_compositions(
+        architecture_dir, tmp_path / "parallel", ["Direct", "Filtered"], parallel=True
+    )
+
+    assert _relative_files(tmp_path / "serial") == _relative_files(tmp_path / "parallel")
+    assert (tmp_path / "serial" / "Filtered" / "SystemStructure.ssd").read_bytes() == (
+        tmp_path / "parallel" / "Filtered" / "SystemStructure.ssd"
+    ).read_bytes()
+
+
+def test_pyssp_generate_ssd_with_repeated_composition(tmp_path: Path) -> None:
+    """Repeating --composition writes one SSD per composition next to --output."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output = tmp_path / "generated" / "SystemStructure.ssd"
+
+    code = main(
+        [
+            "generate",
+            "ssd",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            "Direct",
+            "--composition",
+            "Filtered",
+            "--output",
+            str(output),
+        ]
+    )
+
+    assert code == 0
+    assert (output.parent / "Direct" / "SystemStructure.ssd").exists()
+    assert (output.parent / "Filtered" / "SystemStructure.ssd").exists()
+
+
+def test_pyssp_generate_all_with_all_compositions(tmp_path: Path) -> None:
+    """--all-compositions generates every composition found in the architecture."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "generated"
+
+    code = main(
+        [
+            "generate",
+            "all",
+            "--architecture",
+            str(architecture_dir),
+            "--all-compositions",
+            "--output-dir",
+            str(output_dir),
+        ]
+    )
+
+    assert code == 0
+    assert (output_dir / "Direct" / "parameters.ssv").exists()
+    assert (output_dir / "Filtered" / "SystemStructure.ssd").exists()
+    assert (output_dir / "model_descriptions" / "Filter" / "modelDescription.xml").exists()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.events import (
+    COMPONENT_FINISHED,
+    COMPONENT_STARTED,
+    FILE_SKIPPED,
+    FILE_WRITTEN,
+    GenerationCancelled,
+    GenerationEvent,
+    Progress,
+    cancel_after,
+)
+from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.ssd import generate_ssd
+from pyssp_sysml2.ssv import generate_parameter_set
+from pyssp_sysml2.sysml import generate_sysml_from_ssd
+from tests.test_utils import COMPOSITION_NAME, write_source_sink_architecture
+
+
+def _kinds(events: list[GenerationEvent]) -> list[tuple[str, str]]:
+    return [(event.kind, event.name) for event in events]
+
+
+def test_progress_without_observer_emits_nothing() -> None:
+    """A Progress without observer is a no-op."""
+    progress = Progress(None, "ssd", total=1)
+
+    with progress.component("a"):
+        pass
+    progress.file_written(Path("out.ssd"))
+
+    assert progress.count == 0
+
+
+def test_cancel_after_raises_once_deadline_passed() -> None:
+    """cancel_after forwards events and cancels after the deadline."""
+    seen: list[GenerationEvent] = []
+    observer = cancel_after(0, seen.append)
+    progress = Progress(observer, "fmi", total=2)
+
+    with pytest.raises(GenerationCancelled, match="fmi generation cancelled"):
+        with progress.component("a"):
+            pass
+
+    assert _kinds(seen) == [(COMPONENT_STARTED, "a")]
+
+
+def test_generate_ssd_reports_components_and_file(tmp_path: Path) -> None:
+    """generate_ssd emits start/finish per component and the written file."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    output = tmp_path / "SystemStructure.ssd"
+    events: list[GenerationEvent] = []
+
+    generate_ssd(architecture_dir, output, COMPOSITION_NAME, observer=events.append)
+
+    assert _kinds(events) == [
+        (COMPONENT_STARTED, "src"),
+        (COMPONENT_FINISHED, "src"),
+        (COMPONENT_STARTED, "dst"),
+        (COMPONENT_FINISHED, "dst"),
+        (FILE_WRITTEN, str(output)),
+    ]
+    assert [(event.index, event.total) for event in events[:4:2]] == [(1, 2), (2, 2)]
+    assert all(event.generator == "ssd" for event in events)
+
+
+def test_generators_report_skipped_files_in_incremental_mode(tmp_path: Path) -> None:
+    """Up-to-date outputs are reported as skipped."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    output = tmp_path / "parameters.ssv"
+    generate_parameter_set(architecture_dir, output, COMPOSITION_NAME, incremental=True)
+    events: list[GenerationEvent] = []
+
+    generate_parameter_set(
+        architecture_dir, output, COMPOSITION_NAME, incremental=True, observer=events.append
+    )
+
+    assert _kinds(events) == [(FILE_SKIPPED, str(output))]
+
+
+def test_observer_can_cancel_model_description_generation(tmp_path: Path) -> None:
+    """Raising from the observer stops before the next component is written."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "model_descriptions"
+
+    def stop_after_first_file(event: GenerationEvent) -> None:
+        if event.kind == FILE_WRITTEN:
+            raise GenerationCancelled("enough")
+
+    with pytest.raises(GenerationCancelled):
+        generate_model_descriptions(
+            architecture_dir, output_dir, COMPOSITION_NAME, observer=stop_after_first_file
+        )
+
+    assert (output_dir / "Source" / "modelDescription.xml").exists()
+    assert not (output_dir / "Sink" / "modelDescription.xml").exists()
+
+
+def test_generate_sysml_from_ssd_reports_components(tmp_path: Path) -> None:
+    """SSD-to-SysML generation emits an event pair per SSD component."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    ssd_path = generate_ssd(architecture_dir, tmp_path / "SystemStructure.ssd", COMPOSITION_NAME)
+    events: list[GenerationEvent] = []
+
+    output = generate_sysml_from_ssd(
+        ssd_path, tmp_path / "architecture.sysml", observer=events.append
+    )
+
+    finished = [event.name for event in events if event.kind == COMPONENT_FINISHED]
+    assert finished == ["dst", "src"]
+    assert events[-1].path == output
+
+
+def test_pyssp_generate_progress_flag_prints_to_stderr(tmp_path: Path, capsys) -> None:
+    """CLI --progress prints one line per finished component and file."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    code = main(
+        [
+            "generate",
+            "ssv",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output",
+            str(tmp_path / "parameters.ssv"),
+            "--no-cache",
+            "--progress",
+        ]
+    )
+
+    stderr = capsys.readouterr().err
+    assert code == 0
+    assert "[ssv 1/2] src" in stderr
+    assert "[ssv] wrote" in stderr
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from pyssp_sysml2.fmi_helpers import format_value, format_values
+
+
+@pytest.mark.parametrize(
+    ("tag", "literals"),
+    [
+        ("Real", [1, 2.5, 1e-7, 1e300, True]),
+        ("Real", [1.0, "3.5", None]),
+        ("Integer", [0, -3, 1000, True]),
+        ("Integer", [2**70, 2.0, "4"]),
+        ("Boolean", [0, 1, True, False]),
+        ("Boolean", [True, None]),
+        ("String", ["a", 1]),
+        ("Real", []),
+    ],
+)
+def test_format_values_matches_format_value_per_element(tag: str, literals: list) -> None:
+    """The batched path and its fallback give the same strings as format_value."""
+    assert format_values(tag, literals) == [format_value(tag, literal) for literal in literals]
+    assert format_values(tag, iter(literals)) == [format_value(tag, literal) for literal in literals]
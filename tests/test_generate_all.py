@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pycps_sysmlv2 import SysMLParser
+
+import pyssp_sysml2.architecture as architecture_module
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.pipeline import generate_all
+from tests.test_utils import COMPOSITION_NAME, write_source_sink_architecture
+
+
+def _relative_files(root: Path) -> list[str]:
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file())
+
+
+def test_generate_all_parses_architecture_once(tmp_path: Path, monkeypatch) -> None:
+    """All artifacts are written from a single SysML parse."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    parse_calls = []
+
+    class CountingParser(SysMLParser):
+        def parse(self):
+            parse_calls.append(self)
+            return super().parse()
+
+    monkeypatch.setattr(architecture_module, "SysMLParser", CountingParser)
+
+    output_dir = tmp_path / "generated"
+    artifacts = generate_all(architecture_dir, output_dir, COMPOSITION_NAME)
+
+    assert len(parse_calls) == 1
+    assert artifacts.ssd == output_dir / "SystemStructure.ssd"
+    assert artifacts.ssv == output_dir / "parameters.ssv"
+    assert _relative_files(output_dir) == [
+        "SystemStructure.ssd",
+        "model_descriptions/Sink/modelDescription.xml",
+        "model_descriptions/Source/modelDescription.xml",
+        "parameters.ssv",
+    ]
+
+
+def test_generate_all_parallel_writes_same_artifacts(tmp_path: Path) -> None:
+    """Running the writers concurrently produces the same set of files."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    serial = generate_all(architecture_dir, tmp_path / "serial", COMPOSITION_NAME)
+    parallel = generate_all(architecture_dir, tmp_path / "parallel", COMPOSITION_NAME, parallel=True)
+
+    assert _relative_files(tmp_path / "serial") == _relative_files(tmp_path / "parallel")
+    assert (tmp_path / "serial" / "SystemStructure.ssd").read_bytes() == (
+        tmp_path / "parallel" / "SystemStructure.ssd"
+    ).read_bytes()
+    assert len(serial.model_descriptions) == len(parallel.model_descriptions)
+
+
+def test_generate_all_parallel_with_jobs_writes_same_artifacts(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Worker processes started from a writer thread render the same model descriptions."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    generate_all(architecture_dir, tmp_path / "serial", COMPOSITION_NAME)
+    generate_all(architecture_dir, tmp_path / "parallel", COMPOSITION_NAME, parallel=True, jobs=2)
+
+    assert _relative_files(tmp_path / "serial") == _relative_files(tmp_path / "parallel")
+    for name in _relative_files(tmp_path / "serial"):
+        if name.startswith("model_descriptions/"):
+            assert (tmp_path / "serial" / name).read_bytes() == (
+                tmp_path / "parallel" / name
+            ).read_bytes()
+
+
+def test_pyssp_generate_all_cli(tmp_path: Path) -> None:
+    """CLI generate all writes every artifact into the output directory."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "generated"
+
+    code = main(
+        [
+            "generate",
+            "all",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output-dir",
+            str(output_dir),
+            "--parallel",
+        ]
+    )
+
+    assert code == 0
+    assert (output_dir / "SystemStructure.ssd").exists()
+    assert (output_dir / "parameters.ssv").exists()
+    assert (output_dir / "model_descriptions" / "Source" / "modelDescription.xml").exists()
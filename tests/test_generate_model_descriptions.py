@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
 
-from pyssp_sysml2.fmi import generate_model_descriptions
+from pycps_sysmlv2 import SysMLParser
+
+import pyssp_sysml2.fmi as fmi_module
+from pyssp_sysml2.fmi import generate_model_descriptions, generate_model_descriptions_from_model
 from tests.test_utils import COMPOSITION_NAME, write_model
 
 
@@ -165,3 +169,298 @@ def test_generate_model_descriptions_writes_one_file_per_component_type(tmp_path
         "Controller/modelDescription.xml",
         "Sensor/modelDescription.xml",
     ]
+
+
+def test_generate_model_descriptions_from_model_matches_path_based_output(tmp_path: Path) -> None:
+    """A pre-parsed architecture yields the same variables as the path-based generator."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            attribute gain = 2.5;
+            out port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    architecture = SysMLParser(tmp_path / "arch").parse()
+
+    [from_model] = generate_model_descriptions_from_model(
+        architecture, tmp_path / "from_model", COMPOSITION_NAME
+    )
+    [from_path] = generate_model_descriptions(tmp_path / "arch", tmp_path / "from_path", COMPOSITION_NAME)
+
+    assert _model_description_summary(from_model) == _model_description_summary(from_path)
+
+
+def test_generate_model_descriptions_with_jobs_matches_serial_output(tmp_path: Path) -> None:
+    """Worker processes write the same files and return paths in part order."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Sensor {{
+            attribute offsets = [0.5, 1.5];
+            out port status : Status;
+          }}
+
+          part def Controller {{
+            attribute gain = 2.5;
+            in port status : Status;
+          }}
+
+          part def Logger {{
+            in port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part sensor : Sensor;
+            part controller : Controller;
+            part logger : Logger;
+          }}
+        }}
+        """,
+    )
+
+    serial = generate_model_descriptions(tmp_path / "arch", tmp_path / "serial", COMPOSITION_NAME)
+    parallel = generate_model_descriptions(
+        tmp_path / "arch", tmp_path / "parallel", COMPOSITION_NAME, jobs=2
+    )
+
+    assert [path.parent.name for path in parallel] == ["Sensor", "Controller", "Logger"]
+    for serial_path, parallel_path in zip(serial, parallel):
+        assert _model_description_summary(parallel_path) == _model_description_summary(serial_path)
+
+
+def test_generate_model_descriptions_renders_each_part_definition_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Many instances of one type share a single rendered modelDescription.xml."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Sensor {{
+            out port status : Status;
+          }}
+
+          part def Controller {{
+            in port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part s1 : Sensor;
+            part s2 : Sensor;
+            part controller : Controller;
+            part s3 : Sensor;
+          }}
+        }}
+        """,
+    )
+    rendered: list[str] = []
+    stream = fmi_module._stream_model_description
+
+    def counting_stream(spec, write, compact=False):
+        rendered.append(spec.part_name)
+        stream(spec, write, compact)
+
+    monkeypatch.setattr(fmi_module, "_stream_model_description", counting_stream)
+
+    written = generate_model_descriptions(tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME)
+
+    assert rendered == ["Sensor", "Controller"]
+    assert [path.parent.name for path in written] == ["Sensor", "Controller"]
+
+
+def test_compact_model_description_has_same_content_without_indentation(tmp_path: Path) -> None:
+    """compact drops the whitespace between elements but keeps every variable."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            attribute table = [1.0, 2.0, 3.0];
+            out port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+
+    [indented] = generate_model_descriptions(tmp_path / "arch", tmp_path / "indented", COMPOSITION_NAME)
+    [compact] = generate_model_descriptions(
+        tmp_path / "arch", tmp_path / "compact", COMPOSITION_NAME, compact=True
+    )
+
+    assert _model_description_summary(compact) == _model_description_summary(indented)
+    assert compact.read_text(encoding="utf-8").count("\n") == 1
+    assert "\n    <ScalarVariable" in indented.read_text(encoding="utf-8")
+
+
+def test_streamed_model_description_matches_elementtree_layout(tmp_path: Path) -> None:
+    """The streaming writer produces the bytes of ET.indent plus ET.tostring."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            doc /* Uses "quotes" & <brackets> */
+            attribute table = [1.0, 2.0];
+            in port command : Status;
+            out port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    [path] = generate_model_descriptions(tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME)
+
+    root = ET.parse(path).getroot()
+    ET.indent(root, space="  ")
+    assert path.read_bytes() == ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def test_fmu_mode_writes_model_description_and_resources_into_archive(tmp_path: Path) -> None:
+    """fmu writes <PartDef>.fmu with the same modelDescription.xml and the part's resources."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            out port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part a : Comp;
+            part b : Comp;
+          }}
+        }}
+        """,
+    )
+    resources = tmp_path / "resources"
+    (resources / "Comp" / "data").mkdir(parents=True)
+    (resources / "Comp" / "data" / "table.csv").write_text("t,y\n0,1\n", encoding="utf-8")
+
+    [xml_path] = generate_model_descriptions(tmp_path / "arch", tmp_path / "xml", COMPOSITION_NAME)
+    [fmu_path] = generate_model_descriptions(
+        tmp_path / "arch",
+        tmp_path / "fmu",
+        COMPOSITION_NAME,
+        fmu=True,
+        resources_dir=resources,
+        compression_level=9,
+    )
+
+    assert fmu_path == tmp_path / "fmu" / "Comp.fmu"
+    with zipfile.ZipFile(fmu_path) as archive:
+        assert archive.namelist() == ["modelDescription.xml", "resources/data/table.csv"]
+        assert archive.read("modelDescription.xml") == xml_path.read_bytes()
+        assert archive.read("resources/data/table.csv") == b"t,y\n0,1\n"
+
+
+def test_fmu_archives_are_reproducible(tmp_path: Path, monkeypatch) -> None:
+    """Regenerating an FMU gives identical bytes, so the file is left untouched."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          part def Comp {{
+            attribute gain = 2.0;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    [first] = generate_model_descriptions(
+        tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME, fmu=True
+    )
+    before = (first.read_bytes(), first.stat().st_mtime_ns)
+    [second] = generate_model_descriptions(
+        tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME, fmu=True
+    )
+
+    assert (second.read_bytes(), second.stat().st_mtime_ns) == before
+
+
+def test_fmi3_writes_list_attributes_as_array_variables(tmp_path: Path) -> None:
+    """FMI 3.0 keeps a list attribute as one array variable with a Dimension."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            attribute gain = 2.0;
+            attribute table = [1.0, 2.5, 4.0];
+            out port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+
+    [path] = generate_model_descriptions(
+        tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME, fmi_version="3.0"
+    )
+
+    root = ET.parse(path).getroot()
+    variables = [
+        f"{elem.tag}|{elem.get('name')}|{elem.get('valueReference')}|{elem.get('causality')}|"
+        f"{elem.get('start')}|{[dim.get('start') for dim in elem.findall('Dimension')]}"
+        for elem in root.find("ModelVariables")
+    ]
+    assert root.get("fmiVersion") == "3.0"
+    assert variables == [
+        "Float64|gain|0|parameter|2|[]",
+        "Float64|table|1|parameter|1 2.5 4|['3']",
+        "Boolean|status.ok|2|output|None|[]",
+    ]
+    assert [(elem.tag, elem.get("valueReference")) for elem in root.find("ModelStructure")] == [
+        ("Output", "2"),
+        ("InitialUnknown", "2"),
+    ]
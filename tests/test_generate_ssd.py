@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from pycps_sysmlv2 import NodeType, SysMLParser
 from pyssp_standard.ssd import SSD
 
-from pyssp_sysml2.ssd import build_ssd
+from pyssp_sysml2.ssd import build_ssd, generate_ssd_from_model
 from tests.test_utils import COMPOSITION_NAME, write_model
 
 
@@ -155,3 +156,61 @@ def test_generate_ssd_writes_core_ssd_metadata(tmp_path: Path) -> None:
         assert component.name == "src"
         assert component.component_type == "application/x-fmu-sharedlibrary"
         assert component.source == "resources/Source.fmu"
+
+
+def test_generate_ssd_from_model_accepts_package_or_composition(tmp_path: Path) -> None:
+    """Pre-parsed packages and composition part definitions produce the same SSD."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          port def Signal {{
+            attribute x: Real;
+          }}
+
+          part def Source {{
+            out port outSig : Signal;
+          }}
+
+          part def Sink {{
+            in port inSig : Signal;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part src : Source;
+            part dst : Sink;
+            connect src.outSig to dst.inSig;
+          }}
+        }}
+        """,
+    )
+    architecture = SysMLParser(tmp_path / "arch").parse()
+    system = architecture.get_def(NodeType.Part, COMPOSITION_NAME)
+
+    from_package = generate_ssd_from_model(architecture, tmp_path / "a.ssd", COMPOSITION_NAME)
+    from_part = generate_ssd_from_model(system, tmp_path / "b.ssd")
+
+    assert _ssd_summary(from_package) == _ssd_summary(from_part) == [
+        "component dst",
+        "  input:inSig.x:Real",
+        "component src",
+        "  output:outSig.x:Real",
+        "connection src.outSig.x -> dst.inSig.x",
+    ]
+
+
+def test_generate_ssd_from_model_requires_composition_for_package(tmp_path: Path) -> None:
+    """A package without a composition name cannot be resolved."""
+    write_model(
+        tmp_path / "arch" / "model.sysml",
+        f"""
+        package Example {{
+          part def {COMPOSITION_NAME} {{
+          }}
+        }}
+        """,
+    )
+    architecture = SysMLParser(tmp_path / "arch").parse()
+
+    with pytest.raises(ValueError, match="Composition name must be provided"):
+        generate_ssd_from_model(architecture, tmp_path / "out.ssd")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.pipeline import generate_all
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _write_architecture(root: Path, status_type: str = "Boolean") -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: {status_type};
+          }}
+
+          port def Command {{
+            attribute setpoint: Real;
+          }}
+
+          part def Sensor {{
+            out port status : Status;
+          }}
+
+          part def Actuator {{
+            in port command : Command;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part sensor : Sensor;
+            part actuator : Actuator;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def _age(paths: list[Path]) -> None:
+    for path in paths:
+        os.utime(path, ns=(1, 1))
+
+
+def test_incremental_fmi_rewrites_only_outputs_of_changed_port_def(tmp_path: Path) -> None:
+    """Editing one port def only regenerates the model descriptions that use it."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "model_descriptions"
+    written = generate_model_descriptions(
+        architecture_dir, output_dir, COMPOSITION_NAME, incremental=True
+    )
+    _age(written)
+
+    _write_architecture(architecture_dir, status_type="Integer")
+    rerun = generate_model_descriptions(
+        architecture_dir, output_dir, COMPOSITION_NAME, incremental=True
+    )
+
+    assert sorted(rerun) == sorted(written)
+    assert (output_dir / "Actuator" / "modelDescription.xml").stat().st_mtime_ns == 1
+    assert (output_dir / "Sensor" / "modelDescription.xml").stat().st_mtime_ns != 1
+
+
+def test_incremental_manifest_maps_outputs_to_source_definitions(tmp_path: Path) -> None:
+    """The manifest records which definitions every model description came from."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "model_descriptions"
+    generate_model_descriptions(architecture_dir, output_dir, COMPOSITION_NAME, incremental=True)
+
+    manifest = json.loads((output_dir / ".pyssp-manifest.json").read_text(encoding="utf-8"))
+
+    assert {key: entry["sources"] for key, entry in manifest["outputs"].items()} == {
+        "Actuator/modelDescription.xml": ["part def Actuator", "port def Command"],
+        "Sensor/modelDescription.xml": ["part def Sensor", "port def Status"],
+    }
+
+
+def test_incremental_manifest_lists_instances_sharing_a_model_description(tmp_path: Path) -> None:
+    """Every model description entry names the part instances it was generated for."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "model_descriptions"
+    generate_model_descriptions(architecture_dir, output_dir, COMPOSITION_NAME, incremental=True)
+
+    manifest = json.loads((output_dir / ".pyssp-manifest.json").read_text(encoding="utf-8"))
+
+    assert {key: entry["instances"] for key, entry in manifest["outputs"].items()} == {
+        "Actuator/modelDescription.xml": ["actuator"],
+        "Sensor/modelDescription.xml": ["sensor"],
+    }
+
+
+def test_incremental_generate_all_skips_unchanged_outputs(tmp_path: Path) -> None:
+    """A rerun on an unchanged architecture leaves every output untouched."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "generated"
+    artifacts = generate_all(architecture_dir, output_dir, COMPOSITION_NAME, incremental=True)
+    outputs = [artifacts.ssd, artifacts.ssv, *artifacts.model_descriptions]
+    _age(outputs)
+
+    generate_all(architecture_dir, output_dir, COMPOSITION_NAME, incremental=True)
+
+    assert [path.stat().st_mtime_ns for path in outputs] == [1] * len(outputs)
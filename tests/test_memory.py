@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import tracemalloc
+from pathlib import Path
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.memory import memory_profiling
+from pyssp_sysml2.pipeline import generate_all
+from pyssp_sysml2.trace import span, tracing
+from tests.test_utils import COMPOSITION_NAME, write_source_sink_architecture
+
+
+def test_memory_profiling_separates_peak_from_retained() -> None:
+    """Temporary allocations count toward the peak but not the retained size."""
+    with memory_profiling() as profiler:
+        with span("outer"):
+            kept = [bytearray(1024) for _ in range(512)]
+            with span("inner"):
+                scratch = [bytearray(4096) for _ in range(512)]
+                del scratch
+
+    stages = {stage.name: stage for stage in profiler.report().stages}
+    assert stages["inner"].peak >= 2 * 1024 * 1024
+    assert stages["inner"].retained < 64 * 1024
+    assert stages["outer"].peak >= stages["inner"].peak
+    assert stages["outer"].retained >= 512 * 1024
+    assert len(kept) == 512
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_report_lists_top_allocation_sites() -> None:
+    """The report names the source lines holding memory at the high-water mark."""
+    with memory_profiling(top=3) as profiler:
+        with span("allocate"):
+            kept = [bytearray(4096) for _ in range(256)]
+
+    report = profiler.report()
+    assert len(kept) == 256
+    assert report.high_water_stage == "allocate"
+    assert report.top_sites[0].location.startswith(__file__)
+    assert any("allocate" in line for line in report.format())
+
+
+def test_memory_profiling_shares_spans_with_tracing() -> None:
+    """Tracing and memory profiling observe the same spans together."""
+    with tracing() as tracer, memory_profiling() as profiler:
+        with span("shared"):
+            pass
+
+    assert [event["name"] for event in tracer.events] == ["shared"]
+    assert profiler.stages["shared"].calls == 1
+
+
+def test_memory_profiling_covers_generator_stages(tmp_path: Path) -> None:
+    """Parsing, build_ssd and modelDescription serialization are reported as stages."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    with memory_profiling() as profiler:
+        generate_all(architecture_dir, tmp_path / "generated", COMPOSITION_NAME)
+
+    assert {"parse architecture", "build_ssd", "serialize xml"} <= set(profiler.stages)
+
+
+def test_pyssp_generate_memory_report_flag(tmp_path: Path, capsys) -> None:
+    """CLI --memory-report prints the per-stage table after the run."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    code = main(
+        [
+            "generate",
+            "ssd",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output",
+            str(tmp_path / "SystemStructure.ssd"),
+            "--no-cache",
+            "--memory-report",
+        ]
+    )
+
+    output = capsys.readouterr().out
+    assert code == 0
+    assert "Peak traced memory" in output
+    assert "build_ssd" in output
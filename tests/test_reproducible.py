@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.paths import write_if_changed, write_text_if_changed
+from pyssp_sysml2.pipeline import generate_all
+from pyssp_sysml2.timestamps import (
+    format_generation_timestamp,
+    parse_timestamp,
+    set_generation_timestamp,
+)
+from tests.test_utils import COMPOSITION_NAME, write_source_sink_architecture
+
+
+def _files(root: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_source_date_epoch_sets_generation_timestamp(monkeypatch) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    assert format_generation_timestamp() == "2023-11-14T22:13:20Z"
+
+
+def test_fixed_timestamp_takes_precedence_over_source_date_epoch(monkeypatch) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    set_generation_timestamp(parse_timestamp("2024-01-02T03:04:05Z"))
+    try:
+        assert format_generation_timestamp() == "2024-01-02T03:04:05Z"
+    finally:
+        set_generation_timestamp(None)
+
+
+def test_write_text_if_changed_keeps_identical_file_untouched(tmp_path: Path) -> None:
+    """Equal content leaves the file and its mtime alone; new content replaces it."""
+    output = tmp_path / "out.txt"
+    assert write_text_if_changed(output, "same") is True
+    os.utime(output, ns=(1, 1))
+
+    assert write_text_if_changed(output, "same") is False
+    assert output.stat().st_mtime_ns == 1
+    assert write_text_if_changed(output, "different") is True
+    assert output.read_text(encoding="utf-8") == "different"
+    assert [path.name for path in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_write_if_changed_discards_temp_file_on_error(tmp_path: Path) -> None:
+    output = tmp_path / "out.txt"
+    output.write_text("old", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with write_if_changed(output) as pending:
+            pending.temp_path.write_text("partial", encoding="utf-8")
+            raise RuntimeError("writer failed")
+
+    assert output.read_text(encoding="utf-8") == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_reproducible_runs_write_identical_bytes(tmp_path: Path, monkeypatch) -> None:
+    """With SOURCE_DATE_EPOCH two runs produce byte-identical artifacts."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    generate_all(architecture_dir, tmp_path / "first", COMPOSITION_NAME)
+    generate_all(architecture_dir, tmp_path / "second", COMPOSITION_NAME)
+
+    first = _files(tmp_path / "first")
+    assert first == _files(tmp_path / "second")
+    assert b'generationDateAndTime="2023-11-14T22:13:20Z"' in first["SystemStructure.ssd"]
+    assert b'generationDateAndTime="2023-11-14T22:13:20Z"' in first[
+        "model_descriptions/Source/modelDescription.xml"
+    ]
+
+
+def test_unchanged_rerun_keeps_every_mtime(tmp_path: Path, monkeypatch) -> None:
+    """Regenerating identical content does not touch the files, even without --incremental."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    artifacts = generate_all(architecture_dir, tmp_path / "generated", COMPOSITION_NAME)
+    outputs = [artifacts.ssd, artifacts.ssv, *artifacts.model_descriptions]
+    for path in outputs:
+        os.utime(path, ns=(1, 1))
+
+    generate_all(architecture_dir, tmp_path / "generated", COMPOSITION_NAME)
+
+    assert [path.stat().st_mtime_ns for path in outputs] == [1] * len(outputs)
+
+
+def test_pyssp_generate_fmi_timestamp_flag(tmp_path: Path) -> None:
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    output_dir = tmp_path / "model_descriptions"
+
+    code = main(
+        [
+            "generate",
+            "fmi",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output-dir",
+            str(output_dir),
+            "--timestamp",
+            "2024-01-02T03:04:05Z",
+        ]
+    )
+
+    assert code == 0
+    text = (output_dir / "Sink" / "modelDescription.xml").read_text(encoding="utf-8")
+    assert 'generationDateAndTime="2024-01-02T03:04:05Z"' in text
+    assert parse_timestamp("1704164645") == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
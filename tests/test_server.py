@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from pyssp_sysml2.architecture import disable_memory_cache
+from pyssp_sysml2.server import METHOD_NOT_FOUND, SERVER_ERROR, RpcServer
+from pyssp_sysml2.sysml import set_ssd_cache
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+@pytest.fixture
+def server():
+    rpc = RpcServer(max_entries=2)
+    yield rpc
+    disable_memory_cache()
+    set_ssd_cache(None)
+
+
+def _write_architecture(root: Path) -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          part def Comp {{
+            attribute gain = 2.0;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def _request(request_id: int, method: str, **params) -> str:
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+
+
+def test_server_keeps_architecture_warm_between_requests(server, tmp_path: Path) -> None:
+    """Repeated generate requests reuse the parsed architecture from memory."""
+    architecture_dir = _write_architecture(tmp_path / "arch")
+    params = {"architecture": str(architecture_dir), "composition": COMPOSITION_NAME}
+
+    first = json.loads(
+        server.handle_line(_request(1, "generate.ssv", output=str(tmp_path / "a.ssv"), **params))
+    )
+    second = json.loads(
+        server.handle_line(_request(2, "generate.ssd", output=str(tmp_path / "a.ssd"), **params))
+    )
+    stats = json.loads(server.handle_line(_request(3, "cache.stats")))["result"]
+
+    assert first == {"jsonrpc": "2.0", "id": 1, "result": str(tmp_path / "a.ssv")}
+    assert second["result"] == str(tmp_path / "a.ssd")
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_server_reports_errors_without_stopping(server, tmp_path: Path) -> None:
+    """Unknown methods and failing generators produce JSON-RPC errors."""
+    unknown = json.loads(server.handle_line(_request(1, "generate.nothing")))
+    failing = json.loads(
+        server.handle_line(
+            _request(
+                2,
+                "generate.ssd",
+                architecture=str(_write_architecture(tmp_path / "arch")),
+                composition="MissingComposition",
+                output=str(tmp_path / "out.ssd"),
+            )
+        )
+    )
+
+    assert unknown["error"]["code"] == METHOD_NOT_FOUND
+    assert failing["error"]["code"] == SERVER_ERROR
+    assert not (tmp_path / "out.ssd").exists()
+
+
+def test_server_stream_stops_on_shutdown(server) -> None:
+    """The line-based transport answers each request and stops after shutdown."""
+    requests = "\n".join(
+        [_request(1, "cache.stats"), _request(2, "shutdown"), _request(3, "cache.stats")]
+    )
+    output = io.StringIO()
+
+    server.serve_stream(io.StringIO(requests + "\n"), output)
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [response["id"] for response in responses] == [1, 2]
+
+
+def test_serve_unix_socket_refuses_to_replace_a_regular_file(server, tmp_path: Path) -> None:
+    """A mistyped --socket path pointing at a file fails instead of deleting the file."""
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me", encoding="utf-8")
+
+    with pytest.raises(FileExistsError, match="not a socket"):
+        server.serve_unix_socket(path)
+    assert path.read_text(encoding="utf-8") == "keep me"
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Generous enough for slow CI runners; the CLI itself imports in tens of milliseconds
+# while loading pyssp_standard and pycps_sysmlv2 costs several hundred.
+STARTUP_BUDGET_MS = 300
+HEAVY_MODULE_PREFIXES = ("pycps_sysmlv2", "pyssp_standard", "lxml", "xmlschema")
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_ms(importtime_log: str, module: str) -> float:
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative_us) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_cli_help_does_not_import_generator_dependencies() -> None:
+    """`pyssp --help` only loads the CLI, not pycps_sysmlv2 or pyssp_standard."""
+    result = _run_python(
+        "import sys\n"
+        "from pyssp_sysml2.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in sys.modules if m.startswith(%r)))" % (HEAVY_MODULE_PREFIXES,)
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_package_import_is_lazy() -> None:
+    """Importing the package defers every generator module until first use."""
+    result = _run_python(
+        "import sys\n"
+        "import pyssp_sysml2\n"
+        "print(sorted(m for m in sys.modules if m.startswith('pyssp_sysml2.')))"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_import_stays_within_startup_budget() -> None:
+    """The CLI module imports within the startup budget."""
+    result = _run_python("import pyssp_sysml2.cli", "-X", "importtime")
+
+    assert _cumulative_import_ms(result.stderr, "pyssp_sysml2.cli") < STARTUP_BUDGET_MS
@@ -9,7 +9,7 @@ from pycps_sysmlv2 import NodeType, SysMLParser
 from pyssp_standard.ssd import Component, Connection, SSD
 
 from pyssp_sysml2.ssd import generate_ssd
-from pyssp_sysml2.sync import sync_sysml_from_ssd
+from pyssp_sysml2.sync import sync_sysml_from_model, sync_sysml_from_ssd
 from tests.test_utils import COMPOSITION_NAME, write_bootstrap_ssd, write_model
 
 
@@ -359,3 +359,25 @@ def test_sync_sysml_from_ssd_preserves_unrelated_definitions_and_file_layout(tmp
           attr y:Real=None
         """
     ).strip() + "\n"
+
+
+def test_sync_sysml_from_model_updates_parsed_architecture_in_place(tmp_path: Path) -> None:
+    """Syncing a pre-parsed architecture updates the in-memory model and writes it out."""
+    architecture_dir = _write_sync_architecture(tmp_path / "arch")
+    ssd_path = tmp_path / "SystemStructure.ssd"
+    generate_ssd(architecture_dir, ssd_path, COMPOSITION_NAME)
+
+    with SSD(ssd_path, mode="a") as ssd:
+        assert ssd.system is not None
+        ssd.system.connections = []
+
+    architecture = SysMLParser(architecture_dir).parse()
+    output_dir = tmp_path / "synced"
+    written = sync_sysml_from_model(architecture, ssd_path, COMPOSITION_NAME, output_dir)
+
+    assert all(path.exists() for path in written)
+    assert len(architecture.get_def(NodeType.Part, COMPOSITION_NAME).defs(NodeType.Connection)) == 0
+    assert _composition_summary(output_dir) == [
+        "part dst:Sink",
+        "part src:Source",
+    ]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+from pycps_sysmlv2 import NodeType, SysMLParser
+from pyssp_standard.ssd import SSD
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.synth import ArchitectureSpec, SsdSpec, render_architecture, render_ssd, write_ssd
+
+
+def test_synthetic_outputs_are_reproducible_from_the_seed() -> None:
+    """Equal specs give identical text and another seed changes it."""
+    assert render_architecture(ArchitectureSpec(seed=3)) == render_architecture(
+        ArchitectureSpec(seed=3)
+    )
+    assert render_architecture(ArchitectureSpec(seed=3)) != render_architecture(
+        ArchitectureSpec(seed=4)
+    )
+    assert render_ssd(SsdSpec(seed=3)) == render_ssd(SsdSpec(seed=3))
+    assert render_ssd(SsdSpec(seed=3)) != render_ssd(SsdSpec(seed=4))
+
+
+def test_synthetic_architecture_parses_with_requested_shape(tmp_path: Path) -> None:
+    """The architecture has the requested definitions, instances and typed connections."""
+    spec = ArchitectureSpec(part_defs=3, instances_per_def=4, ports_per_part=4, list_length=5)
+    (tmp_path / "architecture.sysml").write_text(render_architecture(spec), encoding="utf-8")
+
+    architecture = SysMLParser(tmp_path).parse()
+    composition = architecture.get_def(NodeType.Part, spec.composition)
+
+    assert len(composition.refs(NodeType.Part)) == 12
+    assert "table = [" in render_architecture(spec)
+    assert len(composition.defs(NodeType.Connection)) > 0
+
+
+def test_synthetic_ssd_has_dotted_scalar_and_fan_out_connections(tmp_path: Path) -> None:
+    """Every output feeds ``fan_out`` inputs and every input has one source."""
+    spec = SsdSpec(components=6, ports_per_component=2, attributes_per_port=2, list_length=1)
+    ssd_path = write_ssd(tmp_path / "synth.ssd", spec)
+
+    with SSD(ssd_path, mode="r") as ssd:
+        connections = ssd.system.connections
+        assert len(ssd.system.elements) == 6
+
+    assert len(connections) == spec.components * spec.connections_per_component
+    starts = Counter((c.start_element, c.start_connector) for c in connections)
+    ends = Counter((c.end_element, c.end_connector) for c in connections)
+    assert set(starts.values()) == {spec.fan_out}
+    assert set(ends.values()) == {1}
+    assert all(c.start_element != c.end_element for c in connections)
+    assert any(c.start_connector == "y0" for c in connections)
+    assert any(c.start_connector == "out0.X[1]" for c in connections)
+
+
+def test_connection_density_thins_out_connections() -> None:
+    dense = render_ssd(SsdSpec(components=20)).count("<ssd:Connection ")
+    sparse = render_ssd(SsdSpec(components=20, connection_density=0.25)).count(
+        "<ssd:Connection "
+    )
+
+    assert 0 < sparse < dense
+
+
+def test_pyssp_synth_ssd_writes_file(tmp_path: Path) -> None:
+    output = tmp_path / "synth.ssd"
+
+    code = main(["synth", "ssd", "--output", str(output), "--components", "4", "--seed", "7"])
+
+    assert code == 0
+    assert output.read_text(encoding="utf-8") == render_ssd(SsdSpec(components=4, seed=7))
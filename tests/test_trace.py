@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.pipeline import generate_all
+from pyssp_sysml2.trace import get_tracer, span, tracing
+from tests.test_utils import COMPOSITION_NAME, write_source_sink_architecture
+
+
+def _complete_events(trace: dict) -> list[dict]:
+    return [event for event in trace["traceEvents"] if event["ph"] == "X"]
+
+
+def test_span_is_a_no_op_without_active_tracer() -> None:
+    """Spans outside tracing() record nothing."""
+    with span("outside"):
+        pass
+
+    assert get_tracer() is None
+
+
+def test_tracing_records_nested_spans_in_chrome_format(tmp_path: Path) -> None:
+    """Nested spans become complete events contained in their parent."""
+    output = tmp_path / "trace.json"
+
+    with tracing(output):
+        with span("outer", category="test", size=3):
+            with span("inner", category="test"):
+                pass
+
+    trace = json.loads(output.read_text(encoding="utf-8"))
+    outer, inner = _complete_events(trace)
+    assert (outer["name"], inner["name"]) == ("outer", "inner")
+    assert outer["args"] == {"size": 3}
+    assert outer["tid"] == inner["tid"] == threading.get_ident()
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert trace["traceEvents"][0]["ph"] == "M"
+
+
+def test_tracing_covers_generator_stages(tmp_path: Path) -> None:
+    """generate_all records parse, build, serialization and write spans."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+
+    with tracing() as tracer:
+        generate_all(architecture_dir, tmp_path / "generated", COMPOSITION_NAME)
+
+    names = {event["name"] for event in _complete_events(tracer.to_chrome_trace())}
+    assert {
+        "load architecture",
+        "resolve composition",
+        "build_ssd",
+        "build_ssd component",
+        "write SSD",
+        "write SSV",
+        "build model description",
+        "serialize xml",
+        "write file",
+    } <= names
+    components = [
+        event["args"]["component"]
+        for event in _complete_events(tracer.to_chrome_trace())
+        if event["name"] == "build_ssd component"
+    ]
+    assert components == ["src", "dst"]
+
+
+def test_pyssp_generate_trace_flag_writes_trace_file(tmp_path: Path) -> None:
+    """CLI --trace writes a Chrome trace next to the generated artifact."""
+    architecture_dir = write_source_sink_architecture(tmp_path / "arch")
+    trace_path = tmp_path / "trace.json"
+
+    code = main(
+        [
+            "generate",
+            "ssd",
+            "--architecture",
+            str(architecture_dir),
+            "--composition",
+            COMPOSITION_NAME,
+            "--output",
+            str(tmp_path / "SystemStructure.ssd"),
+            "--no-cache",
+            "--trace",
+            str(trace_path),
+        ]
+    )
+
+    assert code == 0
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert "build_ssd" in {event["name"] for event in _complete_events(trace)}
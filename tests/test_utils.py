@@ -14,6 +14,36 @@ def write_model(path: Path, content: str) -> None:
     path.write_text(content.strip() + "\n", encoding="utf-8")
 
 
+def write_source_sink_architecture(root: Path) -> Path:
+    """Write a composition of a Source connected to a Sink into ``root`` and return it."""
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          port def Signal {{
+            attribute x: Real;
+          }}
+
+          part def Source {{
+            attribute gain = 2.0;
+            out port outSig : Signal;
+          }}
+
+          part def Sink {{
+            in port inSig : Signal;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part src : Source;
+            part dst : Sink;
+            connect src.outSig to dst.inSig;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
 def write_bootstrap_ssd(path: Path, composition_name: str = COMPOSITION_NAME) -> Path:
     with SSD(path, mode="w") as ssd:
         ssd.name = composition_name
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+from pyssp_sysml2.cli import main
+from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.verify import read_model_variables, verify_fmus
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _write_architecture(root: Path, parameters: str) -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          port def Status {{
+            attribute ok: Boolean;
+          }}
+
+          part def Comp {{
+            {parameters}
+            out port status : Status;
+          }}
+
+          part def Sensor {{
+            in port status : Status;
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+            part s : Sensor;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def _problems(reports) -> dict[str, list[str]]:
+    return {report.path.name: report.problems for report in reports}
+
+
+def test_verify_accepts_fmus_generated_from_the_architecture(tmp_path: Path) -> None:
+    """FMUs written by generate fmi match, for FMI 2.0 and 3.0, serially and on workers."""
+    arch = _write_architecture(tmp_path / "arch", "attribute table = [1.0, 2.0];")
+    for version in ("2.0", "3.0"):
+        fmu_dir = tmp_path / version
+        generate_model_descriptions(arch, fmu_dir, COMPOSITION_NAME, fmu=True, fmi_version=version)
+
+        for jobs in (1, 2):
+            reports = verify_fmus(arch, fmu_dir, COMPOSITION_NAME, jobs=jobs)
+            assert _problems(reports) == {"Comp.fmu": [], "Sensor.fmu": []}
+
+
+def test_verify_reports_variables_that_drifted_from_the_architecture(tmp_path: Path) -> None:
+    """A renumbered, missing or unknown variable and stray or missing FMUs are reported."""
+    fmu_dir = tmp_path / "fmus"
+    old_arch = _write_architecture(tmp_path / "old", "attribute gain = 2.0;")
+    generate_model_descriptions(old_arch, fmu_dir, COMPOSITION_NAME, fmu=True)
+    (fmu_dir / "Sensor.fmu").rename(fmu_dir / "Other.fmu")
+
+    new_arch = _write_architecture(tmp_path / "new", "attribute bias = 1; attribute offset = 0.5;")
+    reports = verify_fmus(new_arch, fmu_dir, COMPOSITION_NAME, jobs=1)
+
+    assert _problems(reports) == {
+        "Comp.fmu": [
+            "gain: not in the architecture",
+            "status.ok: valueReference '1', expected 2",
+            "bias: missing",
+            "offset: missing",
+        ],
+        "Other.fmu": [f"no component type of {COMPOSITION_NAME} is built as Other.fmu"],
+        "Sensor.fmu": ["FMU missing"],
+    }
+
+
+def test_read_model_variables_detaches_elements_once_read(tmp_path: Path, monkeypatch) -> None:
+    """Read variables are removed from the tree, so the parsed document stays small."""
+    fmu_path = tmp_path / "Comp.fmu"
+    with zipfile.ZipFile(fmu_path, "w") as archive:
+        archive.writestr(
+            "modelDescription.xml",
+            '<fmiModelDescription fmiVersion="2.0"><ModelVariables>'
+            + "".join(
+                f'<ScalarVariable name="p{index}" valueReference="{index}"'
+                ' causality="parameter"><Real start="1.0" /></ScalarVariable>'
+                for index in range(100)
+            )
+            + "</ModelVariables><ModelStructure><Outputs /></ModelStructure>"
+            "</fmiModelDescription>",
+        )
+    roots = []
+    iterparse = ET.iterparse
+
+    def recording_iterparse(source, events):
+        for event, elem in iterparse(source, events):
+            if not roots:
+                roots.append(elem)
+            yield event, elem
+
+    monkeypatch.setattr(ET, "iterparse", recording_iterparse)
+
+    version, variables = read_model_variables(fmu_path)
+
+    assert version == "2.0"
+    assert variables[:2] == [("p0", "parameter", "Real", "0"), ("p1", "parameter", "Real", "1")]
+    assert len(variables) == 100
+    assert len(roots[0]) == 0
+
+
+def test_pyssp_verify_fmu_cli_exit_code(tmp_path: Path, capsys) -> None:
+    arch = _write_architecture(tmp_path / "arch", "attribute gain = 2.0;")
+    fmu_dir = tmp_path / "fmus"
+    generate_model_descriptions(arch, fmu_dir, COMPOSITION_NAME, fmu=True)
+    args = ["verify", "fmu", "--architecture", str(arch), "--composition", COMPOSITION_NAME]
+
+    assert main([*args, "--fmu-dir", str(fmu_dir), "--no-cache"]) == 0
+    assert "2/2 FMUs match the architecture" in capsys.readouterr().out
+
+    (fmu_dir / "Comp.fmu").write_bytes(b"not a zip")
+    assert main([*args, "--fmu-dir", str(fmu_dir), "--no-cache"]) == 1
+    assert "cannot read modelDescription.xml" in capsys.readouterr().out
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from pyssp_sysml2.fmi import generate_model_descriptions
+from pyssp_sysml2.vr_map import ValueReferenceMap
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _value_references(path: Path) -> dict[str, str]:
+    root = ET.parse(path).getroot()
+    return {
+        elem.get("name"): elem.get("valueReference") for elem in root.iter("ScalarVariable")
+    }
+
+
+def test_allocate_keeps_existing_numbers_and_retires_removed_ones(tmp_path: Path) -> None:
+    """New names get fresh numbers, removed names keep theirs out of circulation."""
+    vr_map = ValueReferenceMap(tmp_path / "Comp.vr.json")
+    assert vr_map.allocate(["a", "b", "c"]) == {"a": 0, "b": 1, "c": 2}
+    vr_map.save()
+
+    vr_map = ValueReferenceMap.load(tmp_path / "Comp.vr.json")
+    assert vr_map.allocate(["new", "a", "c"]) == {"new": 3, "a": 0, "c": 2}
+    assert vr_map.retired == {"b": 1}
+    assert vr_map.allocate(["a", "b", "c", "new", "other"]) == {
+        "a": 0,
+        "b": 1,
+        "c": 2,
+        "new": 3,
+        "other": 4,
+    }
+
+
+def test_unreadable_map_is_an_error(tmp_path: Path) -> None:
+    """A broken map is not silently replaced, which would renumber every variable."""
+    path = tmp_path / "Comp.vr.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid value reference map"):
+        ValueReferenceMap.load(path)
+
+
+def test_generate_model_descriptions_keeps_value_references_across_edits(tmp_path: Path) -> None:
+    """Adding a parameter does not renumber the variables that already existed."""
+    def generate(parameters: str) -> dict[str, str]:
+        write_model(
+            tmp_path / "arch" / "model.sysml",
+            f"""
+            package Example {{
+              port def Status {{
+                attribute ok: Boolean;
+              }}
+
+              part def Comp {{
+                {parameters}
+                out port status : Status;
+              }}
+
+              part def {COMPOSITION_NAME} {{
+                part c : Comp;
+              }}
+            }}
+            """,
+        )
+        [path] = generate_model_descriptions(
+            tmp_path / "arch", tmp_path / "out", COMPOSITION_NAME, vr_map_dir=tmp_path / "vr"
+        )
+        return _value_references(path)
+
+    assert generate("attribute gain = 2.0;") == {"gain": "0", "status.ok": "1"}
+    assert generate("attribute bias = 1.0; attribute gain = 2.0;") == {
+        "bias": "2",
+        "gain": "0",
+        "status.ok": "1",
+    }
+    saved = json.loads((tmp_path / "vr" / "Comp.vr.json").read_text(encoding="utf-8"))
+    assert saved["variables"] == {"bias": 2, "gain": 0, "status.ok": 1}
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+
+from pyssp_sysml2.cache import ArchitectureDiskCache, get_disk_cache, set_disk_cache
+from pyssp_sysml2.watch import WatchCycle, watch_architecture
+from tests.test_utils import COMPOSITION_NAME, write_model
+
+
+def _write_architecture(root: Path, gain: str) -> Path:
+    write_model(
+        root / "model.sysml",
+        f"""
+        package Example {{
+          part def Comp {{
+            attribute gain = {gain};
+          }}
+
+          part def {COMPOSITION_NAME} {{
+            part c : Comp;
+          }}
+        }}
+        """,
+    )
+    return root
+
+
+def test_watch_regenerates_after_sysml_change(tmp_path: Path) -> None:
+    """Saving a SysML file triggers one debounced regeneration of the outputs."""
+    architecture_dir = _write_architecture(tmp_path / "arch", "1.0")
+    output_dir = tmp_path / "generated"
+    cycles: "queue.Queue[WatchCycle]" = queue.Queue()
+    stop = threading.Event()
+    watcher = threading.Thread(
+        target=watch_architecture,
+        args=(architecture_dir, output_dir, COMPOSITION_NAME),
+        kwargs={"interval": 0.01, "debounce": 0.05, "on_cycle": cycles.put, "stop": stop},
+    )
+    watcher.start()
+    try:
+        startup = cycles.get(timeout=30)
+        assert startup.error is None
+        assert startup.changed == []
+        assert 'value="1"' in (output_dir / "parameters.ssv").read_text(encoding="utf-8")
+
+        _write_architecture(architecture_dir, "25.0")
+        change = cycles.get(timeout=30)
+    finally:
+        stop.set()
+        watcher.join(timeout=30)
+
+    assert change.error is None
+    assert change.changed == [architecture_dir / "model.sysml"]
+    assert 'value="25"' in (output_dir / "parameters.ssv").read_text(encoding="utf-8")
+
+
+def test_watch_does_not_use_the_disk_cache(tmp_path: Path) -> None:
+    """A configured disk cache is left unused while watching and restored afterwards."""
+    architecture_dir = _write_architecture(tmp_path / "arch", "1.0")
+    disk_cache = ArchitectureDiskCache(tmp_path / "cache")
+    stop = threading.Event()
+    cycles: list[WatchCycle] = []
+
+    def record(cycle: WatchCycle) -> None:
+        cycles.append(cycle)
+        stop.set()
+
+    set_disk_cache(disk_cache)
+    try:
+        watch_architecture(
+            architecture_dir, tmp_path / "generated", COMPOSITION_NAME, on_cycle=record, stop=stop
+        )
+        assert get_disk_cache() is disk_cache
+    finally:
+        set_disk_cache(None)
+
+    assert [cycle.error for cycle in cycles] == [None]
+    assert not (tmp_path / "cache").exists()